@@ -0,0 +1,316 @@
+"""
+
+:module:    bench_data.py
+:class:     BenchData/0
+:author:    GM (genuinemerit @ pm.me)
+
+Benchmarks for the data layer and the boot pipeline.
+
+Run from the project root / top-level directory:
+    `python benchmarks/bench_data.py`                 (1k rows)
+    `python benchmarks/bench_data.py --rows 1000,100000,1000000`
+    `python benchmarks/bench_data.py --boot`          (also time a full boot)
+    `python benchmarks/bench_data.py --save-baseline` (keep results as baseline)
+    `python benchmarks/bench_data.py --threshold 0.25`
+
+Each benchmark runs against a scratch DB, loaded with synthetic TEXTS rows,
+in a temporary directory; the dev DB in db/ is never touched. The boot is
+timed in a temporary copy of the project.
+
+Results are written as JSON to benchmarks/results/<timestamp>.json.
+If benchmarks/baseline.json exists, each result is compared to it, and
+the run exits with status 1 if any benchmark is slower than its baseline
+by more than the threshold (default 25%). Differences under 5 ms are
+treated as noise. Timings are machine-specific, so the baseline and the
+results are not kept in git.
+"""
+
+import json
+import platform
+import shutil
+import sqlite3 as sq3
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from os import path
+from pathlib import Path
+from pprint import pprint as pp  # noqa: F401
+
+sys.path.insert(0, path.join(path.dirname(path.dirname(path.abspath(__file__))),
+                             "src", "Saskantinon"))
+
+import data_model as DM  # noqa: E402
+import data_set  # noqa: E402
+
+from data_base import DataBase  # noqa: E402
+from data_get import GetData  # noqa: E402
+from data_set import SetData  # noqa: E402
+from data_structs import Colors  # noqa: E402
+from method_files import FileMethods  # noqa: E402
+from method_shell import ShellMethods  # noqa: E402
+
+FM = FileMethods()
+SM = ShellMethods()
+BENCH_DIR = path.dirname(path.abspath(__file__))
+PROJECT_DIR = path.dirname(BENCH_DIR)
+
+
+class BenchData(object):
+    """
+    Time DataBase, GetData and SetData calls against synthetic data.
+    """
+
+    def __init__(self, p_repeat: int = 3, p_lookups: int = 1000):
+        """
+        :param p_repeat: Times to run each benchmark; the fastest run counts.
+        :param p_lookups: Number of single-row calls in per-call benchmarks.
+        """
+        self.repeat = max(1, p_repeat)
+        self.lookups = max(1, p_lookups)
+        self.tmp_dir = tempfile.mkdtemp(prefix="saskan_bench_")
+        self.CONTEXT = FM.get_json_file("static/context/context.json")
+        self.CONTEXT.update({
+            "db": self.tmp_dir,
+            "saskan_db": path.join(self.tmp_dir, "BENCH.db"),
+            "saskan_bak": path.join(self.tmp_dir, "BENCH.bak"),
+            "boot_manifest": path.join(self.tmp_dir, "boot_manifest.json"),
+        })
+        self.DB = DataBase(self.CONTEXT)
+        self.results: OrderedDict = OrderedDict()
+
+    # Scratch database
+    # ===========================================
+    def _reset_db(self):
+        """'PRIVATE'
+        Create a new, empty scratch DB with all tables.
+        """
+        self.DB.close_pool()
+        Path(self.DB.SASKAN_DB).unlink(missing_ok=True)
+        self.DB.remove_wal_files()
+        if not self.DB.execute_ddl(self.DB.get_sql_names(self.DB.DDL, "CREATE_"), True):
+            raise RuntimeError("Could not create the scratch DB")
+
+    def _text_rows(self, p_rows: int, p_prefix: str = "bench") -> list:
+        """'PRIVATE'
+        Make synthetic TEXTS rows, in table-column order.
+        """
+        return [(SM.get_uid(), "en", f"{p_prefix}_{ix}", f"Bench text value {ix}", "")
+                for ix in range(p_rows)]
+
+    # Timing
+    # ===========================================
+    def _time(self, p_name: str, p_rows: int, p_ops: int, p_func, p_setup=None):
+        """'PRIVATE'
+        Run one benchmark self.repeat times and keep the fastest run.
+        :param p_name: Benchmark name
+        :param p_rows: Size of the dataset it ran on
+        :param p_ops: Number of operations (rows or calls) per run
+        :param p_func: Callable to time
+        :param p_setup: Optional callable run, untimed, before each run
+        """
+        runs: list = []
+        for _ in range(self.repeat):
+            if p_setup is not None:
+                p_setup()
+            start = time.perf_counter()
+            p_func()
+            runs.append(time.perf_counter() - start)
+        best = min(runs)
+        key = f"{p_name}[{p_rows}]"
+        self.results[key] = {
+            "name": p_name,
+            "rows": p_rows,
+            "ops": p_ops,
+            "secs": round(best, 6),
+            "mean_secs": round(sum(runs) / len(runs), 6),
+            "us_per_op": round(best / max(1, p_ops) * 1e6, 3),
+        }
+        print(f"{key:<40} {best:>10.4f} s  {self.results[key]['us_per_op']:>12.3f} us/op")
+
+    # DataBase benchmarks
+    # ===========================================
+    def bench_data_base(self, p_rows: int):
+        """
+        Time DataBase inserts and selects on a TEXTS table of p_rows rows.
+        """
+        rows = self._text_rows(p_rows)
+        lookups = min(p_rows, self.lookups)
+
+        def insert_rows():
+            for row in rows[:lookups]:
+                self.DB.execute_insert("TEXTS", row)
+
+        self._time("execute_insert", p_rows, lookups, insert_rows, self._reset_db)
+        self._time("execute_insert_many", p_rows, p_rows,
+                   lambda: self.DB.execute_insert_many("TEXTS", rows), self._reset_db)
+        self._time("execute_select_all", p_rows, p_rows,
+                   lambda: self.DB.execute_select_all("TEXTS"))
+        self._time("execute_select_all_numpy", p_rows, p_rows,
+                   lambda: self.DB.execute_select_all("TEXTS", "numpy"))
+        self._time("iter_select", p_rows, p_rows,
+                   lambda: sum(1 for _ in self.DB.iter_select("TEXTS")))
+        uids = [row[0] for row in rows[:lookups]]
+        model = DM.get_model("TEXTS")
+
+        def select_by():
+            for uid in uids:
+                self.DB.execute_select_by(model, uid)
+
+        self._time("execute_select_by", p_rows, lookups, select_by)
+
+        # New versions of every row, under new UIDs. Ends with p_rows live rows.
+        new_versions: list = []
+
+        def reload_rows():
+            self._reset_db()
+            self.DB.execute_insert_many("TEXTS", rows)
+            new_versions[:] = [(SM.get_uid(), *row[1:]) for row in rows]
+
+        self._time("execute_upsert_many", p_rows, p_rows,
+                   lambda: self.DB.execute_upsert_many("TEXTS", new_versions), reload_rows)
+
+    # GetData / SetData benchmarks
+    # ===========================================
+    def bench_get_set_data(self, p_rows: int):
+        """
+        Time GetData lookups and SetData loads against the scratch DB.
+        The DB already holds p_rows live TEXTS rows from bench_data_base.
+        """
+        GD = GetData()
+        GD.DB = self.DB
+        SD = SetData()
+        SD.DB = self.DB
+        data_set.GD.DB = self.DB
+        lookups = min(p_rows, self.lookups)
+        text_ids = [f"bench_{ix}" for ix in range(0, p_rows, max(1, p_rows // lookups))]
+
+        # Match as get_text does, on the columns of the TEXTS index.
+        # Warm lookups stay within the cache size, so every one is a hit.
+        warm_ids = text_ids[:max(1, GD.cache_size)]
+
+        def get_by_match(p_text_ids: list):
+            for text_id in p_text_ids:
+                GD.get_by_match("TEXTS", {"lang_code": "en", "text_id": text_id})
+
+        self._time("get_by_match_cold", p_rows, len(text_ids),
+                   lambda: get_by_match(text_ids), GD.invalidate_cache)
+        get_by_match(warm_ids)
+        self._time("get_by_match_warm", p_rows, len(warm_ids),
+                   lambda: get_by_match(warm_ids))
+        self._time("get_by_keys", p_rows, len(text_ids),
+                   lambda: GD.get_by_keys("TEXTS", ["lang_code", "text_id"],
+                                          [("en", text_id) for text_id in text_ids]))
+        set_rows = [OrderedDict(zip(("lang_code", "text_id", "text_value", "delete_dt"),
+                                    row[1:])) for row in self._text_rows(p_rows, "set")]
+        self._time("set_insert_many", p_rows, p_rows,
+                   lambda: SD._set_insert_many("TEXTS", set_rows))
+
+        def set_app_config():
+            for set_func in (SD.set_texts, SD.set_frames, SD.set_menu_bars,
+                             SD.set_menus, SD.set_menu_items, SD.set_windows,
+                             SD.set_links):
+                set_func()
+
+        self._time("set_app_config", p_rows, 7, set_app_config)
+
+    # Boot benchmark
+    # ===========================================
+    def bench_boot(self):
+        """
+        Time a full boot, run in a temporary copy of the project.
+        """
+        boot_dir = path.join(self.tmp_dir, "project")
+        for sub_dir in ("boot", "db", "src", "static"):
+            shutil.copytree(path.join(PROJECT_DIR, sub_dir), path.join(boot_dir, sub_dir),
+                            ignore=shutil.ignore_patterns("*.db", "*.bak", "*.arcv*",
+                                                          "*-wal", "*-shm"))
+
+        def boot():
+            subprocess.run([sys.executable, "src/Saskantinon/boot.py", "--full"],
+                           cwd=boot_dir, check=True, stdout=subprocess.DEVNULL)
+
+        self._time("boot_saskan", 0, 1, boot)
+
+    # Results
+    # ===========================================
+    def save_results(self, p_rows: list) -> str:
+        """
+        Write the results as JSON.
+        :return: Path of the results file.
+        """
+        results_dir = path.join(BENCH_DIR, "results")
+        Path(results_dir).mkdir(exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        results_path = path.join(results_dir, f"{stamp}.json")
+        FM.write_file(results_path, json.dumps({
+            "meta": {
+                "timestamp": stamp,
+                "python": platform.python_version(),
+                "sqlite": sq3.sqlite_version,
+                "platform": platform.platform(),
+                "rows": p_rows,
+                "repeat": self.repeat,
+                "schema_version": self.DB.schema_version,
+            },
+            "results": self.results,
+        }, indent=2))
+        return results_path
+
+    def compare(self, p_baseline: dict, p_threshold: float) -> list:
+        """
+        Compare results with a baseline.
+        :param p_baseline: Baseline results, as written by save_results
+        :param p_threshold: Allowed slowdown, e.g. 0.25 for 25%
+        :return: List of (benchmark key, baseline secs, new secs) that regressed
+        """
+        regressions: list = []
+        for key, result in self.results.items():
+            base = p_baseline.get("results", {}).get(key)
+            if base is None:
+                continue
+            if (result["secs"] > base["secs"] * (1 + p_threshold)
+                    and result["secs"] - base["secs"] > 0.005):
+                regressions.append((key, base["secs"], result["secs"]))
+        return regressions
+
+    def close(self):
+        """Release the scratch DB and remove the temporary directory."""
+        self.DB.close_pool()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+def _get_arg(p_flag: str, p_default: str) -> str:
+    """Return the value given after a command-line flag, or a default."""
+    if p_flag in sys.argv and sys.argv.index(p_flag) + 1 < len(sys.argv):
+        return sys.argv[sys.argv.index(p_flag) + 1]
+    return p_default
+
+
+if __name__ == "__main__":
+    row_sizes = [int(rows) for rows in _get_arg("--rows", "1000").split(",")]
+    threshold = float(_get_arg("--threshold", "0.25"))
+    BD = BenchData(int(_get_arg("--repeat", "3")))
+    try:
+        for rows in row_sizes:
+            BD.bench_data_base(rows)
+            BD.bench_get_set_data(rows)
+        if "--boot" in sys.argv:
+            BD.bench_boot()
+    finally:
+        BD.close()
+    print(f"{Colors.CL_DARKCYAN}Results saved to {BD.save_results(row_sizes)}{Colors.CL_END}")
+    baseline_path = path.join(BENCH_DIR, "baseline.json")
+    if "--save-baseline" in sys.argv:
+        FM.write_file(baseline_path, json.dumps(
+            {"results": BD.results}, indent=2))
+        print(f"{Colors.CL_DARKCYAN}Baseline saved to {baseline_path}{Colors.CL_END}")
+    elif Path(baseline_path).exists():
+        regressions = BD.compare(FM.get_json_file(baseline_path), threshold)
+        for key, base_secs, new_secs in regressions:
+            print(f"{Colors.CL_RED}REGRESSION{Colors.CL_END}: {key} " +
+                  f"{base_secs:.4f} s -> {new_secs:.4f} s")
+        if regressions:
+            sys.exit(1)
+        print(f"{Colors.CL_DARKCYAN}No regressions beyond {threshold:.0%}{Colors.CL_END}")
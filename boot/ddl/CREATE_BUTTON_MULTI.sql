@@ -1,19 +0,0 @@
-CREATE TABLE IF NOT EXISTS BUTTON_MULTI (
-button_multi_uid_pk TEXT DEFAULT '',
-frame_uid_fk TEXT DEFAULT '',
-window_uid_fk TEXT DEFAULT '',
-button_type TEXT DEFAULT '',
-button_id TEXT DEFAULT '',
-lang_code TEXT DEFAULT '',
-button_name TEXT DEFAULT '',
-button_icon BLOB DEFAULT 'b''',
-button_icon_path TEXT DEFAULT '',
-left_x NUMERIC DEFAULT 0.0,
-top_y NUMERIC DEFAULT 0.0,
-enabled_by_default BOOLEAN DEFAULT 1,
-help_text TEXT DEFAULT '',
-delete_dt TEXT DEFAULT '',
-CHECK (button_type IN ('toggle', 'check', 'radio', 'event')),
-CHECK (lang_code IN ('en')),
-FOREIGN KEY (frame_uid_fk) REFERENCES FRAMES(frame_uid_pk) ON DELETE CASCADE,
-FOREIGN KEY (window_uid_fk) REFERENCES WINDOWS(window_uid_pk) ON DELETE CASCADE,PRIMARY KEY (button_multi_uid_pk));
@@ -1,2 +0,0 @@
-DELETE FROM `BACKUP`
-WHERE `bkup_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `BUTTON_ITEM`
-WHERE `button_item_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `BUTTON_MULTI`
-WHERE `button_multi_uid_pk`=?;
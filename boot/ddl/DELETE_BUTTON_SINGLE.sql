@@ -1,2 +0,0 @@
-DELETE FROM `BUTTON_SINGLE`
-WHERE `button_single_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `CHAR_MEMBER`
-WHERE `char_member_uid_pk`=?;
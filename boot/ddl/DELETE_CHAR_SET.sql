@@ -1,2 +0,0 @@
-DELETE FROM `CHAR_SET`
-WHERE `char_set_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `CROSS_X`
-WHERE `cross_x_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `DAY_TIME`
-WHERE `day_time_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `EXTERNAL_UNIVERSE`
-WHERE `external_univ_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `FRAMES`
-WHERE `frame_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GALACTIC_CLUSTER`
-WHERE `galactic_cluster_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GALAXY`
-WHERE `galaxy_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GLOSSARY`
-WHERE `glossary_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GLOSS_COMMON`
-WHERE `gloss_common_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GRID`
-WHERE `grid_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GRID_CELL`
-WHERE `grid_cell_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `GRID_INFO`
-WHERE `grid_info_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `LAKE`
-WHERE `lake_uid_pk`=?;
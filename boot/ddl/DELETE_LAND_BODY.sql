@@ -1,2 +0,0 @@
-DELETE FROM `LAND_BODY`
-WHERE `land_body_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `LANGUAGE`
-WHERE `lang_uid_pk`=?;
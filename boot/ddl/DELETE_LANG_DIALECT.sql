@@ -1,2 +0,0 @@
-DELETE FROM `LANG_DIALECT`
-WHERE `dialect_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `LANG_FAMILY`
-WHERE `lang_family_uid_pk`=?;
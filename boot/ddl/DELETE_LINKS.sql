@@ -1,2 +0,0 @@
-DELETE FROM `LINKS`
-WHERE `link_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `LUNAR_CALENDAR`
-WHERE `lunar_calendar_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `LUNAR_YEAR`
-WHERE `lunar_year_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `MAP_BOX`
-WHERE `map_box_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `MAP_RECT`
-WHERE `map_rect_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `MAP_SPHERE`
-WHERE `map_sphere_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `MENUS`
-WHERE `menu_uid_pk`=?;
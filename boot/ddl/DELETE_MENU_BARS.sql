@@ -1,2 +0,0 @@
-DELETE FROM `MENU_BARS`
-WHERE `menu_bar_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `MENU_ITEMS`
-WHERE `item_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `METADATA`
-WHERE `meta_uid_pk`=?;
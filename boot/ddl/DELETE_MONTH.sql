@@ -1,2 +0,0 @@
-DELETE FROM `MONTH`
-WHERE `month_uid_pk`=?;
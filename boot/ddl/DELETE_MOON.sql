@@ -1,2 +0,0 @@
-DELETE FROM `MOON`
-WHERE `moon_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `OCEAN_BODY`
-WHERE `ocean_body_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `RIVER`
-WHERE `river_uid_pk`=?;
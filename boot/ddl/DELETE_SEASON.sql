@@ -1,2 +0,0 @@
-DELETE FROM `SEASON`
-WHERE `season_uid_pk`=?;
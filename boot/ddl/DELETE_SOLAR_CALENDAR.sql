@@ -1,2 +0,0 @@
-DELETE FROM `SOLAR_CALENDAR`
-WHERE `solar_calendar_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `SOLAR_YEAR`
-WHERE `solar_year_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `STAR_SYSTEM`
-WHERE `star_system_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `TEXTS`
-WHERE `text_uid_pk`=?;
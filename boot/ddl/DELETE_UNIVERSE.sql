@@ -1,2 +0,0 @@
-DELETE FROM `UNIVERSE`
-WHERE `univ_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `WEEK_TIME`
-WHERE `week_time_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `WINDOWS`
-WHERE `win_uid_pk`=?;
@@ -1,2 +0,0 @@
-DELETE FROM `WORLD`
-WHERE `world_uid_pk`=?;
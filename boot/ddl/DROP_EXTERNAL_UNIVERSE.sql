@@ -1 +0,0 @@
-DROP TABLE IF EXISTS `EXTERNAL_UNIVERSE`;
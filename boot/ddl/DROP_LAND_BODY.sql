@@ -1 +0,0 @@
-DROP TABLE IF EXISTS `LAND_BODY`;
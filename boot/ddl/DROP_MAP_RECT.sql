@@ -1 +0,0 @@
-DROP TABLE IF EXISTS `MAP_RECT`;
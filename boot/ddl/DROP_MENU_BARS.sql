@@ -1 +0,0 @@
-DROP TABLE IF EXISTS `MENU_BARS`;
@@ -1,8 +0,0 @@
-INSERT INTO `BACKUP` (
-`bkup_uid_pk`,
-`bkup_id`,
-`bkup_dttm`,
-`bkup_type`,
-`file_from`,
-`file_to`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
@@ -1,6 +0,0 @@
-INSERT INTO `CHAR_SET` (
-`char_set_uid_pk`,
-`font_name`,
-`char_set_type`,
-`char_set_desc`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?);
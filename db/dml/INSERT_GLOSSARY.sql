@@ -1,9 +0,0 @@
-INSERT INTO `GLOSSARY` (
-`glossary_uid_pk`,
-`gloss_common_uid_fk`,
-`dialect_uid_fk`,
-`gloss_type`,
-`gloss_name`,
-`gloss_value`,
-`gloss_uri`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
@@ -1,8 +0,0 @@
-INSERT INTO `GLOSS_COMMON` (
-`gloss_common_uid_pk`,
-`dialect_uid_fk`,
-`gloss_type`,
-`gloss_name`,
-`gloss_value`,
-`gloss_uri`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
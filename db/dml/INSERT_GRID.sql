@@ -1,8 +0,0 @@
-INSERT INTO `GRID` (
-`grid_uid_pk`,
-`grid_id`,
-`x_col_cnt`,
-`y_row_cnt`,
-`z_up_cnt`,
-`z_down_cnt`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
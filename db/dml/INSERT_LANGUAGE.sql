@@ -1,10 +0,0 @@
-INSERT INTO `LANGUAGE` (
-`lang_uid_pk`,
-`lang_family_uid_fk`,
-`lang_name`,
-`lang_desc`,
-`gramatics`,
-`lexicals`,
-`social_influences`,
-`word_formations`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
@@ -1,9 +0,0 @@
-INSERT INTO `LANG_DIALECT` (
-`dialect_uid_pk`,
-`lang_uid_fk`,
-`dialect_name`,
-`dialect_desc`,
-`divergence_factors`,
-`syncretic_factors`,
-`preservation_factors`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
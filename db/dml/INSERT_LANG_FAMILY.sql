@@ -1,8 +0,0 @@
-INSERT INTO `LANG_FAMILY` (
-`lang_family_uid_pk`,
-`char_set_uid_fk`,
-`lang_family_name`,
-`lang_family_desc`,
-`phonetics`,
-`cultural_influences`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
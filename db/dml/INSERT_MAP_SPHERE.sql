@@ -1,14 +0,0 @@
-INSERT INTO `MAP_SPHERE` (
-`map_sphere_uid_pk`,
-`map_shape`,
-`map_type`,
-`map_id`,
-`lang_code`,
-`map_name`,
-`map_desc`,
-`origin_lat`,
-`origin_lon`,
-`z_value`,
-`unit_of_measure`,
-`sphere_radius`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
@@ -1,8 +0,0 @@
-INSERT INTO `MENUS` (
-`menu_uid_pk`,
-`menu_bar_uid_fk`,
-`frame_id`,
-`lang_code`,
-`menu_id`,
-`menu_name`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
@@ -1,9 +0,0 @@
-INSERT INTO `MENU_BARS` (
-`menu_bar_uid_pk`,
-`frame_uid_fk`,
-`frame_id`,
-`mbar_margin`,
-`mbar_h`,
-`mbar_x`,
-`mbar_y`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
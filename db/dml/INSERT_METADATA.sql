@@ -1,8 +0,0 @@
-INSERT INTO `METADATA` (
-`meta_uid_pk`,
-`name_space`,
-`model_name`,
-`tbl_name`,
-`col_name`,
-`col_def`,
-`delete_ts`) VALUES (?, ?, ?, ?, ?, ?, ?);
@@ -1,8 +0,0 @@
-INSERT INTO `SEASON` (
-`season_uid_pk`,
-`solar_year_uid_fk`,
-`gloss_common_uid_vfk`,
-`season_type`,
-`hemisphere_type`,
-`years_in_season`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?);
@@ -1,6 +0,0 @@
-INSERT INTO `TEXTS` (
-`text_uid_pk`,
-`lang_code`,
-`text_id`,
-`text_value`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?);
@@ -1,9 +0,0 @@
-INSERT INTO `WINDOWS` (
-`win_uid_pk`,
-`frame_uid_fk`,
-`frame_id`,
-`lang_code`,
-`win_id`,
-`win_name`,
-`win_margin`,
-`delete_dt`) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
@@ -1,8 +0,0 @@
-SELECT `cross_x_uid_pk`,
-`uid_1_table`,
-`uid_1_vfk`,
-`uid_2_table`,
-`uid_2_vfk`,
-`touch_type`,
-`delete_dt`
-FROM `CROSS_X`;
@@ -1,14 +0,0 @@
-SELECT `link_uid_pk`,
-`lang_code`,
-`link_id`,
-`frame_id`,
-`link_protocol`,
-`mime_type`,
-`link_name`,
-`link_uri`,
-`link_icon`,
-`link_icon_path`,
-`delete_dt`
-FROM `LINKS`
-WHERE delete_dt IS NULL OR delete_dt = ''
-ORDER BY `frame_id` ASC, `link_id` ASC, `lang_code` ASC;
@@ -1,4 +0,0 @@
-SELECT `dialect_uid_pk`, `lang_uid_fk`, `dialect_name`, `dialect_desc`, `divergence_factors`, `syncretic_factors`, `preservation_factors`, `delete_dt`
-FROM `LANG_DIALECT`
-WHERE `dialect_uid_pk` = ?
-ORDER BY `dialect_name ASC`;
@@ -1,6 +0,0 @@
-UPDATE `CHAR_SET` SET
-`font_name`=?,
-`char_set_type`=?,
-`char_set_desc`=?,
-`delete_dt`=?
-WHERE `char_set_uid_pk`=?;
@@ -1,8 +0,0 @@
-UPDATE `CROSS_X` SET
-`uid_1_table`=?,
-`uid_1_vfk`=?,
-`uid_2_table`=?,
-`uid_2_vfk`=?,
-`touch_type`=?,
-`delete_dt`=?
-WHERE `cross_x_uid_pk`=?;
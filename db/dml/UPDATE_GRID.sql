@@ -1,8 +0,0 @@
-UPDATE `GRID` SET
-`grid_id`=?,
-`x_col_cnt`=?,
-`y_row_cnt`=?,
-`z_up_cnt`=?,
-`z_down_cnt`=?,
-`delete_dt`=?
-WHERE `grid_uid_pk`=?;
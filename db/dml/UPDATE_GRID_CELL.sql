@@ -1,11 +0,0 @@
-UPDATE `GRID_CELL` SET
-`grid_uid_fk`=?,
-`grid_id`=?,
-`lang_code`=?,
-`grid_cell_name`=?,
-`x_col_ix`=?,
-`y_row_ix`=?,
-`z_up_down_ix`=?,
-`grid_cell_id`=?,
-`delete_dt`=?
-WHERE `grid_cell_uid_pk`=?;
@@ -1,10 +0,0 @@
-UPDATE `LANGUAGE` SET
-`lang_family_uid_fk`=?,
-`lang_name`=?,
-`lang_desc`=?,
-`gramatics`=?,
-`lexicals`=?,
-`social_influences`=?,
-`word_formations`=?,
-`delete_dt`=?
-WHERE `lang_uid_pk`=?;
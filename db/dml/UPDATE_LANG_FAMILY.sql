@@ -1,8 +0,0 @@
-UPDATE `LANG_FAMILY` SET
-`char_set_uid_fk`=?,
-`lang_family_name`=?,
-`lang_family_desc`=?,
-`phonetics`=?,
-`cultural_influences`=?,
-`delete_dt`=?
-WHERE `lang_family_uid_pk`=?;
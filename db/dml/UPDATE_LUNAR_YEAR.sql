@@ -1,8 +0,0 @@
-UPDATE `LUNAR_YEAR` SET
-`world_uid_fk`=?,
-`lang_uid_vfk`=?,
-`lunar_year_name`=?,
-`lunar_year_desc`=?,
-`days_in_lunar_year`=?,
-`delete_dt`=?
-WHERE `lunar_year_uid_pk`=?;
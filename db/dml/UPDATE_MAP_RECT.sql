@@ -1,13 +0,0 @@
-UPDATE `MAP_RECT` SET
-`map_shape`=?,
-`map_type`=?,
-`map_id`=?,
-`lang_code`=?,
-`map_name`=?,
-`map_desc`=?,
-`north_lat`=?,
-`south_lat`=?,
-`east_lon`=?,
-`west_lon`=?,
-`delete_dt`=?
-WHERE `map_rect_uid_pk`=?;
@@ -1,8 +0,0 @@
-UPDATE `MENUS` SET
-`menu_bar_uid_fk`=?,
-`frame_id`=?,
-`lang_code`=?,
-`menu_id`=?,
-`menu_name`=?,
-`delete_dt`=?
-WHERE `menu_uid_pk`=?;
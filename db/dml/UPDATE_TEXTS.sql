@@ -1,6 +0,0 @@
-UPDATE `TEXTS` SET
-`lang_code`=?,
-`text_id`=?,
-`text_value`=?,
-`delete_dt`=?
-WHERE `text_uid_pk`=?;
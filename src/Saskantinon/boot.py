@@ -20,6 +20,20 @@ execute the following command from the project root / top-level directory:
     `python src/Saskantinon/boot.py` (to use default userdata path) OR
     `python src/Saskantinon/boot.py <userdata file path>`
 
+Boot is incremental. A manifest of content hashes of the context, each
+boot/config/*.json file, each data model and each table loader is kept in
+db/boot_manifest.json. Only tables whose inputs changed, and the tables
+that depend on them, are rebuilt. Add `--full` to rebuild everything.
+
+For a fresh install, `--from-snapshot` loads a prebuilt DB image
+(boot/saskan_snapshot.db) instead, if its schema version matches the
+schema bundle; otherwise it falls back to a full boot.
+`--make-snapshot` boots as usual, then saves a new snapshot.
+
+`--migrate` upgrades an existing DB in place instead: the schema bundle
+is regenerated and only the changed tables are altered (see
+data_migrate.py). No data is reloaded.
+
 @DEV:
 - When I get back to the service architecture...
     - Prototype/test using haproxy to load balance servers.
@@ -28,12 +42,20 @@ execute the following command from the project root / top-level directory:
     - Start with a single port; add more only as needed.
     - Cleanly separate server and client code.
 """
+import hashlib
+import inspect
 import json
+import os
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
 from pprint import pprint as pp  # noqa: F401
 import data_model as DM
 
 from data_base import DataBase
+from data_migrate import MigrateDB
 from data_set import SetData
 from data_get import GetData
 
@@ -56,8 +78,21 @@ class BootSaskan():
     """Configure and boot Saskantinon and Saskantinize.
     Generate SQL files.
     Create and populate database.
+
+    Tables are populated by a boot DAG: one stage per table, ordered by
+    the FK constraints on the data models plus the lookups listed in
+    BOOT_AFTER. Stages whose parents are done run concurrently on a
+    thread pool. Their write transactions take turns on the DB's write
+    lock, so only the row building and reads overlap.
     """
 
+    # Stage dependencies that are not declared as FKs, e.g. rows looked up
+    # by natural key, or the virtual FKs of the association tables.
+    BOOT_AFTER: dict = {
+        "LINKS": ["FRAMES"],
+        "CROSS_X": ["MAP_RECT", "MAP_BOX", "MAP_SPHERE", "GRID"],
+    }
+
     def __init__(self):
         """
         Initialize database and load necessary data.
@@ -70,8 +105,9 @@ class BootSaskan():
 
     def _get_userdata_path(self):
         """Get the user data path from arguments or use default."""
-        if len(sys.argv) > 1:
-            return sys.argv[1]
+        args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+        if args:
+            return args[0]
         return f"{SM.get_os_home()}/Documents/hofin_user_files"
 
     def _initialize_file_paths(self):
@@ -89,16 +125,46 @@ class BootSaskan():
         :returns: dict of context data
         """
         context: dict = {
+            "boot_manifest": "db/boot_manifest.json",
             "cfg": {},
             "db": "db",
+            "db_archive_compress": "gzip",
+            "db_archive_keep": 10,
+            "db_backup_pages": 256,
+            "db_cache_size": 256,
+            "db_chunk_size": 500,
+            "db_fetch_size": 1000,
+            "db_pool_size": 5,
+            "db_pragmas": {
+                "busy_timeout": 5000,
+                "journal_mode": "WAL",
+                "synchronous": "NORMAL",
+                "cache_size": -8000,
+                "mmap_size": 67108864,
+                "temp_store": "MEMORY",
+            },
+            "db_queue_size": 64,
             "ddl": "boot/ddl",
             "dml": "db/dml",
             "fonts": "static/fonts",
             "git": "github.com/genuinemerit/saskan-app/",
             "images": "static/images",
             "lang": "en",
+            "log_batch_size": 200,
+            "log_db_dir": "db/logs",
+            "log_flush_secs": 1.0,
+            "log_fts": True,
+            "log_keep_days": 14,
+            "log_keep_mb": 512,
+            "log_overflow": "drop_oldest",
+            "log_partition_mb": 64,
+            "log_queue_size": 10000,
             "saskan_db": "db/SASKAN.db",
             "saskan_bak": "db/SASKAN.bak",
+            "saskan_snapshot": "boot/saskan_snapshot.db",
+            "sql_bundle": "boot/saskan_sql.json",
+            "sql_files": False,
+            "sql_reload": False,
             "web": "static/web",
             "wiki": "github.com/genuinemerit/saskan-wiki/",
         }
@@ -110,28 +176,346 @@ class BootSaskan():
 
     # Boot methods, called from __main__
 
-    def boot_saskan(self):
+    def boot_saskan(self, p_full: bool = False):
         """Run all boot steps:
         - Create SQL files and initialize the SQLite3 database and tables.
-          Writes to: /boot/ddl/*.sql, /db/dml/*.sql, /db/SASKAN.db, and /db/SASKAN.bak
-        - Populate the database with base app and story data.
+          Writes to: /boot/saskan_sql.json, /db/SASKAN.db, and /db/SASKAN.bak
+          (plus /boot/ddl/*.sql and /db/dml/*.sql if sql_files is on)
+        - Populate the database with base app and story data, via the boot DAG.
+        - Report how long each step took.
+        Only changed tables are rebuilt, unless p_full is set or
+        changed_tables finds that a full boot is needed.
+        :param p_full: If True, always run a full boot. Set by the --full flag.
         """
-        if DM.create_sql(self.DB):
-            if DM.create_db(self.DB):
-                self.boot_app_data()
-                self.boot_story_data()
+        timings: dict = OrderedDict()
+        boot_start = start = time.perf_counter()
+        manifest = self.boot_manifest()
+        rebuild = None if p_full else self.changed_tables(manifest)
+        timings["manifest"] = time.perf_counter() - start
+        if rebuild is not None:
+            if rebuild:
+                timings.update(self.boot_incremental(rebuild))
+                FM.write_file(self.CONTEXT["boot_manifest"], json.dumps(manifest))
+            else:
+                print(f"{Colors.CL_DARKCYAN}Boot inputs unchanged; nothing to do{Colors.CL_END}")
+            self.report_timings(timings, time.perf_counter() - boot_start)
+            return
+        start = time.perf_counter()
+        sql_ok = DM.create_sql(self.DB)
+        timings["create_sql"] = time.perf_counter() - start
+        if sql_ok:
+            # A boot that fails partway must not leave a manifest that
+            # makes the next boot skip the half-loaded tables
+            Path(self.CONTEXT["boot_manifest"]).unlink(missing_ok=True)
+            start = time.perf_counter()
+            db_ok = DM.create_db(self.DB)
+            timings["create_db"] = time.perf_counter() - start
+            if db_ok:
+                timings.update(self.run_boot_dag())
+                FM.write_file(self.CONTEXT["boot_manifest"], json.dumps(manifest))
             else:
                 print(f"{Colors.CL_RED}Database creation failed{Colors.CL_END}")
+        self.report_timings(timings, time.perf_counter() - boot_start)
 
-    def boot_app_data(self):
+    # Snapshots
+    # ===========================================
+    def boot_from_snapshot(self) -> bool:
         """
-        Populate database tables for GUI, API's, etc.
+        Load the DB from the prebuilt snapshot, after a schema-version check.
+        The boot manifest is removed, so the next normal boot is a full one.
+        Falls back to boot_saskan() if the snapshot cannot be used.
+        :returns: True if the snapshot was loaded
+        """
+        start = time.perf_counter()
+        if self.DB.load_snapshot():
+            Path(self.CONTEXT["boot_manifest"]).unlink(missing_ok=True)
+            print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}Database loaded from snapshot " +
+                  f"in {time.perf_counter() - start:.3f} seconds{Colors.CL_END}")
+            return True
+        print(f"{Colors.CL_YELLOW}Snapshot not used; running full boot{Colors.CL_END}")
+        self.boot_saskan(p_full=True)
+        return False
+
+    def make_snapshot(self) -> bool:
+        """
+        Run a full boot, then save the DB as the prebuilt snapshot.
+        :raises BootError: If the DB is not stamped with the current
+            schema version after the boot, or the snapshot cannot be saved.
+        :returns: True if the snapshot was saved
+        """
+        self.boot_saskan(p_full=True)
+        if self.DB.get_user_version() != self.DB.schema_user_version:
+            raise BootError(f"{Colors.CL_RED}DB schema version does not match the " +
+                            f"SQL bundle; snapshot not saved{Colors.CL_END}")
+        if not self.DB.save_snapshot():
+            raise BootError(f"{Colors.CL_RED}Error saving snapshot{Colors.CL_END}")
+        print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}Snapshot saved to " +
+              f"{self.DB.SASKAN_SNAPSHOT}{Colors.CL_END}")
+        return True
+
+    def migrate_db(self) -> list:
+        """
+        Regenerate the schema bundle, then migrate the DB to it in place.
+        :returns: List of migration steps applied
+        """
+        start = time.perf_counter()
+        if not DM.create_sql(self.DB):
+            raise BootError(f"{Colors.CL_RED}Error generating SQL{Colors.CL_END}")
+        steps = MigrateDB(self.DB).migrate()
+        print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}{len(steps)} migration step(s) " +
+              f"in {time.perf_counter() - start:.3f} seconds{Colors.CL_END}")
+        return steps
+
+    # Incremental boot
+    # ===========================================
+    def _hash(self, p_obj) -> str:
+        """'PRIVATE'
+        Return a stable sha256 hex digest of bytes or of a JSON-able object.
+        """
+        data = p_obj if isinstance(p_obj, bytes) else \
+            json.dumps(p_obj, sort_keys=True, default=repr).encode()
+        return hashlib.sha256(data).hexdigest()
+
+    def boot_manifest(self) -> dict:
+        """
+        Hash every input of the boot, per table:
+        - model: the model's fields, their defaults, Constraints and docstring
+        - config: the boot/config/*.json file for the table, if any
+        - loader: source code of the boot stage that populates the table
+        The context file is hashed once, for all tables.
+        :returns: dict of the manifest, ready to be written as JSON
+        """
+        stages = self.boot_stages()
+        tables: dict = {}
+        for models in DM.get_data_models().values():
+            for model in models:
+                tbl_nm = model._tablename
+                constraints = {k: v for k, v in vars(model.Constraints).items()
+                               if not k.startswith("_")}
+                inputs = {"model": self._hash({
+                    "fields": DM.cols_to_dict(model)[tbl_nm],
+                    "constraints": constraints,
+                    "doc": model.__doc__})}
+                cfg_path = self.CONTEXT["cfg"].get(tbl_nm.lower(), "")
+                if cfg_path and FM.is_file_or_dir(cfg_path):
+                    with open(cfg_path, "rb") as cfg_file:
+                        inputs["config"] = self._hash(cfg_file.read())
+                if tbl_nm in stages:
+                    try:
+                        inputs["loader"] = self._hash(inspect.getsource(stages[tbl_nm]))
+                    except (OSError, TypeError):
+                        inputs["loader"] = ""
+                tables[tbl_nm] = inputs
+        return {"context": self._hash(self.CONTEXT), "tables": tables}
+
+    def changed_tables(self, p_manifest: dict):
+        """
+        Compare a new manifest with the one saved by the last boot.
+        :param p_manifest: Manifest from boot_manifest()
+        :returns: None if a full boot is needed (no saved manifest, no DB,
+            a DB not stamped with the bundle's schema version, or the
+            context changed); else the set of tables to rebuild, including
+            their dependants, possibly empty.
+        """
+        old_path = self.CONTEXT["boot_manifest"]
+        if (not FM.is_file_or_dir(old_path)
+                or not FM.is_file_or_dir(self.DB.SASKAN_DB)
+                or not FM.is_file_or_dir(self.DB.SQL_BUNDLE)
+                or self.DB.get_user_version() != self.DB.schema_user_version):
+            return None
+        try:
+            old = FM.get_json_file(old_path)
+        except (OSError, ValueError):
+            return None
+        if old.get("context") != p_manifest["context"]:
+            return None
+        old_tables = old.get("tables", {})
+        changed = {tbl_nm for tbl_nm, inputs in p_manifest["tables"].items()
+                   if old_tables.get(tbl_nm) != inputs}
+        if any(old_tables.get(tbl_nm, {}).get("model") != inputs["model"]
+               for tbl_nm, inputs in p_manifest["tables"].items()):
+            # Model field definitions are loaded into METADATA
+            changed.add("METADATA")
+        if set(old_tables) - set(p_manifest["tables"]):
+            return None
+        return self.with_dependants(changed)
+
+    def with_dependants(self, p_tables: set) -> set:
+        """
+        Add every table that depends on the given ones, directly or not,
+        through an FK or a BOOT_AFTER entry.
+        :param p_tables: Set of table names
+        :returns: Set of table names including all dependants
+        """
+        children: dict = {}
+        for models in DM.get_data_models().values():
+            for model in models:
+                for fk_tbl, _ in getattr(model.Constraints, "FK", {}).values():
+                    children.setdefault(fk_tbl, set()).add(model._tablename)
+        for tbl_nm, parents in self.BOOT_AFTER.items():
+            for parent in parents:
+                children.setdefault(parent, set()).add(tbl_nm)
+        result = set(p_tables)
+        todo = list(p_tables)
+        while todo:
+            for child in children.get(todo.pop(), ()):
+                if child not in result:
+                    result.add(child)
+                    todo.append(child)
+        return result
+
+    def boot_incremental(self, p_tables: set) -> OrderedDict:
+        """
+        Rebuild and reload only the given tables.
+        If any model changed, METADATA is in p_tables; the SQL bundle is
+        then regenerated, since INSERT_METADATA holds all models' definitions.
+        Once the tables are reloaded the DB is stamped with the bundle's
+        schema version.
+        :param p_tables: Set of table names to rebuild
+        :raises BootError: If the SQL, the DDL or a boot stage fails.
+        :returns: OrderedDict of step name: seconds
+        """
+        timings: OrderedDict = OrderedDict()
+        print(f"{Colors.CL_DARKCYAN}Rebuilding: {sorted(p_tables)}{Colors.CL_END}")
+        if "METADATA" in p_tables:
+            start = time.perf_counter()
+            if not DM.create_sql(self.DB):
+                raise BootError(f"{Colors.CL_RED}Error generating SQL{Colors.CL_END}")
+            timings["create_sql"] = time.perf_counter() - start
+        start = time.perf_counter()
+        ddl = [f"{prefix}_{tbl_nm}" for tbl_nm in sorted(p_tables - {"METADATA"})
+               for prefix in ("DROP", "CREATE")]
+        if ddl and not self.DB.execute_ddl(ddl, False):
+            raise BootError(f"{Colors.CL_RED}Error re-creating tables{Colors.CL_END}")
+        timings["recreate_tables"] = time.perf_counter() - start
+        stages = [stage for stage in self.boot_stages() if stage in p_tables]
+        timings.update(self.run_boot_dag(p_stages=stages))
+        self.DB.set_user_version()
+        return timings
+
+    # Boot DAG
+    # ===========================================
+    def boot_stages(self) -> OrderedDict:
+        """
+        Map each boot stage, named for the table it populates, to the
+        method that populates it. Order is only used to break ties.
+        :returns: OrderedDict of stage name: callable returning True on success
+        """
+        return OrderedDict([
+            ("METADATA", self.boot_metadata),
+            ("TEXTS", SD.set_texts),
+            ("FRAMES", SD.set_frames),
+            ("MENU_BARS", SD.set_menu_bars),
+            ("MENUS", SD.set_menus),
+            ("MENU_ITEMS", SD.set_menu_items),
+            ("WINDOWS", SD.set_windows),
+            ("LINKS", SD.set_links),
+            ("MAP_RECT", SD.set_rect_maps),
+            ("MAP_BOX", SD.set_box_maps),
+            ("MAP_SPHERE", SD.set_sphere_maps),
+            ("GRID", SD.set_grids),
+            ("GRID_CELL", SD.set_grid_cells),
+            ("GRID_INFO", SD.set_grid_infos),
+            ("CROSS_X", self.populate_cross_x),
+            ("CHAR_SET", SD.set_char_sets),
+        ])
+
+    def boot_dag(self, p_stages: list) -> OrderedDict:
+        """
+        Work out which stages each stage must wait for.
+        A stage waits for the stages that populate the tables its model
+        has FKs to, plus any listed in BOOT_AFTER.
+        :param p_stages: List of stage (table) names
+        :returns: OrderedDict of stage name: set of parent stage names
+        """
+        dag: OrderedDict = OrderedDict()
+        for stage in p_stages:
+            model = DM.get_model(stage)
+            fks = getattr(getattr(model, "Constraints", None), "FK", {})
+            parents = {fk_tbl for fk_tbl, _ in fks.values()}
+            parents.update(self.BOOT_AFTER.get(stage, []))
+            dag[stage] = {p for p in parents if p in p_stages and p != stage}
+        return dag
+
+    def run_boot_dag(self, p_max_workers: int = 0, p_stages: list = None) -> OrderedDict:
+        """
+        Run the boot stages, each as soon as all of its parents are done.
+        :param p_max_workers: Max stages run at once. Defaults to CPU count, max 8.
+        :param p_stages: Names of the stages to run. Defaults to all of them.
+            Parents not in the list are taken as already done.
+        :raises BootError: If a stage fails or the DAG has a cycle.
+        :returns: OrderedDict of stage name: seconds, in completion order
+        """
+        stages = self.boot_stages()
+        dag = self.boot_dag(list(stages) if p_stages is None else p_stages)
+        max_workers = p_max_workers or min(8, os.cpu_count() or 1)
+        timings: OrderedDict = OrderedDict()
+        done: set = set()
+        running: dict = {}
+
+        def run_stage(p_stage: str) -> float:
+            start = time.perf_counter()
+            if not stages[p_stage]():
+                raise BootError(f"{Colors.CL_RED}Error populating {p_stage}{Colors.CL_END}")
+            print(f"{Colors.CL_DARKCYAN}{p_stage} populated{Colors.CL_END}")
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="boot") as pool:
+            while len(done) < len(dag):
+                for stage, parents in dag.items():
+                    if stage not in done and stage not in running.values() \
+                            and parents <= done:
+                        running[pool.submit(run_stage, stage)] = stage
+                if not running:
+                    raise BootError(f"{Colors.CL_RED}Boot DAG has a cycle among: " +
+                                    f"{sorted(set(dag) - done)}{Colors.CL_END}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        timings[stage] = future.result()
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    done.add(stage)
+        print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}App and story data populated\n{Colors.CL_END}")
+        return timings
+
+    def report_timings(self, p_timings: dict, p_wall_secs: float = 0.0):
+        """
+        Print seconds spent in each boot step, slowest first.
+        Total of steps above wall clock time shows how much ran in parallel.
+        :param p_timings: Dict of step name: seconds
+        :param p_wall_secs: Elapsed time of the whole boot
+        """
+        print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}Boot timings (seconds){Colors.CL_END}")
+        for step, secs in sorted(p_timings.items(), key=lambda t: t[1], reverse=True):
+            print(f"{Colors.CL_DARKCYAN}  {step:<16}{secs:8.3f}{Colors.CL_END}")
+        print(f"{Colors.CL_DARKCYAN}  {'total of steps':<16}" +
+              f"{sum(p_timings.values()):8.3f}{Colors.CL_END}")
+        if p_wall_secs:
+            print(f"{Colors.CL_DARKCYAN}  {'wall clock':<16}{p_wall_secs:8.3f}{Colors.CL_END}")
+
+    # Sequential boot methods
+    # ===========================================
+    def boot_metadata(self) -> bool:
+        """
+        Drop, re-create and populate the METADATA table.
         :write:  /db/SASKAN.db
         """
         if not self.DB.execute_ddl(["DROP_METADATA", "CREATE_METADATA", "INSERT_METADATA"], False):
             raise BootError(f"{Colors.CL_RED}Error populating METADATA{Colors.CL_END}")
-        else:
-            print(f"{Colors.CL_DARKCYAN}METADATA populated{Colors.CL_END}")
+        return True
+
+    def boot_app_data(self):
+        """
+        Populate database tables for GUI, API's, etc.
+        :write:  /db/SASKAN.db
+        """
+        self.boot_metadata()
+        print(f"{Colors.CL_DARKCYAN}METADATA populated{Colors.CL_END}")
         components = [
             ("TEXTS", SD.set_texts),
             ("FRAMES", SD.set_frames),
@@ -162,6 +546,7 @@ class BootSaskan():
         """
         self.populate_story_tables()
         self.populate_cross_x()
+        print(f"{Colors.CL_DARKCYAN}CROSS_X populated{Colors.CL_END}")
         self.populate_fonts_glossaries()
         print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}Story data populated\n{Colors.CL_END}")
 
@@ -190,6 +575,7 @@ class BootSaskan():
         or grid_id (may rename that an ID, which would be more appropirate), that is, a
         natural key which should be unique in combination with a blank delete_dt. Retrieve
         the UIDs, then call the set_cross_x method with the UID col names, values and touch type.
+        set_cross_x_many does the same for a list of such dicts, validating them in bulk.
 
         param values in call are a dict of values:
             {<uid_col_nm_1>: <uid_1_value>,
@@ -202,25 +588,22 @@ class BootSaskan():
         map_sphere_data = GD.get_by_match(
                           "MAP_SPHERE", {"map_name": "Gavor-Havorra Planetary Map"})
         grid_data = GD.get_by_match("GRID", {"grid_id": "30x_40y_30zu_30zd"})
-        # This tests the default touch type of ""
-        if not SD.set_cross_x({"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
-                               "map_box_uid_pk": map_box_data['map_box_uid_pk']}):
-            raise BootError(fail)
-        # This tests the virtual delete logic
-        if not SD.set_cross_x({"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
-                               "map_box_uid_pk": map_box_data['map_box_uid_pk'],
-                               "touch_type": "overlaps"}):
+        if not SD.set_cross_x_many([
+            # This tests the default touch type of ""
+            {"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
+             "map_box_uid_pk": map_box_data['map_box_uid_pk']},
+            # This tests the virtual delete logic
+            {"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
+             "map_box_uid_pk": map_box_data['map_box_uid_pk'],
+             "touch_type": "overlaps"},
+            {"map_sphere_uid_pk": map_sphere_data['map_sphere_uid_pk'],
+             "map_box_uid_pk": map_box_data['map_box_uid_pk'],
+             "touch_type": "contains"},
+            {"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
+             "grid_uid_pk": grid_data['grid_uid_pk'],
+             "touch_type": "overlaps"},
+        ]):
             raise BootError(fail)
-        if not SD.set_cross_x({"map_sphere_uid_pk": map_sphere_data['map_sphere_uid_pk'],
-                               "map_box_uid_pk": map_box_data['map_box_uid_pk'],
-                               "touch_type": "contains"}):
-            raise BootError(fail)
-        if not SD.set_cross_x({"map_rect_uid_pk": map_rect_data['map_rect_uid_pk'],
-                               "grid_uid_pk": grid_data['grid_uid_pk'],
-                               "touch_type": "overlaps"}):
-            raise BootError(fail)
-
-        print(f"{Colors.CL_DARKCYAN}CROSS_X populated{Colors.CL_END}")
         return True
 
     def populate_fonts_glossaries(self):
@@ -236,4 +619,11 @@ class BootSaskan():
 
 if __name__ == "__main__":
     BS = BootSaskan()
-    BS.boot_saskan()
+    if "--from-snapshot" in sys.argv:
+        BS.boot_from_snapshot()
+    elif "--make-snapshot" in sys.argv:
+        BS.make_snapshot()
+    elif "--migrate" in sys.argv:
+        BS.migrate_db()
+    else:
+        BS.boot_saskan(p_full="--full" in sys.argv)
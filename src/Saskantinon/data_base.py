@@ -13,15 +13,27 @@ For setting and getting data, see data_get, data_set
 """
 import data_model as DM
 import data_structs as DS
+import gzip
+import hashlib
+import json
+import numpy as np
+import pandas as pd
 import pendulum
 import shutil
 import sqlite3 as sq3
 import re
+import threading
+import uuid
+import weakref
 
 from method_files import FileMethods
 from method_shell import ShellMethods
 from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
 from os import path
+from pathlib import Path
+from queue import Empty, Full, LifoQueue
 from pprint import pprint as pp  # noqa: F401
 
 FM = FileMethods()
@@ -29,11 +41,307 @@ SM = ShellMethods()
 DSC = DS.Colors()
 
 
+class PooledConnection(sq3.Connection):
+    """
+    sqlite3 connection that remembers state needed by the pool.
+    - fk_on: current value of the foreign_keys pragma, None if never set.
+    - generation: pool generation the connection was opened in.
+    """
+    fk_on = None
+    generation = 0
+
+
+class ConnectionPool(object):
+    """
+    Keep a bounded set of open sqlite3 connections to one DB file.
+
+    Idle connections are handed out last-in, first-out so the most
+    recently used (warmest) handle is reused first. Connections are
+    opened with check_same_thread=False so a handle released by one
+    thread can be picked up by another, but a handle is only ever
+    used by one thread at a time.
+
+    Every new connection applies the PRAGMA profile given to the pool.
+    A read-only pool opens the file with mode=ro and query_only, and
+    skips journal_mode, which only a writer may change. In WAL mode
+    readers on such a pool do not block, and are not blocked by, the
+    single writer.
+
+    write_lock serializes write transactions from threads of this
+    process, so concurrent writers queue up here rather than spinning
+    on busy_timeout and failing with "database is locked".
+    """
+
+    def __init__(self, p_db_nm: str, p_pool_size: int = 5,
+                 p_pragmas: dict = None, p_read_only: bool = False):
+        """
+        Initialize an empty pool.
+        :param p_db_nm: Path to the database file.
+        :param p_pool_size: Max number of idle connections to keep open.
+        :param p_pragmas: Dict of PRAGMA name: value applied to each new connection.
+        :param p_read_only: If True, open read-only connections.
+        """
+        self.db_nm = p_db_nm
+        self.pool_size = max(1, int(p_pool_size))
+        self.pragmas = dict(p_pragmas or {})
+        self.read_only = p_read_only
+        self.generation = 0
+        self._idle = LifoQueue(maxsize=self.pool_size)
+        self._lock = threading.Lock()
+        self.write_lock = threading.RLock()
+
+    def _open(self) -> PooledConnection:
+        """'PRIVATE'
+        Open a new connection and apply the PRAGMA profile.
+        :return: An open connection.
+        """
+        if self.read_only:
+            conn = sq3.connect(
+                f"{Path(self.db_nm).resolve().as_uri()}?mode=ro", uri=True,
+                factory=PooledConnection, check_same_thread=False
+            )
+        else:
+            conn = sq3.connect(
+                self.db_nm, factory=PooledConnection, check_same_thread=False
+            )
+        try:
+            for pragma, value in self.pragmas.items():
+                if not pragma.isidentifier():
+                    raise ValueError(f"Invalid PRAGMA name: {pragma}")
+                if self.read_only and pragma == "journal_mode":
+                    continue
+                conn.execute(f"PRAGMA {pragma} = {value};")
+            if self.read_only:
+                conn.execute("PRAGMA query_only = ON;")
+        except (sq3.Error, ValueError):
+            conn.close()
+            raise
+        conn.generation = self.generation
+        return conn
+
+    def acquire(self, p_foreign_keys_on: bool = True) -> PooledConnection:
+        """
+        Get an idle connection or open a new one.
+        Only issue the foreign_keys PRAGMA if the setting changes.
+        :param p_foreign_keys_on: Requested foreign_keys pragma value.
+        :return: An open connection.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except Empty:
+            conn = self._open()
+        if conn.fk_on is not p_foreign_keys_on:
+            pragma_value = "ON" if p_foreign_keys_on else "OFF"
+            conn.execute(f"PRAGMA foreign_keys = {pragma_value};")
+            conn.fk_on = p_foreign_keys_on
+        return conn
+
+    def release(self, p_conn: PooledConnection):
+        """
+        Return a connection to the pool.
+        Any open transaction is rolled back. The connection is closed
+        instead if the pool is full or was reset since it was opened.
+        :param p_conn: Connection obtained from acquire().
+        """
+        try:
+            if p_conn.in_transaction:
+                p_conn.rollback()
+            if p_conn.generation != self.generation:
+                raise Full
+            self._idle.put_nowait(p_conn)
+        except (Full, sq3.Error):
+            p_conn.close()
+
+    def close_all(self):
+        """
+        Close all idle connections. Connections currently checked out
+        are closed when they are released.
+        Call this before deleting, replacing or restoring the DB file.
+        """
+        with self._lock:
+            self.generation += 1
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except Empty:
+                    break
+
+
+class SqlRegistry(object):
+    """
+    In-memory registry of SQL scripts, keyed by file path.
+
+    Scripts come from the schema bundle, a single JSON file holding every
+    generated script, which is read once on first use. Scripts missing
+    from the bundle are looked up in the legacy per-file layout: all
+    *.sql files in a directory are read once, the first time any script
+    in that directory is requested. After that, statements are served
+    from memory, so the execute_* hot paths do no file IO.
+    If check_mtime is on, a script is re-read when its file changes.
+    """
+
+    def __init__(self, p_check_mtime: bool = False):
+        """
+        Initialize an empty registry.
+        :param p_check_mtime: If True, stat the file on every get() and
+            reload the script if its modification time changed.
+        """
+        self.check_mtime = p_check_mtime
+        self.bundle_path = ""
+        self.version = ""
+        self._bundle_mtime = None
+        self._stmts: dict = {}
+        self._put_paths: set = set()
+        self._loaded_dirs: set = set()
+        self._lock = threading.RLock()
+
+    def _load_bundle(self):
+        """'PRIVATE'
+        Read the schema bundle into memory, if there is one and it was
+        not read yet (or, with check_mtime, if it changed since).
+        Scripts stored by put() since the last clear() are newer than
+        the bundle on disk, so they are kept.
+        """
+        if not self.bundle_path or not path.isfile(self.bundle_path):
+            return
+        mtime = Path(self.bundle_path).stat().st_mtime
+        if self._bundle_mtime is not None and (
+                not self.check_mtime or mtime == self._bundle_mtime):
+            return
+        bundle = FM.get_json_file(self.bundle_path)
+        self.version = bundle.get("version", "")
+        for sql_path, sql in bundle.get("scripts", {}).items():
+            sql_path = path.normpath(sql_path)
+            if sql_path not in self._put_paths:
+                self._stmts[sql_path] = (None, sql.strip())
+        self._bundle_mtime = mtime
+
+    def _read(self, p_path: str) -> str:
+        """'PRIVATE'
+        Read one script from disk and store it with its modification time.
+        :param p_path: Normalized path to the SQL file.
+        :return: Content of the SQL file.
+        :raises FileNotFoundError: If the SQL file does not exist.
+        """
+        mtime = Path(p_path).stat().st_mtime
+        with open(p_path, "r") as f:
+            sql = f.read().strip()
+        self._stmts[p_path] = (mtime, sql)
+        return sql
+
+    def load_dir(self, p_dir: str):
+        """
+        Read every *.sql file in a directory into memory, once.
+        :param p_dir: Path to a directory of SQL files.
+        """
+        dir_key = path.normpath(p_dir)
+        with self._lock:
+            if dir_key in self._loaded_dirs:
+                return
+            for sql_file in FM.scan_dir(dir_key, "*.sql") if path.isdir(dir_key) else []:
+                self._read(path.normpath(str(sql_file)))
+            self._loaded_dirs.add(dir_key)
+
+    def get(self, p_path: str) -> str:
+        """
+        Return a script from memory, loading its directory on first use.
+        :param p_path: Path to the SQL file.
+        :return: Content of the SQL file.
+        :raises FileNotFoundError: If the SQL file does not exist.
+        """
+        sql_path = path.normpath(p_path)
+        with self._lock:
+            self._load_bundle()
+            entry = self._stmts.get(sql_path)
+            if entry is not None and entry[0] is None:
+                return entry[1]
+        self.load_dir(path.dirname(sql_path))
+        with self._lock:
+            entry = self._stmts.get(sql_path)
+            if entry is not None and (
+                entry[0] is None or not self.check_mtime
+                or Path(sql_path).stat().st_mtime == entry[0]
+            ):
+                return entry[1]
+            return self._read(sql_path)
+
+    def put(self, p_path: str, p_sql: str):
+        """
+        Store a generated script.
+        :param p_path: Path of the script, as a file path.
+        :param p_sql: Content of the script.
+        """
+        sql_path = path.normpath(p_path)
+        with self._lock:
+            self._stmts[sql_path] = (None, p_sql.strip())
+            self._put_paths.add(sql_path)
+
+    def names(self, p_dir: str, p_prefix: str = "") -> list:
+        """
+        List the names of the scripts held for a directory.
+        :param p_dir: Path to the (possibly virtual) SQL directory.
+        :param p_prefix: Only list names starting with this, e.g. "CREATE_".
+        :return: Sorted list of script names, without the .sql suffix.
+        """
+        dir_key = path.normpath(p_dir)
+        with self._lock:
+            self._load_bundle()
+        self.load_dir(dir_key)
+        with self._lock:
+            return sorted(
+                Path(sql_path).stem for sql_path in self._stmts
+                if path.dirname(sql_path) == dir_key
+                and Path(sql_path).stem.startswith(p_prefix))
+
+    def get_version(self) -> str:
+        """
+        Return the version of the schema bundle, reading it if needed.
+        :return: Bundle version, or "" if there is no bundle.
+        """
+        with self._lock:
+            self._load_bundle()
+            return self.version
+
+    def scripts(self) -> dict:
+        """
+        Return every script held, e.g. to write them out as a bundle.
+        :return: Dict of file path: SQL, sorted by path.
+        """
+        with self._lock:
+            return {sql_path: self._stmts[sql_path][1] for sql_path in sorted(self._stmts)}
+
+    def clear(self):
+        """Forget all scripts, e.g. before generating new ones."""
+        with self._lock:
+            self._stmts.clear()
+            self._put_paths.clear()
+            self._loaded_dirs.clear()
+            self._bundle_mtime = None
+            self.version = ""
+
+
 class DataBase(object):
-    """Support Sqlite3 database setup, usage, maintenance."""
+    """Support Sqlite3 database setup, usage, maintenance.
+
+    Connections are pooled per DB file and shared by all DataBase
+    instances in the process. Each thread works on its own connection.
+    The connect_db/disconnect_db pair borrows and returns a pooled
+    handle; use session() to hold one handle across several calls.
+
+    SQL scripts are read through a process-wide SqlRegistry, so each
+    script is read from disk only once. Generated SQL is kept in memory
+    and saved as one versioned schema bundle; writing the legacy one
+    file per script layout as well is optional (sql_files in context).
+    """
+
+    _pools: dict = {}
+    _pools_lock = threading.Lock()
+    _change_listeners: list = []
+    _sql_registry = SqlRegistry()
 
     def __init__(self, p_context: dict):
         """Initialize DataBase object with configuration from context."""
+        self._local = threading.local()
         self._initialize_attributes(p_context)
         self.db_conn = None
 
@@ -44,9 +352,129 @@ class DataBase(object):
         self.DML = p_context.get("dml")
         self.SASKAN_DB = p_context.get("saskan_db")
         self.SASKAN_BAK = p_context.get("saskan_bak")
+        self.SASKAN_SNAPSHOT = p_context.get("saskan_snapshot", "boot/saskan_snapshot.db")
+        self.POOL_SIZE = p_context.get("db_pool_size", 5)
+        self.CHUNK_SIZE = p_context.get("db_chunk_size", 500)
+        self.FETCH_SIZE = p_context.get("db_fetch_size", 1000)
+        self.PRAGMAS = p_context.get("db_pragmas", {})
+        self.ARCHIVE_COMPRESS = p_context.get("db_archive_compress", "gzip")
+        self.ARCHIVE_KEEP = p_context.get("db_archive_keep", 10)
+        self.BACKUP_PAGES = p_context.get("db_backup_pages", 256)
+        self.SQL_BUNDLE = p_context.get("sql_bundle", "boot/saskan_sql.json")
+        self.SQL_FILES = p_context.get("sql_files", False)
+        if not DataBase._sql_registry.bundle_path:
+            DataBase._sql_registry.bundle_path = self.SQL_BUNDLE
+        if p_context.get("sql_reload", False):
+            DataBase._sql_registry.check_mtime = True
+
+    @property
+    def db_conn(self):
+        """Connection held by the current thread, or None."""
+        return getattr(self._local, "db_conn", None)
+
+    @db_conn.setter
+    def db_conn(self, p_conn):
+        self._local.db_conn = p_conn
+
+    @property
+    def cur(self):
+        """Cursor for the connection held by the current thread, or None."""
+        return getattr(self._local, "cur", None)
+
+    @cur.setter
+    def cur(self, p_cur):
+        self._local.cur = p_cur
+
+    # Change notification
+    # ===========================================
+    @classmethod
+    def add_change_listener(cls, p_callback):
+        """
+        Register a callback to run after a table has been written to.
+        The callback gets the table name, or None when any table may have
+        changed, e.g. after DDL or a restore. Bound methods are held by weak
+        reference so registering does not keep their object alive.
+
+        :param p_callback: Callable taking one argument, the table name.
+        """
+        if hasattr(p_callback, "__self__"):
+            cls._change_listeners.append(weakref.WeakMethod(p_callback))
+        else:
+            cls._change_listeners.append(lambda: p_callback)
+
+    def _notify_change(self, p_tbl_nm):
+        """'PRIVATE'
+        Tell registered listeners that a table was written to.
+        :param p_tbl_nm: Name of the changed table, or None for all tables.
+        """
+        tbl_nm = p_tbl_nm.upper() if p_tbl_nm else None
+        for listener in list(DataBase._change_listeners):
+            callback = listener()
+            if callback is None:
+                DataBase._change_listeners.remove(listener)
+            else:
+                callback(tbl_nm)
 
     # Generate SQL files from data models
     # ===========================================
+    def write_sql_file(self, p_path: str, p_sql: str) -> bool:
+        """
+        Store a generated SQL script in the in-memory registry.
+        It is also written out as its own file if the legacy per-file
+        layout is on (sql_files in context).
+        :param p_path: Path to the SQL file.
+        :param p_sql: Content of the SQL file.
+        :return: True if successful.
+        """
+        DataBase._sql_registry.put(p_path, p_sql)
+        if self.SQL_FILES:
+            Path(p_path).parent.mkdir(parents=True, exist_ok=True)
+            return FM.write_file(p_path, p_sql)
+        return True
+
+    def reset_sql_registry(self):
+        """Forget all in-memory SQL scripts, e.g. after deleting SQL files."""
+        DataBase._sql_registry.clear()
+
+    def get_sql_names(self, p_sql_loc: str, p_prefix: str = "") -> list:
+        """
+        List the SQL scripts available for a location.
+        :param p_sql_loc: Location of the SQL file directory, e.g. self.DDL.
+        :param p_prefix: Only list names starting with this, e.g. "CREATE_".
+        :return: Sorted list of script names.
+        """
+        return DataBase._sql_registry.names(p_sql_loc, p_prefix)
+
+    @property
+    def schema_version(self) -> str:
+        """Version of the loaded schema bundle; "" if there is none."""
+        return DataBase._sql_registry.get_version()
+
+    @property
+    def schema_user_version(self) -> int:
+        """
+        Schema version as the 31-bit integer stored in PRAGMA user_version.
+        0 if there is no schema bundle.
+        """
+        version = self.schema_version
+        return int(version[:7], 16) if version else 0
+
+    def write_sql_bundle(self) -> str:
+        """
+        Save every generated script as one schema bundle (JSON).
+        The version is a hash of the scripts, so it changes whenever
+        any generated statement changes, and only then.
+        :writes: the sql_bundle file, by default boot/saskan_sql.json
+        :return: The bundle version.
+        """
+        scripts = DataBase._sql_registry.scripts()
+        version = hashlib.sha256(
+            json.dumps(scripts, sort_keys=True).encode()).hexdigest()[:16]
+        FM.write_file(self.SQL_BUNDLE, json.dumps(
+            {"version": version, "scripts": scripts}, separators=(",", ":")))
+        DataBase._sql_registry.version = version
+        return version
+
     def set_sql_data_type(
         self, p_col_nm: str, p_def_value: object, p_constraints: dict
     ) -> str:
@@ -159,11 +587,32 @@ class DataBase(object):
         ]
         return "".join(sql_lines)
 
+    def set_sql_indexes(self, p_table_nm: str, p_constraints: dict) -> str:
+        """
+        Generate SQL CREATE INDEX code for secondary indexes.
+        Indexes are declared in the IX constraint as a list of column lists,
+        typically a natural key followed by delete_dt. For example:
+        IX: list = [["frame_id", "delete_dt"]]
+        creates IX_FRAMES_frame_id_delete_dt on FRAMES (frame_id, delete_dt).
+
+        :param p_table_nm: Name of table the indexes belong to.
+        :param p_constraints: Dict of constraints for the table.
+        :return: Zero or more CREATE INDEX statements.
+        """
+        index_cols = p_constraints.get("IX", [])
+        sql_lines = [
+            f"CREATE INDEX IF NOT EXISTS IX_{p_table_nm}_{'_'.join(cols)} "
+            + f"ON {p_table_nm} ({', '.join(cols)});\n"
+            for cols in index_cols
+        ]
+        return "".join(sql_lines)
+
     def generate_create_sql(
         self, p_table_nm: str, p_constraints: dict, p_col_fields: dict
     ) -> list:
         """
         Generate SQL CREATE TABLE code from data model.
+        Any secondary indexes are created in the same script.
 
         :param p_table_nm: Name of table to create SQL for.
         :param p_constraints: Dict of constraints for the table.
@@ -195,7 +644,8 @@ class DataBase(object):
         )
 
         sql = f"CREATE TABLE IF NOT EXISTS {p_table_nm} (\n{''.join(sqlns)});\n"
-        FM.write_file(path.join(self.DDL, f"CREATE_{p_table_nm}.sql"), sql)
+        sql += self.set_sql_indexes(p_table_nm, p_constraints)
+        self.write_sql_file(path.join(self.DDL, f"CREATE_{p_table_nm}.sql"), sql)
         return col_names
 
     def generate_drop_sql(self, p_table_name: str) -> bool:
@@ -210,7 +660,7 @@ class DataBase(object):
 
         try:
             # Write the generated SQL to the specified file
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
         except Exception as e:
             # Log the exception or handle it according to your application's needs
@@ -241,7 +691,7 @@ class DataBase(object):
             file_path = path.join(self.DML, f"INSERT_{p_table_name}.sql")
 
             # Write the generated SQL to the specified file
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
         except Exception as e:
@@ -283,7 +733,7 @@ class DataBase(object):
             file_path = path.join(self.DML, f"SELECT_ALL_{p_table_name}.sql")
 
             # Write the generated SQL to the specified file
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
         except Exception as e:
@@ -329,7 +779,7 @@ class DataBase(object):
             file_path = path.join(self.DML, f"SELECT_ALL_{p_table_name}_CLEAN.sql")
 
             # Write the generated SQL to the specified file.
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
         except Exception as e:
@@ -363,9 +813,12 @@ class DataBase(object):
                 f"WHERE {pk_column_quoted} = ?"
             )
 
-            # Add ORDER BY clause if applicable.
+            # Add ORDER BY clause if applicable. Only the column name is
+            # enclosed in backticks, not the ASC or DESC keyword.
             if "ORDER" in p_constraints:
-                order_by = ", ".join(f"`{col}`" for col in p_constraints["ORDER"])
+                order_by = ", ".join(
+                    f"`{col.split()[0]}` {col.split()[1]}" for col in p_constraints["ORDER"]
+                )
                 sql += f"\nORDER BY {order_by}"
 
             sql += ";\n"
@@ -374,7 +827,7 @@ class DataBase(object):
             file_path = path.join(self.DML, f"SELECT_BY_PK_{p_table_name}.sql")
 
             # Write the generated SQL to the specified file.
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
         except KeyError as e:
@@ -429,7 +882,7 @@ class DataBase(object):
             file_path = path.join(self.DML, f"UPDATE_{p_table_name}.sql")
 
             # Write the generated SQL to the specified file.
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
         except KeyError as e:
@@ -474,7 +927,7 @@ class DataBase(object):
             file_path = path.join(self.DDL, f"DELETE_{p_table_name}.sql")
 
             # Write the generated SQL to the specified file.
-            if not FM.write_file(file_path, sql):
+            if not self.write_sql_file(file_path, sql):
                 raise IOError(f"Failed to write SQL to {file_path}")
 
             return True
@@ -484,6 +937,36 @@ class DataBase(object):
             print(f"An error occurred during SQL DELETE generation: {str(e)}")
             return False
 
+    def generate_vdelete_sql(self, p_table_name: str, p_constraints: dict) -> bool:
+        """
+        Generate SQL to virtually delete the live version of a record.
+        - Matches on the natural key (NK) columns of the table.
+        - Skipped for tables that do not declare an NK.
+        - Uses IS rather than = so that NULL key values also match.
+        :param p_table_name: Name of table to update
+        :param p_constraints: Dict of constraints for the table
+        :writes: SQL file to [APP]/dml/VDELETE_[p_table_name].sql
+        :returns: Boolean flag True if successful, False otherwise.
+        """
+        if "NK" not in p_constraints:
+            return True
+        try:
+            where_clause = " AND ".join(f"`{col}` IS ?" for col in p_constraints["NK"])
+            sql = (
+                f"UPDATE `{p_table_name}`\n"
+                "SET `delete_dt` = ?\n"
+                f"WHERE {where_clause}\n"
+                "AND (delete_dt IS NULL OR delete_dt = '');\n"
+            )
+            file_path = path.join(self.DML, f"VDELETE_{p_table_name}.sql")
+            if not self.write_sql_file(file_path, sql):
+                raise IOError(f"Failed to write SQL to {file_path}")
+            return True
+
+        except Exception as e:
+            print(f"An error occurred during SQL VDELETE generation: {str(e)}")
+            return False
+
     def parse_field_definitions(self, p_dm_doc: str) -> dict:
         """
         Parse field definitions from metadata in a data model's class-level docstring.
@@ -509,71 +992,66 @@ class DataBase(object):
 
         return fields
 
-    def generate_insert_metadata_sql(
-        self, p_data_model: object, p_name_space: str
-    ) -> bool:
+    def generate_insert_metadata_sql(self, p_data_models: dict) -> bool:
         """
-        Create or extend SQL INSERT_METADATA code.
-        Read in the existing INSERT_METADATA.sql file if exists, else create one.
-        Add new metadata based on reading the data model's docstring.
-        :param p_data_model: Data model class object
-        :param p_name_space: Name space of the data model class, e.g. 'app' or 'fin'
-        :writes: SQL file to [APP]/ddl/CREATE_TABLE_[p_table_name].sql
+        Create SQL INSERT_METADATA code for all data models at once.
+        Field definitions are read from each data model's docstring and
+        become one multi-row INSERT. Row UIDs are derived from the table
+        and column names, so the script is the same on every run.
+        :param p_data_models: Dict of name space: list of data model classes
+        :writes: SQL to [APP]/ddl/INSERT_METADATA.sql
         :returns: Boolean indicating success/failure.
-
-        @DEV:
-        - Fix this so that a comma is always added to the end of the VALUES line,
-           even when it is the last item for a given table name.
-        - Only replace the comma with a semi-colon on the penultimate line.
         """
         try:
-            field_defs = self.parse_field_definitions(p_data_model.__doc__)
-            if not field_defs:
-                # There are no field definitions to process.
+            rows: list = []
+            for name_space, models in p_data_models.items():
+                for model in models:
+                    field_defs = self.parse_field_definitions(model.__doc__)
+                    for f_nm, f_def in field_defs.items():
+                        f_def = f_def.replace('"', "").replace("'", "")
+                        uid = uuid.uuid5(
+                            uuid.NAMESPACE_URL, f"saskan:{model._tablename}:{f_nm}").hex
+                        rows.append(f'("{uid}", "{name_space}", "{model.__name__}", ' +
+                                    f'"{model._tablename}", "{f_nm}", "{f_def}", "")')
+            if not rows:
                 return True
-
-            sql_file_path = path.join(self.DDL, "INSERT_METADATA.sql")
-            if FM.is_file_or_dir(sql_file_path):
-                SQL = FM.get_file(sql_file_path)
-                SQL = SQL.rstrip(";")  # Remove trailing semicolon if present
-            else:
-                # If the SQL file is empty, copy from template and remove placeholder
-                FM.copy_one_file(
-                    path.join(self.DML, "INSERT_METADATA.sql"), sql_file_path
-                )
-                SQL = FM.get_file(sql_file_path).replace("(?, ?, ?, ?, ?, ?, ?);", "")
-
-            # Extend the SQL insert statement with new metadata fields
-            for f_nm, f_def in field_defs.items():
-                f_def = f_def.replace('"', "").replace("'", "")
-                SQL += "\n"
-                SQL += f'("{SM.get_uid()}", '
-                SQL += f'"{p_name_space}", '
-                SQL += f'"{p_data_model.__name__}", '
-                SQL += f'"{p_data_model._tablename}", '
-                SQL += f'"{f_nm}", '
-                SQL += f'"{f_def}", '
-                SQL += '""),'
-            SQL = SQL[:-1] + ";"
-
-            # Write the updated SQL back to the file
-            # scrub the SQL to ensure that there is a comma at the end of every VALUES line
-            # and that the last line ends with a semicolon.
-            SQL = SQL.replace(")", "),").replace("),,", "),").replace("),;", ");")
-            SQL = SQL.replace("), VAL", ") VAL")
-
-            FM.write_file(sql_file_path, SQL)
-            return True
+            # Use the METADATA insert as a template, minus its placeholders
+            SQL = self.get_sql_file(self.DML, "INSERT_METADATA").replace(
+                "(?, ?, ?, ?, ?, ?, ?);", "")
+            SQL = SQL.rstrip() + " \n" + ",\n".join(rows) + ";\n"
+            return self.write_sql_file(path.join(self.DDL, "INSERT_METADATA.sql"), SQL)
 
         except Exception as e:
             # Log the exception or handle it as needed
             print(f"An error occurred: {SM.show_trace(e)}")
             return False
 
+    def generate_sql_bundle(self, p_data_models: dict, p_other_models: dict = None) -> str:
+        """
+        Generate all SQL for all data models in one pass, in memory,
+        then save it as the schema bundle.
+        :param p_data_models: Dict of name space: list of data model classes.
+            The METADATA model must come first.
+        :param p_other_models: Dict of name space: list of data model classes
+            of tables kept outside the main DB. Their SQL is generated, but
+            they get no METADATA rows.
+        :raises ValueError: If SQL generation fails for a model.
+        :return: The bundle version.
+        """
+        self.reset_sql_registry()
+        for name_space, models in [*p_data_models.items(), *(p_other_models or {}).items()]:
+            for model in models:
+                if not self.generate_sql(model, name_space):
+                    raise ValueError(f"Error generating SQL for model {model._tablename}")
+        if not self.generate_insert_metadata_sql(p_data_models):
+            raise ValueError("Error generating SQL for METADATA rows")
+        return self.write_sql_bundle()
+
     def generate_sql(self, p_data_model: object, p_name_space: str) -> bool:
         """
-        Generate a full set of SQL code from a data model, including specialized INSERT scripts
-        to populate the metadata table.
+        Generate a full set of SQL code from a data model.
+        Scripts to populate the metadata table are made for all models
+        at once, by generate_insert_metadata_sql.
 
         :param p_data_model: Data model class object.
         :param p_name_space: Namespace for the data model.
@@ -614,9 +1092,7 @@ class DataBase(object):
                     table_name, constraints, col_names
                 ),
                 "delete": lambda: self.generate_delete_sql(table_name, constraints),
-                "insert_metadata": lambda: self.generate_insert_metadata_sql(
-                    p_data_model, p_name_space
-                ),
+                "vdelete": lambda: self.generate_vdelete_sql(table_name, constraints),
             }
 
             # Execute each operation and ensure all succeed
@@ -635,60 +1111,207 @@ class DataBase(object):
     # DataBase Connections
     # ===========================================
 
+    def get_pool(self, p_db_nm: str = "", p_read_only: bool = False) -> ConnectionPool:
+        """
+        Return the shared connection pool for a DB file, creating it if needed.
+        Each DB file has a read-write pool and a separate read-only pool.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        :param p_read_only: If True, return the read-only pool.
+        :return: ConnectionPool object.
+        """
+        db_nm = p_db_nm or self.SASKAN_DB
+        pool_key = (path.abspath(db_nm), p_read_only)
+        with DataBase._pools_lock:
+            if pool_key not in DataBase._pools:
+                DataBase._pools[pool_key] = ConnectionPool(
+                    db_nm, self.POOL_SIZE, self.PRAGMAS, p_read_only)
+            return DataBase._pools[pool_key]
+
+    def _write_lock(self) -> threading.RLock:
+        """'PRIVATE'
+        Get the lock that lets one thread at a time write to the main DB.
+        """
+        return self.get_pool(self.SASKAN_DB).write_lock
+
+    def close_pool(self, p_db_nm: str = ""):
+        """
+        Close pooled read-write and read-only connections to a DB file.
+        Must be called before the file is deleted, replaced or restored.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        """
+        for read_only in (False, True):
+            self.get_pool(p_db_nm, read_only).close_all()
+
+    def drop_pool(self, p_db_nm: str = ""):
+        """
+        Close the pooled connections to a DB file and forget its pools.
+        Use instead of close_pool() when the file is deleted for good, so
+        no pool entry outlives it.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        """
+        db_nm = path.abspath(p_db_nm or self.SASKAN_DB)
+        with DataBase._pools_lock:
+            pools = [DataBase._pools.pop((db_nm, read_only), None)
+                     for read_only in (False, True)]
+        for pool in pools:
+            if pool is not None:
+                pool.close_all()
+
+    def remove_wal_files(self, p_db_nm: str = ""):
+        """
+        Delete the -wal and -shm files that sit beside a DB in WAL mode.
+        Call after close_pool() when the DB file itself is deleted or
+        replaced, so a stale log is never replayed into the new file.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        """
+        db_nm = p_db_nm or self.SASKAN_DB
+        for suffix in ("-wal", "-shm"):
+            Path(f"{db_nm}{suffix}").unlink(missing_ok=True)
+
+    def checkpoint_db(self, p_db_nm: str = ""):
+        """
+        Copy all committed WAL content back into the main DB file.
+        Call before copying the DB file as a plain file.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        """
+        pool = self.get_pool(p_db_nm)
+        conn = pool.acquire()
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        finally:
+            pool.release(conn)
+
+    def vacuum_db(self, p_db_nm: str = ""):
+        """
+        Rebuild a DB file to give back its free pages, then refresh the
+        query planner's statistics. VACUUM cannot run inside a transaction,
+        so call it when no write to the DB is in progress.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        """
+        pool = self.get_pool(p_db_nm)
+        conn = pool.acquire()
+        try:
+            conn.execute("VACUUM;")
+            conn.execute("PRAGMA optimize;")
+        finally:
+            pool.release(conn)
+
     def __set_fk_pragma(self, p_foreign_keys_on: bool):
         """'PRIVATE'
         Set the foreign_keys pragma to ON or OFF
         FK's should be ignored when a table is dropped.
         This could potentially cause problems so keep an eye on it.
         As long as dropping, re-creating the entire DB, should be OK.
+        The PRAGMA is skipped if the connection already has that setting.
         :param p_foreign_keys_on: If True, set foreign_keys to on
         """
+        if self.db_conn.fk_on is p_foreign_keys_on:
+            return
         pragma_value = "ON" if p_foreign_keys_on else "OFF"
         self.db_conn.execute(f"PRAGMA foreign_keys = {pragma_value};")
+        self.db_conn.fk_on = p_foreign_keys_on
 
     def disconnect_db(self):
-        """Close cursors and drop DB connection to self object."""
-        if hasattr(self, "db_conn") and self.db_conn is not None:
+        """Close cursors and return DB connection to the pool.
+        Inside a session() the connection is kept until the session ends.
+        """
+        if getattr(self._local, "session_depth", 0) > 0:
+            return
+        if self.db_conn is not None:
             try:
-                if hasattr(self, "cur") and self.cur is not None:
+                if self.cur is not None:
                     self.cur.close()
-                self.db_conn.close()
+                self.get_pool(self._local.db_nm, self._local.read_only).release(
+                    self.db_conn)
             except Exception as e:
                 # Log or handle specific exceptions if needed
                 print(f"An error occurred while closing the database: {e}")
             finally:
                 self.db_conn = None
+                self.cur = None
 
-    def connect_db(self, p_db_nm: str, p_foreign_keys_on: bool = True) -> bool:
+    def connect_db(self, p_db_nm: str, p_foreign_keys_on: bool = True,
+                   p_read_only: bool = False) -> bool:
         """Open DB connection.
 
         Create a DB file at the specified location if one does not already exist.
         Set foreign key pragma ON by default. If doing a DROP, set to OFF.
+        A pooled connection is reused when one is available. Inside a
+        session() on the same DB, the session's connection is reused, so
+        reads there see the session's uncommitted writes.
 
         :param p_db_nm: Name of DB to connect to.
         :param p_foreign_keys_on: Default True
+        :param p_read_only: If True, use a read-only connection. Default False
         :set db_conn: The database connection
         :set cur: Cursor for the connection
+        :raises RuntimeError: If a session() on another DB is open in this
+            thread. Its connection would otherwise be dropped unreleased.
         """
+        if getattr(self._local, "session_depth", 0) > 0:
+            if self._local.db_nm != p_db_nm:
+                raise RuntimeError(
+                    f"Cannot connect to {p_db_nm} inside a session on {self._local.db_nm}")
+            try:
+                # The pragma is a no-op inside a transaction, so commit first.
+                if (self.db_conn.fk_on is not p_foreign_keys_on
+                        and self.db_conn.in_transaction):
+                    self.db_conn.commit()
+                self.__set_fk_pragma(p_foreign_keys_on)
+                return True
+            except sq3.Error as err:
+                print(f"Database connection error: {err}")
+                return False
+
         self.disconnect_db()
 
         try:
-            self.db_conn = sq3.connect(p_db_nm)
+            self.db_conn = self.get_pool(p_db_nm, p_read_only).acquire(
+                p_foreign_keys_on)
+            self._local.db_nm = p_db_nm
+            self._local.read_only = p_read_only
             self.cur: sq3.Cursor = self.db_conn.cursor()
-
-            # Set foreign keys pragma
-            self.__set_fk_pragma(p_foreign_keys_on)
-
             return True  # Connection successful
 
         except sq3.Error as err:
             print(f"Database connection error: {err}")
             return False  # Connection failed
 
+    @contextmanager
+    def session(self, p_db_nm: str = "", p_foreign_keys_on: bool = True):
+        """
+        Hold one pooled connection for the current thread across many calls.
+        All execute_* calls made inside the block reuse the same handle
+        instead of borrowing and returning one per call.
+        Sessions may be nested; the handle is released by the outermost one.
+        Usage:
+            with DB.session():
+                DB.execute_insert(...)
+                DB.execute_update(...)
+
+        :param p_db_nm: Name of DB to connect to. Defaults to the main DB.
+        :param p_foreign_keys_on: Default True
+        :yields: This DataBase object.
+        """
+        db_nm = p_db_nm or self.SASKAN_DB
+        depth = getattr(self._local, "session_depth", 0)
+        if depth == 0:
+            self.connect_db(db_nm, p_foreign_keys_on)
+        self._local.session_depth = depth + 1
+        try:
+            yield self
+            if depth == 0 and self.db_conn is not None and self.db_conn.in_transaction:
+                self.db_conn.commit()
+        finally:
+            self._local.session_depth = depth
+            if depth == 0:
+                self.disconnect_db()
+
     # SQL Helpers
     # ===========================================
     def get_sql_file(self, p_sql_loc: str, p_sql_nm: str) -> str:
-        """Read SQL from a named file.
+        """Get SQL for a named script from the in-memory registry.
+        The script's directory is loaded from disk on first use only.
 
         :param p_sql_loc: Location of the SQL file directory.
         :param p_sql_nm: Name of the SQL file in [APP]/sql.
@@ -702,9 +1325,9 @@ class DataBase(object):
         # Construct the full path to the SQL file
         sql_path = path.join(p_sql_loc, sql_nm)
 
-        # Read the content of the SQL file
+        # Resolve the SQL content from memory
         try:
-            SQL: str = FM.get_file(sql_path)
+            SQL: str = DataBase._sql_registry.get(sql_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"SQL file {sql_nm} not found at location {p_sql_loc}."
@@ -716,6 +1339,24 @@ class DataBase(object):
 
         return SQL
 
+    def split_sql_statements(self, p_sql: str) -> list:
+        """Split the text of a SQL script into complete statements.
+        sqlite3 only runs one statement per execute() call.
+
+        :param p_sql: Text of one or more SQL statements.
+        :return: List of SQL statements.
+        """
+        stmts: list = []
+        stmt = ""
+        for line in p_sql.splitlines(keepends=True):
+            stmt += line
+            if sq3.complete_statement(stmt):
+                stmts.append(stmt.strip())
+                stmt = ""
+        if stmt.strip():
+            stmts.append(stmt.strip())
+        return stmts
+
     def get_db_columns(self, p_tbl_nm: str = "", p_sql_select: str = "") -> list:
         """Retrieve a list of column names for a specified table.
 
@@ -747,27 +1388,274 @@ class DataBase(object):
 
         return col_nms
 
-    def set_dict_from_cursor(self, p_cols: list) -> OrderedDict:
+    def set_dict_from_cursor(self, p_cols: list, p_cursor=None,
+                             p_batch_size: int = 0) -> OrderedDict:
         """
         Translate current cursor contents into a dict of lists.
+        Rows are pulled with fetchmany in batches and appended column by
+        column, so the full result is never held twice (as a list of row
+        tuples and as the dict of lists) at the same time.
 
         :param p_cols: List of column names.
+        :param p_cursor: Cursor to read from. Defaults to self.cur.
+        :param p_batch_size: Rows per fetchmany call. Defaults to the
+            db_fetch_size context setting.
         :return: OrderedDict of lists, with column names as keys
                  and in the same order as listed in table-column order.
         """
+        cursor = p_cursor or self.cur
+        batch_size = max(1, int(p_batch_size or self.FETCH_SIZE))
+
         # Initialize OrderedDict with empty lists for each column
         result = OrderedDict((col, []) for col in p_cols)
+        col_lists = list(result.values())
 
-        # Fetch all rows from the cursor
-        fetch_all_rows = self.cur.fetchall()  # list of tuples
-
-        # Populate the OrderedDict
-        for row in fetch_all_rows:
-            for col, value in zip(p_cols, row):
-                result[col].append(value)
+        # Populate the OrderedDict one batch at a time
+        while batch := cursor.fetchmany(batch_size):
+            for col_ix, col_list in enumerate(col_lists):
+                col_list.extend(row[col_ix] for row in batch)
 
         return result
 
+    def set_rows_from_cursor(self, p_table_nm: str, p_cursor=None,
+                             p_batch_size: int = 0) -> list:
+        """
+        Translate current cursor contents into a list of namedtuple rows.
+        Rows use the row type cached on the table's data model, so no
+        per-row reflection or dict is needed.
+
+        :param p_table_nm: Name of the SQL table.
+        :param p_cursor: Cursor to read from. Defaults to self.cur.
+        :param p_batch_size: Rows per fetchmany call. Defaults to the
+            db_fetch_size context setting.
+        :raises ValueError: If the table has no data model.
+        :return: List of row namedtuples, in table-column order.
+        """
+        model = DM.get_model(p_table_nm)
+        if model is None:
+            raise ValueError(f"No data model for table {p_table_nm}")
+        make_row = DM.get_schema(model).row_type._make
+        cursor = p_cursor or self.cur
+        batch_size = max(1, int(p_batch_size or self.FETCH_SIZE))
+        rows: list = []
+        while batch := cursor.fetchmany(batch_size):
+            rows.extend(map(make_row, batch))
+        return rows
+
+    # Typed result formats
+    # ===========================================
+    def get_col_dtypes(self, p_table_nm: str, p_cols: list) -> list:
+        """
+        Map a table's model column types to NumPy dtypes.
+        int, float and bool columns get int64, float64 and bool;
+        everything else, and any column not on the model, is object.
+
+        :param p_table_nm: Name of the SQL table. May be empty.
+        :param p_cols: List of column names, in result order.
+        :return: List of numpy dtypes, one per column.
+        """
+        np_types = {"int": np.int64, "float": np.float64, "bool": np.bool_}
+        col_types = DM.get_col_types(p_table_nm) if p_table_nm else {}
+        return [np.dtype(np_types.get(col_types.get(col), object)) for col in p_cols]
+
+    def _batch_to_array(self, p_batch: list, p_col_ix: int, p_dtype) -> np.ndarray:
+        """'PRIVATE'
+        Convert one column of a fetchmany batch to a NumPy array.
+        NULLs in int or float columns become NaN in a float64 array;
+        values that do not fit the declared type fall back to object.
+        :param p_batch: List of row tuples.
+        :param p_col_ix: Index of the column within each row.
+        :param p_dtype: Declared numpy dtype for the column.
+        :return: numpy array with one value per row.
+        """
+        row_cnt = len(p_batch)
+        if p_dtype != object:
+            try:
+                return np.fromiter(
+                    (row[p_col_ix] for row in p_batch), dtype=p_dtype, count=row_cnt)
+            except (TypeError, ValueError):
+                pass
+            if p_dtype.kind in "if":
+                try:
+                    return np.fromiter(
+                        (np.nan if row[p_col_ix] is None else row[p_col_ix]
+                         for row in p_batch), dtype=np.float64, count=row_cnt)
+                except (TypeError, ValueError):
+                    pass
+        arr = np.empty(row_cnt, dtype=object)
+        arr[:] = [row[p_col_ix] for row in p_batch]
+        return arr
+
+    def set_arrays_from_cursor(self, p_cols: list, p_dtypes: list, p_cursor=None,
+                               p_batch_size: int = 0) -> OrderedDict:
+        """
+        Translate current cursor contents into a dict of NumPy arrays.
+        Each fetchmany batch is converted straight to one typed array per
+        column; the per-batch arrays are joined once at the end, which also
+        widens a column if a later batch needed a wider dtype.
+
+        :param p_cols: List of column names.
+        :param p_dtypes: List of numpy dtypes, one per column.
+        :param p_cursor: Cursor to read from. Defaults to self.cur.
+        :param p_batch_size: Rows per fetchmany call. Defaults to the
+            db_fetch_size context setting.
+        :return: OrderedDict of numpy arrays, with column names as keys.
+        """
+        cursor = p_cursor or self.cur
+        batch_size = max(1, int(p_batch_size or self.FETCH_SIZE))
+        chunks = [[] for _ in p_cols]
+        while batch := cursor.fetchmany(batch_size):
+            for col_ix, dtype in enumerate(p_dtypes):
+                chunks[col_ix].append(self._batch_to_array(batch, col_ix, dtype))
+        return OrderedDict(
+            (col, np.concatenate(chunks[col_ix]) if chunks[col_ix]
+             else np.empty(0, dtype=p_dtypes[col_ix]))
+            for col_ix, col in enumerate(p_cols)
+        )
+
+    def set_result_from_cursor(self, p_cols: list, p_result_format: str = "dict",
+                               p_table_nm: str = "", p_cursor=None,
+                               p_batch_size: int = 0):
+        """
+        Translate current cursor contents into the requested result format.
+        - "dict": OrderedDict of lists (see set_dict_from_cursor)
+        - "numpy": OrderedDict of typed numpy arrays
+        - "pandas": pandas DataFrame built from the numpy arrays
+        - "arrow": pyarrow Table built from the numpy arrays; needs pyarrow
+        - "rows": list of the table model's namedtuple rows (see DM.to_rows);
+          p_cols must be the model's full column list, in table order
+
+        :param p_cols: List of column names.
+        :param p_result_format: One of dict, numpy, pandas, arrow or rows.
+        :param p_table_nm: Name of the SQL table, used to look up the
+            column types declared on its data model.
+        :param p_cursor: Cursor to read from. Defaults to self.cur.
+        :param p_batch_size: Rows per fetchmany call.
+        :raises ValueError: If p_result_format is not recognized, or if
+            "rows" is requested for a table with no model.
+        :raises ImportError: If "arrow" is requested and pyarrow is missing.
+        :return: Result in the requested format.
+        """
+        result_format = p_result_format.lower()
+        if result_format == "dict":
+            return self.set_dict_from_cursor(p_cols, p_cursor, p_batch_size)
+        if result_format == "rows":
+            return self.set_rows_from_cursor(p_table_nm, p_cursor, p_batch_size)
+        if result_format not in ("numpy", "pandas", "arrow"):
+            raise ValueError(f"Unknown result format: {p_result_format}")
+        if result_format == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError as err:
+                raise ImportError(
+                    "pyarrow is required for result_format='arrow'") from err
+        dtypes = self.get_col_dtypes(p_table_nm, p_cols)
+        arrays = self.set_arrays_from_cursor(p_cols, dtypes, p_cursor, p_batch_size)
+        if result_format == "pandas":
+            return pd.DataFrame(arrays, columns=p_cols, copy=False)
+        if result_format == "arrow":
+            return pa.table(
+                {col: pa.array(arr, from_pandas=True) for col, arr in arrays.items()})
+        return arrays
+
+    # Streaming SELECTs
+    # ===========================================
+    def _get_select_sql(self, p_table_nm: str, p_clean: bool) -> str:
+        """'PRIVATE'
+        Return the SELECT_ALL (or SELECT_ALL_*_CLEAN) script for a table.
+        :param p_table_nm: Name of the SQL table.
+        :param p_clean: If True, exclude virtually-deleted rows.
+        :return: SQL text.
+        """
+        sql_nm = f"SELECT_ALL_{p_table_nm.upper()}"
+        return self.get_sql_file(self.DML, f"{sql_nm}_CLEAN" if p_clean else sql_nm)
+
+    def iter_select(self, p_table_nm: str, p_batch_size: int = 0,
+                    p_clean: bool = False, p_batches: bool = False,
+                    p_as_rows: bool = False):
+        """
+        Stream rows of a table with fetchmany instead of loading them all.
+
+        The generator works on its own pooled connection and cursor, so
+        other DataBase calls can be made between iterations. The connection
+        is returned to the pool when the generator is exhausted or closed.
+        Reads do not see writes still uncommitted in a session().
+        Usage:
+            for row in DB.iter_select("GALAXY"):
+                ...
+            for batch in DB.iter_select("STAR_SYSTEM", 5000, p_batches=True):
+                ...
+
+        :param p_table_nm: Name of the SQL table.
+        :param p_batch_size: Rows per fetchmany call. Defaults to the
+            db_fetch_size context setting.
+        :param p_clean: If True, exclude virtually-deleted rows.
+        :param p_batches: If True, yield lists of row tuples, one per
+            batch, instead of single row tuples.
+        :param p_as_rows: If True, yield the model's namedtuple rows
+            (see DM.to_rows) instead of plain tuples.
+        :yields: Row tuples, in table-column order, or lists of them.
+        """
+        sql = self._get_select_sql(p_table_nm, p_clean)
+        make_row = (DM.get_schema(DM.get_model(p_table_nm)).row_type._make
+                    if p_as_rows else None)
+        batch_size = max(1, int(p_batch_size or self.FETCH_SIZE))
+        pool = self.get_pool(self.SASKAN_DB, p_read_only=True)
+        conn = pool.acquire(p_foreign_keys_on=True)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql)
+            while batch := cursor.fetchmany(batch_size):
+                if make_row is not None:
+                    batch = list(map(make_row, batch))
+                if p_batches:
+                    yield batch
+                else:
+                    yield from batch
+        finally:
+            cursor.close()
+            pool.release(conn)
+
+    def select_columnar(self, p_table_nm: str, p_batch_size: int = 0,
+                        p_clean: bool = False) -> OrderedDict:
+        """
+        Read a table into a dict of column lists that are sized up front.
+        The row count is read first and one list per column is allocated
+        at full length. Each fetchmany batch is then copied into place by
+        slice assignment, so the lists are never grown row by row.
+        The count and the rows are read in one transaction, so they agree.
+
+        :param p_table_nm: Name of the SQL table.
+        :param p_batch_size: Rows per fetchmany call. Defaults to the
+            db_fetch_size context setting.
+        :param p_clean: If True, exclude virtually-deleted rows.
+        :return: OrderedDict of lists, with column names as keys
+                 and in table-column order.
+        """
+        sql = self._get_select_sql(p_table_nm, p_clean).rstrip(";")
+        batch_size = max(1, int(p_batch_size or self.FETCH_SIZE))
+        pool = self.get_pool(self.SASKAN_DB, p_read_only=True)
+        conn = pool.acquire(p_foreign_keys_on=True)
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            row_cnt = cursor.execute(f"SELECT COUNT(*) FROM ({sql})").fetchone()[0]
+            cursor.execute(sql)
+            cols = [desc[0] for desc in cursor.description]
+            result = OrderedDict((col, [None] * row_cnt) for col in cols)
+            col_lists = list(result.values())
+            row_ix = 0
+            while batch := cursor.fetchmany(batch_size):
+                end_ix = row_ix + len(batch)
+                for col_ix, col_list in enumerate(col_lists):
+                    col_list[row_ix:end_ix] = [row[col_ix] for row in batch]
+                row_ix = end_ix
+            conn.commit()
+            return result
+        finally:
+            cursor.close()
+            pool.release(conn)
+
     # Executing Raw SQL
     # ===========================================
     def execute_sql(self, p_sql_code: str, p_foreign_keys_on: bool):
@@ -785,7 +1673,8 @@ class DataBase(object):
         :return: A dictionary with column names as keys and lists of column data as values.
         """
         # Connect to the database
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=p_foreign_keys_on)
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=p_foreign_keys_on,
+                        p_read_only=True)
 
         # Prepare and validate SQL code
         sql = p_sql_code.strip()
@@ -802,16 +1691,9 @@ class DataBase(object):
         # Execute the SQL query
         self.cur.execute(sql)
 
-        # Get column names and fetch data
-        cols = self.get_db_columns(p_sql_select=sql)
-        data = self.cur.fetchall()
-
-        # Construct result dictionary
-        result = (
-            {col: [row[i] for row in data] for i, col in enumerate(cols)}
-            if data
-            else {col: [] for col in cols}
-        )
+        # Get column names from the cursor, then fetch data in batches
+        cols = [desc[0] for desc in self.cur.description]
+        result = self.set_dict_from_cursor(cols)
 
         # Disconnect from the database
         self.disconnect_db()
@@ -820,16 +1702,19 @@ class DataBase(object):
 
     # Executing SQL Scripts
     # ===========================================
-    def execute_select_all(self, p_table_nm: str) -> dict:
+    def execute_select_all(self, p_table_nm: str, p_result_format: str = "dict"):
         """
         Run a SQL SELECT_ALL* script and return data as a dictionary of lists.
         This will return both virtually-deleted and non-deleted records.
 
         :param p_table_nm: Name of the SQL table.
-        :return: Dictionary with column names as keys and lists of column data as values.
+        :param p_result_format: "dict" (default), "numpy", "pandas", "arrow"
+            or "rows". See set_result_from_cursor.
+        :return: Dictionary with column names as keys and lists of column data as values,
+                 or the numpy/pandas/arrow/rows equivalent.
         """
         # Connect to the database
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
 
         # Prepare SQL statement
         sql = self.get_sql_file(self.DML, f"SELECT_ALL_{p_table_nm.upper()}")
@@ -837,32 +1722,28 @@ class DataBase(object):
         # Get column names
         cols = self.get_db_columns(p_sql_select=sql)
 
-        # Execute the SQL query and fetch data
+        # Execute the SQL query and fetch data in batches
         self.cur.execute(sql)
-        data = self.cur.fetchall()
-
-        # Construct result dictionary
-        result = (
-            {col: [row[i] for row in data] for i, col in enumerate(cols)}
-            if data
-            else {col: [] for col in cols}
-        )
+        result = self.set_result_from_cursor(cols, p_result_format, p_table_nm)
 
         # Disconnect from the database
         self.disconnect_db()
 
         return result
 
-    def execute_select_all_clean(self, p_table_nm: str) -> dict:
+    def execute_select_all_clean(self, p_table_nm: str, p_result_format: str = "dict"):
         """
         Run a SQL SELECT_ALL_*_CLEAN script and return data as a dictionary of lists.
         This will return only recrods that have not been virtually deleted.
 
         :param p_table_nm: Name of the SQL table.
-        :return: Dictionary with column names as keys and lists of column data as values.
+        :param p_result_format: "dict" (default), "numpy", "pandas", "arrow"
+            or "rows". See set_result_from_cursor.
+        :return: Dictionary with column names as keys and lists of column data as values,
+                 or the numpy/pandas/arrow/rows equivalent.
         """
         # Connect to the database
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
 
         # Prepare SQL statement
         sql = self.get_sql_file(self.DML, f"SELECT_ALL_{p_table_nm.upper()}_CLEAN")
@@ -870,22 +1751,117 @@ class DataBase(object):
         # Get column names
         cols = self.get_db_columns(p_sql_select=sql)
 
-        # Execute the SQL query and fetch data
+        # Execute the SQL query and fetch data in batches
         self.cur.execute(sql)
-        data = self.cur.fetchall()
-
-        # Construct result dictionary
-        result = (
-            {col: [row[i] for row in data] for i, col in enumerate(cols)}
-            if data
-            else {col: [] for col in cols}
-        )
+        result = self.set_result_from_cursor(cols, p_result_format, p_table_nm)
 
         # Disconnect from the database
         self.disconnect_db()
 
         return result
 
+    def execute_select_by_match(
+        self, p_table_nm: str, p_match: dict, p_first_only: bool = False
+    ) -> list:
+        """
+        Select non-deleted rows matching one or more column values.
+        The SELECT_ALL_*_CLEAN script is extended with a parameterized
+        `col` = ? condition per matched column, so SQLite can resolve the
+        lookup through a secondary (IX) index instead of a full-table read.
+        Rows are returned in the table's standard ORDER BY sequence.
+
+        :param p_table_nm: Name of the SQL table.
+        :param p_match: Dict of col-name:value pairs to match on.
+        :param p_first_only: If True, stop after the first matching row.
+        :return: List of dicts (column name: value), one per matching row.
+        """
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
+        try:
+            sql = self.get_sql_file(self.DML, f"SELECT_ALL_{p_table_nm.upper()}_CLEAN")
+            cols = self.get_db_columns(p_sql_select=sql)
+
+            # Column names cannot be bound as parameters, so only accept real columns.
+            bad_cols = [col for col in p_match if col not in cols]
+            if bad_cols:
+                print(f"{DSC.CL_YELLOW}WARN{DSC.CL_END}: " +
+                      f"{p_table_nm} has no column(s) {bad_cols}.")
+                return []
+
+            select_from, _, rest = sql.rstrip(";").partition("\nWHERE ")
+            where, _, order_by = rest.partition("\nORDER BY ")
+            sql = f"{select_from}\nWHERE ({where})"
+            sql += "".join(f"\nAND `{col}` = ?" for col in p_match)
+            if order_by:
+                sql += f"\nORDER BY {order_by}"
+            if p_first_only:
+                sql += "\nLIMIT 1"
+            sql += ";"
+
+            self.cur.execute(sql, tuple(p_match.values()))
+            return [dict(zip(cols, row)) for row in self.cur.fetchall()]
+        finally:
+            self.disconnect_db()
+
+    def execute_select_in(self, p_table_nm: str, p_match_cols: list, p_keys,
+                          p_chunk_size: int = 0) -> dict:
+        """
+        Select non-deleted rows matching any of many keys, a chunk at a time.
+        Each chunk is one query: `col` IN (?, ...) for a one-column key, or
+        (`col1`, `col2`) IN (VALUES (?, ?), ...) for a composite key, so
+        SQLite can resolve it through a secondary (IX) index.
+        Usage:
+            rows = DB.execute_select_in("MENUS", ["frame_id", "menu_id"], keys)
+            missing = [k for k in keys if k not in rows]
+
+        :param p_table_nm: Name of the SQL table.
+        :param p_match_cols: List of column names making up the key.
+        :param p_keys: Iterable of key values: tuples in p_match_cols order,
+            or plain values for a one-column key.
+        :param p_chunk_size: Keys per query. Defaults to the db_chunk_size
+            context setting, capped at SQLite's 999 bound parameters.
+        :raises ValueError: If a match column is not on the table.
+        :return: Dict of key tuple: dict of the first row (in the table's
+            ORDER BY sequence) with that key. Keys with no row are left out.
+        """
+        keys = list(dict.fromkeys(
+            key if isinstance(key, tuple) else (key,) for key in p_keys))
+        result: dict = {}
+        if not keys:
+            return result
+        chunk_size = max(1, min(int(p_chunk_size or self.CHUNK_SIZE),
+                                999 // len(p_match_cols)))
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
+        try:
+            sql = self.get_sql_file(self.DML, f"SELECT_ALL_{p_table_nm.upper()}_CLEAN")
+            cols = self.get_db_columns(p_sql_select=sql)
+            bad_cols = [col for col in p_match_cols if col not in cols]
+            if bad_cols:
+                raise ValueError(f"{p_table_nm} has no column(s) {bad_cols}")
+            key_ixs = [cols.index(col) for col in p_match_cols]
+            select_from, _, rest = sql.rstrip(";").partition("\nWHERE ")
+            where, _, order_by = rest.partition("\nORDER BY ")
+            order_by = f"\nORDER BY {order_by}" if order_by else ""
+            if len(p_match_cols) == 1:
+                match_sql = f"`{p_match_cols[0]}` IN ({{}})"
+                place = "?"
+            else:
+                match_sql = "(" + ", ".join(f"`{col}`" for col in p_match_cols) + \
+                    ") IN (VALUES {})"
+                place = "(" + ", ".join("?" * len(p_match_cols)) + ")"
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                chunk_sql = (f"{select_from}\nWHERE ({where})\nAND " +
+                             match_sql.format(", ".join([place] * len(chunk))) +
+                             f"{order_by};")
+                self.cur.execute(chunk_sql, [val for key in chunk for val in key])
+                for row in self.cur.fetchall():
+                    key = tuple(row[ix] for ix in key_ixs)
+                    if key not in result:
+                        result[key] = dict(zip(cols, row))
+            return result
+        finally:
+            self.disconnect_db()
+
     def execute_select_by(self, p_dmo: object, p_pk_value: str) -> dict:
         """
         Run a SQL SELECT_BY script using parameters to select by primary key,
@@ -896,14 +1872,13 @@ class DataBase(object):
         :return: Dictionary with column names as keys and their corresponding data values.
         """
         # Connect to the database
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
 
         # Prepare SQL statement
         sql = self.get_sql_file(self.DML, f"SELECT_BY_PK_{p_dmo._tablename}")
 
         # Retrieve column definitions from the data model
-        rec = DM.cols_to_dict(p_dmo)[p_dmo._tablename]
-        keys = list(rec.keys())
+        schema = DM.get_schema(p_dmo)
 
         # Execute the SQL query with primary key value
         self.cur.execute(
@@ -911,9 +1886,8 @@ class DataBase(object):
         )  # Wrap p_pk_value in a list for SQL execution
         data = self.cur.fetchone()  # Fetch only one record since it's based on PK
 
-        # Update record dictionary with fetched data
-        if data:
-            rec.update({keys[n]: value for n, value in enumerate(data)})
+        # Build the record from fetched data, or from the model defaults
+        rec = OrderedDict(zip(schema.cols, data or schema.defaults))
 
         # Disconnect from the database
         self.disconnect_db()
@@ -930,30 +1904,53 @@ class DataBase(object):
         - No dynamic parameters.
         - Executed as one transaction. If anything fails, all roll back.
         - Will print error messages but not raise exceptions.
+        - A script may hold several statements, e.g. CREATE TABLE and CREATE INDEX.
 
         :param p_sql_list: List of external SQL file names.
         :param p_foreign_keys_on: Set foreign key pragma ON or OFF.
         :return: True if transaction succeeds, False if it fails.
         """
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on)
-        try:
-            self.cur.execute("BEGIN")
-            for p_sql_nm in p_sql_list:
-                sql = self.get_sql_file(self.DDL, p_sql_nm)
-                self.cur.execute(sql)
-            self.db_conn.commit()
-            return True
-        except sq3.Error as e:
-            # Rollback the transaction if any operation fails
-            self.db_conn.rollback()
-            print(f"{DSC.CL_RED}{DSC.CL_BOLD}Rolled back: {e}{DSC.CL_END}")
-            print(f"Transaction failed on processing of:{DSC.CL_END}{DSC.CL_YELLOW} {p_sql_nm}...")
-            pp(("sql code: ", sql))
-            print(f"{DSC.CL_END}")
-            print(f"{DSC.CL_DARKCYAN}Processing continues...{DSC.CL_END}")
-            return False
-        finally:
-            self.disconnect_db()
+        with self._write_lock():
+            self.connect_db(self.SASKAN_DB, p_foreign_keys_on)
+            try:
+                self.cur.execute("BEGIN IMMEDIATE")
+                for p_sql_nm in p_sql_list:
+                    sql = self.get_sql_file(self.DDL, p_sql_nm)
+                    for stmt in self.split_sql_statements(sql):
+                        self.cur.execute(stmt)
+                self.db_conn.commit()
+                self._notify_change(None)
+                return True
+            except sq3.Error as e:
+                # Rollback the transaction if any operation fails
+                self.db_conn.rollback()
+                print(f"{DSC.CL_RED}{DSC.CL_BOLD}Rolled back: {e}{DSC.CL_END}")
+                print(f"Transaction failed on processing of:{DSC.CL_END}{DSC.CL_YELLOW} {p_sql_nm}...")
+                pp(("sql code: ", sql))
+                print(f"{DSC.CL_END}")
+                print(f"{DSC.CL_DARKCYAN}Processing continues...{DSC.CL_END}")
+                return False
+            finally:
+                self.disconnect_db()
+
+    def _flatten_values(self, p_values: tuple) -> tuple:
+        """
+        The p_values tuple structure may contain first the UID, then the rest
+        of the values enclosed in a sub-tuple.
+        For example: (UID, (val1, val2, val3, ...))
+        Or it may already be a flat tuple.
+        For an insert, we need to flatten this structure into a single-level
+        tuple to send to self.cur.execute() if it has a sub-tuple.
+        Otherwise, we can just use the p_values tuple as is.
+
+        :param p_values: n-tuple of values, possibly (UID, (values...)).
+        :return: Flat tuple of values.
+        """
+        if len(p_values) > 1 and isinstance(p_values[1], tuple):
+            # Flatten the structure if the second element is a tuple
+            return (p_values[0], *p_values[1])
+        # Use the original tuple as it is already flat
+        return p_values
 
     def execute_insert(self, p_tbl_nm: str, p_values: tuple) -> bool:
         """
@@ -970,36 +1967,154 @@ class DataBase(object):
         :param p_values: n-tuple of values to insert.
         :return: True if insertion succeeds, False otherwise.
         """
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        with self._write_lock():
+            self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+            SQL = self.get_sql_file(self.DML, f"INSERT_{p_tbl_nm}")
+            flattened_values = p_values
+            try:
+                flattened_values = self._flatten_values(p_values)
+                self.cur.execute(SQL, flattened_values)
+
+                self.db_conn.commit()
+                self._notify_change(p_tbl_nm)
+                return True
+            except sq3.Error as e:
+                print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error in execute_insert: {e}{DSC.CL_END}")
+                print(f"{DSC.CL_YELLOW}SQL: {SQL}")
+                print(f"values: {flattened_values}{DSC.CL_END}")
+                print(f"{DSC.CL_DARKCYAN}Processing continues...{DSC.CL_END}")
+                return False
+            finally:
+                self.disconnect_db()
+
+    def _execute_chunked(self, p_tbl_nm: str, p_rows, p_chunk_size: int,
+                         p_run_chunk, p_caller: str) -> list:
+        """'PRIVATE'
+        Run flattened rows through p_run_chunk in chunks, in one transaction.
+        Each chunk runs inside its own SAVEPOINT, so a chunk that fails is
+        rolled back and reported while the other chunks are still written.
+        :param p_tbl_nm: Name of database table.
+        :param p_rows: Iterable of n-tuples of values.
+        :param p_chunk_size: Rows per chunk. 0 means db_chunk_size.
+        :param p_run_chunk: Callable taking a list of flat value tuples.
+        :param p_caller: Name of the calling method, for messages.
+        :return: List of chunk error dicts, empty if every row was written.
+        """
+        chunk_size = max(1, int(p_chunk_size or self.CHUNK_SIZE))
+        chunk_errors: list = []
+        rows = iter(p_rows)
+        with self._write_lock():
+            self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+            try:
+                self.cur.execute("BEGIN IMMEDIATE")
+                chunk_ix = 0
+                first_row = 0
+                while True:
+                    chunk = [self._flatten_values(row) for row in islice(rows, chunk_size)]
+                    if not chunk:
+                        break
+                    self.cur.execute("SAVEPOINT write_chunk")
+                    try:
+                        p_run_chunk(chunk)
+                        self.cur.execute("RELEASE SAVEPOINT write_chunk")
+                    except sq3.Error as e:
+                        self.cur.execute("ROLLBACK TO SAVEPOINT write_chunk")
+                        self.cur.execute("RELEASE SAVEPOINT write_chunk")
+                        chunk_errors.append({"chunk": chunk_ix, "first_row": first_row,
+                                             "row_cnt": len(chunk), "error": str(e)})
+                        print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error in {p_caller}: " +
+                              f"{p_tbl_nm} chunk {chunk_ix}, rows {first_row}-" +
+                              f"{first_row + len(chunk) - 1}: {e}{DSC.CL_END}")
+                    chunk_ix += 1
+                    first_row += len(chunk)
+                self.db_conn.commit()
+            except sq3.Error as e:
+                self.db_conn.rollback()
+                chunk_errors.append({"chunk": -1, "first_row": -1, "row_cnt": 0, "error": str(e)})
+                print(f"{DSC.CL_RED}{DSC.CL_BOLD}Rolled back {p_caller} on " +
+                      f"{p_tbl_nm}: {e}{DSC.CL_END}")
+            finally:
+                self.disconnect_db()
+                self._notify_change(p_tbl_nm)
+            if chunk_errors:
+                print(f"{DSC.CL_DARKCYAN}Processing continues...{DSC.CL_END}")
+            return chunk_errors
+
+    def execute_insert_many(
+        self, p_tbl_nm: str, p_rows, p_chunk_size: int = 0
+    ) -> list:
+        """
+        Run a SQL INSERT for many rows using executemany, in one transaction.
+
+        Rows are sent in chunks. Each chunk runs inside its own SAVEPOINT,
+        so a chunk that fails is rolled back and reported while the other
+        chunks are still written. The transaction is committed once, at the
+        end, so the whole load costs one sync to disk instead of one per row.
+
+        Each row follows the same rules as execute_insert: a full list of
+        values, either flat or in the (UID, (val1, val2, ...)) form.
+
+        :param p_tbl_nm: Name of database table.
+        :param p_rows: List (or any iterable) of n-tuples of values to insert.
+        :param p_chunk_size: Rows per executemany call. Defaults to the
+            db_chunk_size context setting.
+        :return: List of chunk errors, empty if every row was inserted.
+            Each error is a dict: {"chunk": int, "first_row": int,
+            "row_cnt": int, "error": str}
+        """
         SQL = self.get_sql_file(self.DML, f"INSERT_{p_tbl_nm}")
-        try:
-            # The p_values tuple structure may contain first the UID, then the rest
-            # of the values enclosed in a sub-tuple.
-            # For example: (UID, (val1, val2, val3, ...))
-            # Or it may already be a flat tuple.
-            # For an insert, we need to flatten this structure into a single-level
-            # tuple to send to self.cur.execute() if it has a sub-tuple.
-            # Otherwise, we can just use the p_values tuple as is.
-
-            if isinstance(p_values[1], tuple):
-                # Flatten the structure if the second element is a tuple
-                flattened_values = (p_values[0], *p_values[1])
-            else:
-                # Use the original tuple as it is already flat
-                flattened_values = p_values
+        return self._execute_chunked(
+            p_tbl_nm, p_rows, p_chunk_size,
+            lambda chunk: self.cur.executemany(SQL, chunk), "execute_insert_many")
 
-            self.cur.execute(SQL, flattened_values)
+    def execute_upsert_many(
+        self, p_tbl_nm: str, p_rows, p_chunk_size: int = 0
+    ) -> list:
+        """
+        Write new versions of records, keeping virtual-delete history.
+
+        For each row, the live record with the same natural key (NK) is
+        stamped with a delete_dt by the VDELETE_ script, then the row is
+        inserted. Both statements run on the same prepared-statement
+        connection, in one transaction, with the same chunking and
+        SAVEPOINT handling as execute_insert_many. Rows are applied in
+        order, so a later row in the batch supersedes an earlier one.
+
+        :param p_tbl_nm: Name of database table. Its model must declare NK.
+        :param p_rows: List (or any iterable) of n-tuples of values, flat or
+            in the (UID, (val1, val2, ...)) form, in table-column order.
+        :param p_chunk_size: Rows per chunk. Defaults to the
+            db_chunk_size context setting.
+        :raises ValueError: If the table's model has no natural key.
+        :return: List of chunk errors, empty if every row was written.
+        """
+        model = DM.get_model(p_tbl_nm)
+        nk_cols = getattr(getattr(model, "Constraints", None), "NK", None)
+        if not nk_cols:
+            raise ValueError(f"No natural key (NK) declared for {p_tbl_nm}")
+        positions = DM.get_schema(model).positions
+        nk_ixs = [positions[col] for col in nk_cols]
+        VDELETE_SQL = self.get_sql_file(self.DML, f"VDELETE_{p_tbl_nm}")
+        INSERT_SQL = self.get_sql_file(self.DML, f"INSERT_{p_tbl_nm}")
+        delete_dt = SM.get_iso_time_stamp()
+
+        def upsert_chunk(p_chunk: list):
+            for row in p_chunk:
+                self.cur.execute(VDELETE_SQL, (delete_dt, *(row[ix] for ix in nk_ixs)))
+                self.cur.execute(INSERT_SQL, row)
+
+        return self._execute_chunked(
+            p_tbl_nm, p_rows, p_chunk_size, upsert_chunk, "execute_upsert_many")
+
+    def execute_upsert(self, p_tbl_nm: str, p_values: tuple) -> bool:
+        """
+        Write a new version of one record. See execute_upsert_many.
 
-            self.db_conn.commit()
-            return True
-        except sq3.Error as e:
-            print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error in execute_insert: {e}{DSC.CL_END}")
-            print(f"{DSC.CL_YELLOW}SQL: {SQL}")
-            print(f"values: {flattened_values}{DSC.CL_END}")
-            print(f"{DSC.CL_DARKCYAN}Processing continues...{DSC.CL_END}")
-            return False
-        finally:
-            self.disconnect_db()
+        :param p_tbl_nm: Name of database table.
+        :param p_values: n-tuple of values, flat or (UID, (values...)).
+        :return: True if the write succeeds, False otherwise.
+        """
+        return not self.execute_upsert_many(p_tbl_nm, [p_values])
 
     def execute_update(self, p_tbl_nm: str, p_key_val: str, p_values: tuple) -> bool:
         """
@@ -1014,20 +2129,22 @@ class DataBase(object):
         :param p_values: n-tuple of values to update.
         :return: True if update succeeds, False otherwise.
         """
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
-        SQL = self.get_sql_file(self.DML, f"UPDATE_{p_tbl_nm}")
-        try:
-            # Ensure p_key_val is added at the end for the WHERE clause
-            self.cur.execute(SQL, p_values + (p_key_val,))
-            self.db_conn.commit()
-            return True
-        except sq3.Error as e:
-            print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error in execute_update: {e}{DSC.CL_END}")
-            print(f"SQL: {SQL}")
-            print(f"p_values: {p_values}")
-            return False
-        finally:
-            self.disconnect_db()
+        with self._write_lock():
+            self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+            SQL = self.get_sql_file(self.DML, f"UPDATE_{p_tbl_nm}")
+            try:
+                # Ensure p_key_val is added at the end for the WHERE clause
+                self.cur.execute(SQL, p_values + (p_key_val,))
+                self.db_conn.commit()
+                self._notify_change(p_tbl_nm)
+                return True
+            except sq3.Error as e:
+                print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error in execute_update: {e}{DSC.CL_END}")
+                print(f"SQL: {SQL}")
+                print(f"p_values: {p_values}")
+                return False
+            finally:
+                self.disconnect_db()
 
     def execute_delete(self, p_sql_nm: str, p_key_val: str) -> bool:
         """
@@ -1042,19 +2159,21 @@ class DataBase(object):
         - May need to set p_foreign_keys_on to False?
         - Will delete-cascade logic work in SQLite? Test this.
         """
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
-        SQL = self.get_sql_file(self.DDL, p_sql_nm)
-        try:
-            self.cur.execute(SQL, (p_key_val,))
-            self.db_conn.commit()
-            return True
-        except sq3.Error as e:
-            print(f"Error in execute_delete: {e}")
-            print(f"SQL: {SQL}")
-            print(f"PK: {p_key_val}")
-            return False
-        finally:
-            self.disconnect_db()
+        with self._write_lock():
+            self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+            SQL = self.get_sql_file(self.DDL, p_sql_nm)
+            try:
+                self.cur.execute(SQL, (p_key_val,))
+                self.db_conn.commit()
+                self._notify_change(p_sql_nm.upper().removeprefix("DELETE_"))
+                return True
+            except sq3.Error as e:
+                print(f"Error in execute_delete: {e}")
+                print(f"SQL: {SQL}")
+                print(f"PK: {p_key_val}")
+                return False
+            finally:
+                self.disconnect_db()
 
     def get_check_constraint_values(self, p_tbl_nm: str, p_col_nm: str) -> list:
         """
@@ -1065,7 +2184,7 @@ class DataBase(object):
         :param p_col_nm: Name of the column to check.
         :return: List of valid CHECK constraint values or an empty list if none are found.
         """
-        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True, p_read_only=True)
         try:
             self.cur.execute(
                 "SELECT sql FROM sqlite_master WHERE type='table' AND name=?;",
@@ -1091,47 +2210,165 @@ class DataBase(object):
     # Backup, Archive and Restore
     # ===========================================
 
-    def archive_db(self, p_db: str):
-        """
-        Copy a DB file to archive location.
-        - The DB being archived might be main or backup.
-
-        :param p_db: Path to database file to be archived.
+    def _log_backup(self, p_bkup_type: str, p_dttm: str, p_from: str, p_to: str):
+        """'PRIVATE'
+        Record a backup, archive or restore in the BACKUP table.
         """
-        # Generate a timestamp for the archive operation
-        arcv_dttm = pendulum.now().format("YYYYMMDD_HHmmss")
-        arcv_nm = p_db.replace(".db", "_") + arcv_dttm + ".arcv"
-
-        # Perform the insert operation for the archive metadata
         self.execute_insert(
             "BACKUP",
             (
                 SM.get_uid(),
-                f"Archive {arcv_dttm}",
-                arcv_dttm,
-                "archive",
-                str(p_db),
-                arcv_nm,
+                f"{p_bkup_type.capitalize()} {p_dttm}",
+                p_dttm,
+                p_bkup_type,
+                str(p_from),
+                str(p_to),
                 "",
             ),
         )
 
+    def _backup_pages(self, p_db: str, p_dest: str, p_progress=None):
+        """'PRIVATE'
+        Copy a live DB to a new single-file DB with the sqlite3 backup API.
+        Pages are copied db_backup_pages at a time, so writers are only
+        locked out for one step at a time, and a source that changes
+        mid-copy is re-read by SQLite rather than copied torn. The copy
+        is written next to p_dest and moved into place when complete.
+        :param p_db: Path to the DB to copy.
+        :param p_dest: Path of the copy.
+        :param p_progress: Optional callable(copied_pages, total_pages).
+        """
+        is_main = path.abspath(p_db) == path.abspath(self.SASKAN_DB)
+        if is_main:
+            pool = self.get_pool(self.SASKAN_DB, p_read_only=True)
+            src = pool.acquire()
+        else:
+            src = sq3.connect(f"{Path(p_db).resolve().as_uri()}?mode=ro", uri=True)
+        tmp_dest = f"{p_dest}.tmp"
+        Path(tmp_dest).unlink(missing_ok=True)
+        dest = sq3.connect(tmp_dest)
+
+        def on_step(status, remaining, total):
+            if p_progress is not None:
+                p_progress(total - remaining, total)
+
+        try:
+            src.backup(dest, pages=max(1, int(self.BACKUP_PAGES)), progress=on_step)
+            dest.execute("PRAGMA journal_mode = DELETE;")
+        finally:
+            dest.close()
+            if is_main:
+                pool.release(src)
+            else:
+                src.close()
+        Path(tmp_dest).replace(p_dest)
+
+    def _compress_file(self, p_from: str, p_to_stem: str) -> str:
+        """'PRIVATE'
+        Compress a file with zstd or gzip, per db_archive_compress.
+        zstd needs the zstandard package; without it, gzip is used.
+        :param p_from: Path of the file to compress. It is removed afterwards.
+        :param p_to_stem: Path of the compressed file, minus its suffix.
+        :return: Path of the compressed file.
+        """
+        method = self.ARCHIVE_COMPRESS
+        if method == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                print(f"{DSC.CL_YELLOW}zstandard is not installed; " +
+                      f"using gzip{DSC.CL_END}")
+                method = "gzip"
+        with open(p_from, "rb") as f_in:
+            if method == "zstd":
+                to_path = f"{p_to_stem}.zst"
+                with open(to_path, "wb") as f_out, \
+                        zstandard.ZstdCompressor().stream_writer(f_out) as z_out:
+                    shutil.copyfileobj(f_in, z_out)
+            else:
+                to_path = f"{p_to_stem}.gz"
+                with gzip.open(to_path, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+        Path(p_from).unlink()
+        return to_path
+
+    def _decompress_file(self, p_from: str, p_to: str):
+        """'PRIVATE'
+        Decompress a .gz or .zst archive to a plain DB file.
+        :param p_from: Path of the compressed file.
+        :param p_to: Path of the decompressed file.
+        """
+        if p_from.endswith(".zst"):
+            import zstandard
+            with open(p_from, "rb") as f_in, open(p_to, "wb") as f_out:
+                zstandard.ZstdDecompressor().copy_stream(f_in, f_out)
+        else:
+            with gzip.open(p_from, "rb") as f_in, open(p_to, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+    def archive_db(self, p_db: str, p_progress=None) -> str:
+        """
+        Copy a DB file to archive location.
+        - The DB being archived might be main or backup.
+        - The copy is made online with the backup API, see _backup_pages.
+        - The archive is compressed if db_archive_compress is gzip or zstd.
+        - Older archives of the same DB beyond db_archive_keep are pruned.
+
+        :param p_db: Path to database file to be archived.
+        :param p_progress: Optional callable(copied_pages, total_pages).
+        :return: Path of the archive file.
+        """
+        # Generate a timestamp for the archive operation
+        arcv_dttm = pendulum.now().format("YYYYMMDD_HHmmss")
+        arcv_nm = str(p_db).replace(".db", "_") + arcv_dttm + ".arcv"
+
         # Copy the specified database file to the archive location
-        shutil.copyfile(p_db, arcv_nm)
+        self._backup_pages(p_db, arcv_nm, p_progress)
+        if self.ARCHIVE_COMPRESS in ("gzip", "zstd"):
+            arcv_nm = self._compress_file(arcv_nm, arcv_nm)
+
+        # Perform the insert operation for the archive metadata
+        self._log_backup("archive", arcv_dttm, p_db, arcv_nm)
+        self.prune_archives(p_db)
+        return arcv_nm
 
-    def backup_db(self, p_db: str, p_bak: str):
+    def prune_archives(self, p_db: str, p_keep: int = -1) -> list:
+        """
+        Delete the oldest archives of a DB, keeping the newest ones.
+        Archive names sort by their timestamp, so name order is age order.
+        :param p_db: Path to the database file the archives were made from.
+        :param p_keep: Number of archives to keep. Defaults to db_archive_keep;
+            0 or less keeps all of them.
+        :return: List of paths of the deleted archives.
+        """
+        keep = self.ARCHIVE_KEEP if p_keep < 0 else p_keep
+        if keep <= 0:
+            return []
+        prefix = Path(str(p_db).replace(".db", "_")).name
+        arcv_dir = Path(p_db).parent
+        archives = sorted(
+            arcv for arcv in arcv_dir.glob(f"{prefix}*.arcv*")
+            if not arcv.name.endswith(".tmp"))
+        pruned = [str(arcv) for arcv in archives[:-keep]]
+        for arcv in pruned:
+            Path(arcv).unlink(missing_ok=True)
+        return pruned
+
+    def backup_db(self, p_db: str, p_bak: str, p_progress=None):
         """
         Copy specified DB file to backup location.
         Generally this would be the main DB to a backup DB.
         - There is only ever one backup file.
         - The existing backup is overwritten. If desired, archive the backup
           before backing up the main DB.
+        - The copy is made online with the backup API, see _backup_pages,
+          so the app can keep using the DB meanwhile.
 
         :param p_db: Path to specified database file
         :param p_bak: Path to backup database file
+        :param p_progress: Optional callable(copied_pages, total_pages).
 
         @DEV:
-        - May want to add a check to see if the backup file exists
         - Under some initial conditions this method could be called before
           the backup table is created. In this case we either need to create
           the backup table skip writing to it.
@@ -1140,47 +2377,136 @@ class DataBase(object):
         bkup_dttm = pendulum.now().format("YYYYMMDD_HHmmss")
 
         # Perform the insert operation for the backup metadata
-        self.execute_insert(
-            "BACKUP",
-            (
-                SM.get_uid(),
-                f"Backup {bkup_dttm}",
-                bkup_dttm,
-                "backup",
-                str(p_db),
-                p_bak,
-                "",
-            ),
-        )
+        self._log_backup("backup", bkup_dttm, p_db, p_bak)
 
         # Copy the specified database file to the backup location
-        shutil.copyfile(p_db, p_bak)
+        self._backup_pages(p_db, p_bak, p_progress)
+
+    def _replace_main_db(self, p_from: str, p_progress=None):
+        """'PRIVATE'
+        Replace the main DB with a copy of another DB file.
+        The copy is made beside the main DB and checked with
+        PRAGMA integrity_check, then moved over it in one step. Pooled
+        handles and the WAL of the old file are dropped only after that,
+        so a failed copy leaves the main DB as it was.
+        :param p_from: Path to an uncompressed DB file.
+        :param p_progress: Optional callable(copied_pages, total_pages).
+        :raises sq3.DatabaseError: If the copy fails the integrity check.
+        """
+        tmp_db = f"{self.SASKAN_DB}.new"
+        try:
+            self._backup_pages(p_from, tmp_db, p_progress)
+            conn = sq3.connect(tmp_db)
+            try:
+                check = conn.execute("PRAGMA integrity_check;").fetchall()
+            finally:
+                conn.close()
+            if check != [("ok",)]:
+                raise sq3.DatabaseError(
+                    f"Integrity check failed on copy of {p_from}: {check[:5]}")
+            with self._write_lock():
+                # Pooled handles and the WAL must not outlive the file they belong to
+                self.close_pool()
+                Path(tmp_db).replace(self.SASKAN_DB)
+                self.remove_wal_files()
+        finally:
+            Path(tmp_db).unlink(missing_ok=True)
+            self._notify_change(None)
 
-    def restore_db(self, p_restore: str):
+    def restore_db(self, p_restore: str, p_progress=None):
         """
         Copy a backed up or archived DB file to main location.
+        Compressed archives (.gz, .zst) are decompressed first.
+        The restore is recorded in the restored DB's BACKUP table.
 
         :param p_restore: Path to specified database file to restore from
-
-        @DEV:
-        - May need to add checks for existence of files and the backup table.
+        :param p_progress: Optional callable(copied_pages, total_pages).
         """
         # Generate a timestamp for the restore operation
         restore_dttm = pendulum.now().format("YYYYMMDD_HHmmss")
 
+        # Copy the specified database file to the main database location
+        if str(p_restore).endswith((".gz", ".zst")):
+            plain = f"{self.SASKAN_DB}.restore"
+            self._decompress_file(str(p_restore), plain)
+            try:
+                self._replace_main_db(plain, p_progress)
+            finally:
+                Path(plain).unlink(missing_ok=True)
+        else:
+            self._replace_main_db(p_restore, p_progress)
+
         # Perform the insert operation for the restore metadata
-        self.execute_insert(
-            "BACKUP",
-            (
-                SM.get_uid(),
-                f"Restore {restore_dttm}",
-                restore_dttm,
-                "restore",
-                p_restore,
-                self.DB,
-                "",
-            ),
-        )
+        self._log_backup("restore", restore_dttm, p_restore, self.SASKAN_DB)
 
-        # Copy the specified database file to the main database location
-        shutil.copyfile(p_restore, self.DB)
+    # Snapshots
+    # ===========================================
+    def get_user_version(self, p_db_nm: str = "") -> int:
+        """
+        Read the schema version stamped on a DB file by create_db.
+        :param p_db_nm: Path to the DB file. Defaults to the main DB.
+        :return: PRAGMA user_version of the file; 0 if not stamped.
+        """
+        conn = sq3.connect(f"{Path(p_db_nm or self.SASKAN_DB).resolve().as_uri()}?mode=ro",
+                           uri=True)
+        try:
+            return conn.execute("PRAGMA user_version;").fetchone()[0]
+        finally:
+            conn.close()
+
+    def set_user_version(self):
+        """Stamp the main DB with the current schema version."""
+        self.connect_db(self.SASKAN_DB, p_foreign_keys_on=True)
+        try:
+            self.cur.execute(f"PRAGMA user_version = {self.schema_user_version};")
+        finally:
+            self.disconnect_db()
+
+    def save_snapshot(self, p_snapshot: str = "") -> bool:
+        """
+        Copy the main DB to a snapshot file with the sqlite3 backup API.
+        The snapshot is a single, compacted file in rollback-journal mode,
+        stamped with the schema version of the DB it was taken from.
+        :param p_snapshot: Path to the snapshot file. Defaults to saskan_snapshot.
+        :return: True if successful, False otherwise.
+        """
+        snapshot = p_snapshot or self.SASKAN_SNAPSHOT
+        try:
+            self._backup_pages(self.SASKAN_DB, snapshot)
+            dest = sq3.connect(snapshot)
+            try:
+                dest.execute("VACUUM;")
+            finally:
+                dest.close()
+            return True
+        except sq3.Error as e:
+            print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error saving snapshot: {e}{DSC.CL_END}")
+            return False
+
+    def load_snapshot(self, p_snapshot: str = "") -> bool:
+        """
+        Replace the main DB with a snapshot, using the sqlite3 backup API.
+        The snapshot must carry the same schema version as the current
+        schema bundle; otherwise nothing is changed. An existing main DB
+        is first backed up to saskan_bak.
+        :param p_snapshot: Path to the snapshot file. Defaults to saskan_snapshot.
+        :return: True if the snapshot was loaded, False otherwise.
+        """
+        snapshot = p_snapshot or self.SASKAN_SNAPSHOT
+        if not path.isfile(snapshot):
+            print(f"{DSC.CL_YELLOW}No snapshot at {snapshot}{DSC.CL_END}")
+            return False
+        snap_version = self.get_user_version(snapshot)
+        if snap_version == 0 or snap_version != self.schema_user_version:
+            print(f"{DSC.CL_YELLOW}Snapshot schema version {snap_version:07x} does not " +
+                  f"match schema bundle {self.schema_user_version:07x}{DSC.CL_END}")
+            return False
+
+        try:
+            if path.isfile(self.SASKAN_DB):
+                self.backup_db(self.SASKAN_DB, self.SASKAN_BAK)
+            self._replace_main_db(snapshot)
+            return True
+        except sq3.Error as e:
+            print(f"{DSC.CL_RED}{DSC.CL_BOLD}Error loading snapshot: {e}{DSC.CL_END}")
+            return False
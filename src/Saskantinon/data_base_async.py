@@ -0,0 +1,210 @@
+"""
+
+:module:    data_base_async.py
+:class:     AsyncDataBase/0
+:author:    GM (genuinemerit @ pm.me)
+
+Non-blocking front end to the DataBase class.
+
+All SQLite work runs on one dedicated worker thread, fed by a bounded
+queue. asyncio code (e.g. msg_server) awaits the mirrored execute_*
+methods. Synchronous loops that must not stall, like the pygame main
+loop, call submit() and poll the returned Future once per frame.
+"""
+
+import asyncio
+import threading
+import time
+
+from concurrent.futures import Future
+from data_base import DataBase
+from method_files import FileMethods
+from queue import Full, Queue
+from pprint import pprint as pp  # noqa: F401
+
+FM = FileMethods()
+
+
+class AsyncDataBase(object):
+    """
+    Run DataBase calls on a worker thread with a bounded job queue.
+    Usage:
+        ADB = AsyncDataBase()
+        rows = await ADB.execute_select_all_clean("GALAXY")
+        ok = await ADB.execute_insert("TEXTS", (uid, (...)))
+        await ADB.aclose()
+    or, from a non-async loop:
+        job = ADB.submit("execute_select_all", "STAR_SYSTEM")
+        ...
+        if job.done():
+            rows = job.result()
+    """
+
+    def __init__(self, p_context: dict = None, p_queue_size: int = 0):
+        """
+        Initialize the DataBase object and start the worker thread.
+        :param p_context: Context dict. Defaults to static/context/context.json.
+        :param p_queue_size: Max jobs waiting to run. Defaults to the
+            db_queue_size context setting.
+        """
+        context = p_context or FM.get_json_file("static/context/context.json")
+        self.DB = DataBase(context)
+        self.queue_size = max(1, int(p_queue_size or context.get("db_queue_size", 64)))
+        self._jobs: Queue = Queue(maxsize=self.queue_size)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        # Signalled by the worker each time it takes a job off the queue
+        self._room = threading.Condition(self._close_lock)
+        self._worker = threading.Thread(
+            target=self._run, name="AsyncDataBase", daemon=True
+        )
+        self._worker.start()
+
+    # Worker thread
+    # ===========================================
+    def _run(self):
+        """'PRIVATE'
+        Run queued jobs in order until the stop sentinel (None) arrives.
+        Any job still queued behind the sentinel gets a RuntimeError.
+        """
+        while (job := self._jobs.get()) is not None:
+            with self._room:
+                self._room.notify_all()
+            future, method_nm, args, kwargs = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(getattr(self.DB, method_nm)(*args, **kwargs))
+                except BaseException as err:
+                    future.set_exception(err)
+        self.DB.disconnect_db()
+        while not self._jobs.empty():
+            job = self._jobs.get_nowait()
+            if job is not None and job[0].set_running_or_notify_cancel():
+                job[0].set_exception(RuntimeError("AsyncDataBase is closed."))
+
+    def submit(self, p_method_nm: str, *args, p_block: bool = True,
+               p_timeout: float = None, **kwargs) -> Future:
+        """
+        Queue a DataBase method call to run on the worker thread.
+        :param p_method_nm: Name of a public DataBase method.
+        :param args: Positional arguments for the method.
+        :param p_block: If False, raise queue.Full at once when the queue is full.
+        :param p_timeout: Seconds to wait for room in the queue; None waits forever.
+        :param kwargs: Keyword arguments for the method.
+        :raises RuntimeError: If the facade is closed.
+        :raises AttributeError: If DataBase has no such public method.
+        :raises queue.Full: If no room frees up in time.
+        :return: concurrent.futures.Future holding the method's result.
+        """
+        if p_method_nm.startswith("_") or not callable(getattr(self.DB, p_method_nm)):
+            raise AttributeError(f"Not a public DataBase method: {p_method_nm}")
+        future: Future = Future()
+        self._put((future, p_method_nm, args, kwargs), p_block, p_timeout)
+        return future
+
+    def _put(self, p_job: tuple, p_block: bool, p_timeout: float):
+        """'PRIVATE'
+        Put a job on the queue, waiting for room if p_block is True.
+        _closed is checked and the job queued under the close lock, so no
+        job can land behind the stop sentinel and be left unresolved. The
+        lock is released while waiting for room, so a blocked caller never
+        holds up a non-blocking one, or close().
+        """
+        deadline = None if p_timeout is None else time.monotonic() + p_timeout
+        with self._room:
+            while True:
+                if self._closed:
+                    raise RuntimeError("AsyncDataBase is closed.")
+                try:
+                    self._jobs.put_nowait(p_job)
+                    return
+                except Full:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not p_block or (remaining is not None and remaining <= 0):
+                        raise
+                    self._room.wait(remaining)
+
+    async def _call(self, p_method_nm: str, *args, **kwargs):
+        """'PRIVATE'
+        Queue a call and await its result without blocking the event loop.
+        If the queue is full, wait for room in a helper thread.
+        """
+        try:
+            future = self.submit(p_method_nm, *args, p_block=False, **kwargs)
+        except Full:
+            future = await asyncio.to_thread(self.submit, p_method_nm, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    # Awaitable DataBase methods
+    # ===========================================
+    async def execute_select_all(self, p_table_nm: str, p_result_format: str = "dict"):
+        """Awaitable DataBase.execute_select_all."""
+        return await self._call("execute_select_all", p_table_nm, p_result_format)
+
+    async def execute_select_all_clean(self, p_table_nm: str,
+                                       p_result_format: str = "dict"):
+        """Awaitable DataBase.execute_select_all_clean."""
+        return await self._call("execute_select_all_clean", p_table_nm, p_result_format)
+
+    async def execute_select_by_match(self, p_table_nm: str, p_match: dict,
+                                      p_first_only: bool = False) -> list:
+        """Awaitable DataBase.execute_select_by_match."""
+        return await self._call(
+            "execute_select_by_match", p_table_nm, p_match, p_first_only)
+
+    async def execute_select_by(self, p_dmo: object, p_pk_value: str) -> dict:
+        """Awaitable DataBase.execute_select_by."""
+        return await self._call("execute_select_by", p_dmo, p_pk_value)
+
+    async def select_columnar(self, p_table_nm: str, p_batch_size: int = 0,
+                              p_clean: bool = False):
+        """Awaitable DataBase.select_columnar."""
+        return await self._call("select_columnar", p_table_nm, p_batch_size, p_clean)
+
+    async def execute_insert(self, p_tbl_nm: str, p_values: tuple) -> bool:
+        """Awaitable DataBase.execute_insert."""
+        return await self._call("execute_insert", p_tbl_nm, p_values)
+
+    async def execute_insert_many(self, p_tbl_nm: str, p_rows,
+                                  p_chunk_size: int = 0) -> list:
+        """Awaitable DataBase.execute_insert_many."""
+        return await self._call("execute_insert_many", p_tbl_nm, p_rows, p_chunk_size)
+
+    async def execute_update(self, p_tbl_nm: str, p_key_val: str,
+                             p_values: tuple) -> bool:
+        """Awaitable DataBase.execute_update."""
+        return await self._call("execute_update", p_tbl_nm, p_key_val, p_values)
+
+    async def execute_delete(self, p_sql_nm: str, p_key_val: str) -> bool:
+        """Awaitable DataBase.execute_delete."""
+        return await self._call("execute_delete", p_sql_nm, p_key_val)
+
+    # Shutdown
+    # ===========================================
+    def close(self, p_wait: bool = True):
+        """
+        Stop accepting jobs and stop the worker once the queue drains.
+        Jobs queued before close() still run. Callers still waiting for
+        room in the queue get a RuntimeError.
+        :param p_wait: If True, block until the worker has finished.
+        """
+        with self._room:
+            if self._closed:
+                return
+            self._closed = True
+            self._room.notify_all()
+        # No job can be queued once _closed is set, so the sentinel is
+        # last; wait for room for it outside the lock.
+        self._jobs.put(None)
+        if p_wait:
+            self._worker.join()
+
+    async def aclose(self):
+        """Awaitable close(); waits for queued jobs in a helper thread."""
+        await asyncio.to_thread(self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
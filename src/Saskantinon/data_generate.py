@@ -0,0 +1,366 @@
+"""
+
+:module:    data_generate.py
+:class:     GenerateWorld/0
+:author:    GM (genuinemerit @ pm.me)
+
+Seeded generator of synthetic story data, for load testing.
+
+Builds a whole world from the story data models: a universe with its
+galaxies, star systems, worlds and moons; a language with a glossary;
+a map with a grid of cells; towns in the grid; and lakes, rivers, ocean
+and land bodies, each linked to the map and to a grid cell in CROSS_X.
+Values in CHECK-constrained columns are drawn from the model's
+EntityType lists.
+
+All rows are loaded with DataBase.execute_insert_many, in FK order.
+Grid cells are streamed, never held in memory all at once, and every
+UID is derived from the seed, so a cell's UID is computed rather than
+looked up. The same seed and size always give the same world.
+
+To generate a world into the DB named in the context, run from the
+project root / top-level directory:
+    `python src/Saskantinon/data_generate.py --size medium --seed 7`
+"""
+
+import random
+import sys
+import time
+import uuid
+
+from collections import OrderedDict
+from data_base import DataBase
+from data_structs import Colors
+from method_files import FileMethods
+from pprint import pprint as pp  # noqa: F401
+
+import data_model as DM
+import data_model_story as DMS
+
+FM = FileMethods()
+
+
+class GenerateWorldError(Exception):
+    """Custom error class for GenerateWorld errors."""
+    pass
+
+
+class GenerateWorld(object):
+    """
+    Generate and load a synthetic world of a chosen size.
+    Usage:
+        GW = GenerateWorld(p_seed=7, p_size="large")
+        row_counts = GW.generate()
+    Any size setting can be overridden, e.g. GenerateWorld(p_grid_x=2000).
+    """
+
+    # Per galaxy: star_systems; per star system: up to `worlds` worlds;
+    # per world: up to `moons` moons. Grid cells = grid_x * grid_y * grid_z.
+    SIZES = {
+        "small": {
+            "galaxies": 1, "star_systems": 20, "worlds": 6, "moons": 3,
+            "grid_x": 100, "grid_y": 100, "grid_z": 1, "towns": 100,
+            "lakes": 50, "rivers": 50, "ocean_bodies": 10, "land_bodies": 10,
+            "dialects": 3, "glosses": 200,
+        },
+        "medium": {
+            "galaxies": 2, "star_systems": 200, "worlds": 8, "moons": 4,
+            "grid_x": 500, "grid_y": 500, "grid_z": 2, "towns": 2000,
+            "lakes": 1000, "rivers": 1000, "ocean_bodies": 100, "land_bodies": 100,
+            "dialects": 5, "glosses": 2000,
+        },
+        "large": {
+            "galaxies": 4, "star_systems": 1000, "worlds": 10, "moons": 6,
+            "grid_x": 1000, "grid_y": 1000, "grid_z": 3, "towns": 10000,
+            "lakes": 5000, "rivers": 5000, "ocean_bodies": 500, "land_bodies": 500,
+            "dialects": 8, "glosses": 10000,
+        },
+    }
+    SYLLABLES = [
+        "sa", "ska", "ran", "tin", "on", "se", "la", "ron", "mo", "ril", "ly",
+        "wil", "da", "win", "ga", "vor", "ha", "vo", "rra", "ka", "ta", "nob",
+        "thwa", "yu", "za", "twa", "el", "ar", "is", "dor", "mer", "en", "ul",
+    ]
+
+    def __init__(self, p_seed: int = 42, p_size: str = "small",
+                 p_context: dict = None, **p_scale):
+        """
+        :param p_seed: Seed for all random values and UIDs.
+        :param p_size: small, medium or large.
+        :param p_context: Context dict. Defaults to static/context/context.json.
+        :param p_scale: Overrides of the size settings, prefixed with p_,
+            e.g. p_grid_x=2000.
+        :raises GenerateWorldError: If the size or a size setting is unknown.
+        """
+        if p_size not in self.SIZES:
+            raise GenerateWorldError(f"Unknown world size: {p_size}")
+        self.scale = dict(self.SIZES[p_size])
+        for key, value in p_scale.items():
+            if key[2:] not in self.scale:
+                raise GenerateWorldError(f"Unknown size setting: {key}")
+            self.scale[key[2:]] = int(value)
+        self.seed = p_seed
+        self.rng = random.Random(p_seed)
+        self.uid_space = uuid.uuid5(uuid.NAMESPACE_URL, f"saskan:generate:{p_seed}")
+        self.DB = DataBase(p_context or FM.get_json_file("static/context/context.json"))
+        self.row_counts: OrderedDict = OrderedDict()
+        self.grid_id = (f"gen_{p_seed}_{self.scale['grid_x']}x_" +
+                        f"{self.scale['grid_y']}y_{self.scale['grid_z']}z")
+
+    # Helpers
+    # ===========================================
+    def _uid(self, *p_key) -> str:
+        """'PRIVATE'
+        Derive a UID from the seed and a key, e.g. ("cell", x, y, z).
+        """
+        return uuid.uuid5(self.uid_space, ":".join(str(k) for k in p_key)).hex
+
+    def _name(self, p_min: int = 2, p_max: int = 3) -> str:
+        """'PRIVATE'
+        Make up a name from random syllables.
+        """
+        return "".join(self.rng.choice(self.SYLLABLES)
+                       for _ in range(self.rng.randint(p_min, p_max))).capitalize()
+
+    def _row(self, p_model: object, p_values: dict) -> tuple:
+        """'PRIVATE'
+        Build a row in table-column order: model defaults, then a random
+        allowed value for each CHECK-constrained column, then p_values.
+        """
+        schema = DM.get_schema(p_model)
+        row = dict(zip(schema.cols, schema.defaults))
+        for col, allowed in getattr(p_model.Constraints, "CK", {}).items():
+            row[col] = self.rng.choice(allowed)
+        row.update(p_values)
+        return tuple(row[col] for col in schema.cols)
+
+    def _load(self, p_model: object, p_rows):
+        """'PRIVATE'
+        Bulk-load rows (any iterable) into a model's table and count them.
+        :raises GenerateWorldError: If any chunk fails to load.
+        """
+        tbl_nm = p_model._tablename
+        counted = self._count(tbl_nm, p_rows)
+        chunk_errors = self.DB.execute_insert_many(tbl_nm, counted)
+        if chunk_errors:
+            raise GenerateWorldError(f"{Colors.CL_RED}Error loading {tbl_nm}{Colors.CL_END}: " +
+                                     "; ".join(err["error"] for err in chunk_errors))
+        print(f"{Colors.CL_DARKCYAN}{tbl_nm}: {self.row_counts[tbl_nm]} rows{Colors.CL_END}")
+
+    def _count(self, p_tbl_nm: str, p_rows):
+        """'PRIVATE'
+        Pass rows through, counting them in self.row_counts.
+        """
+        self.row_counts[p_tbl_nm] = 0
+        for row in p_rows:
+            self.row_counts[p_tbl_nm] += 1
+            yield row
+
+    # Language and glossary
+    # ===========================================
+    def gen_language(self):
+        """
+        Generate a character set, a language family, one language with
+        its dialects, and common glossary terms with a glossary entry per
+        dialect.
+        """
+        char_set_uid = self._uid("char_set")
+        self._load(DMS.CharSet, [self._row(DMS.CharSet, {
+            "char_set_uid_pk": char_set_uid,
+            "font_name": f"gen_{self.seed}_font",
+            "char_set_desc": "Generated character set"})])
+        family_uid = self._uid("lang_family")
+        self._load(DMS.LangFamily, [self._row(DMS.LangFamily, {
+            "lang_family_uid_pk": family_uid, "char_set_uid_fk": char_set_uid,
+            "lang_family_name": f"{self._name()} Family"})])
+        lang_uid = self._uid("language")
+        self._load(DMS.Language, [self._row(DMS.Language, {
+            "lang_uid_pk": lang_uid, "lang_family_uid_fk": family_uid,
+            "lang_name": self._name()})])
+        dialect_uids = [self._uid("dialect", ix) for ix in range(self.scale["dialects"])]
+        self._load(DMS.LangDialect, [self._row(DMS.LangDialect, {
+            "dialect_uid_pk": uid, "lang_uid_fk": lang_uid,
+            "dialect_name": f"{self._name()} Dialect"}) for uid in dialect_uids])
+        self.gloss_uids = [self._uid("gloss", ix) for ix in range(self.scale["glosses"])]
+        gloss_names = [self._name() for _ in self.gloss_uids]
+        self._load(DMS.GlossCommon, [self._row(DMS.GlossCommon, {
+            "gloss_common_uid_pk": uid, "dialect_uid_fk": dialect_uids[0],
+            "gloss_type": "word", "gloss_name": name, "gloss_value": name.lower()})
+            for uid, name in zip(self.gloss_uids, gloss_names)])
+        self._load(DMS.Glossary, (self._row(DMS.Glossary, {
+            "glossary_uid_pk": self._uid("glossary", gloss_uid, dialect_uid),
+            "gloss_common_uid_fk": gloss_uid, "dialect_uid_fk": dialect_uid,
+            "gloss_type": "word", "gloss_name": name,
+            "gloss_value": f"{name.lower()}{self.rng.choice(self.SYLLABLES)}"})
+            for gloss_uid, name in zip(self.gloss_uids, gloss_names)
+            for dialect_uid in dialect_uids))
+
+    # Astronomy
+    # ===========================================
+    def gen_astro(self):
+        """
+        Generate a universe, one galactic cluster, its galaxies, their
+        star systems, and the worlds and moons of each star system.
+        """
+        rng = self.rng
+        univ_uid = self._uid("universe")
+        self._load(DMS.Universe, [self._row(DMS.Universe, {
+            "univ_uid_pk": univ_uid, "univ_name": f"{self._name()} Universe",
+            "radius_gly": 46.5, "age_gyr": 13.8, "expansion_rate_kmpsec_per_mpc": 70.0})])
+        cluster_uid = self._uid("cluster")
+        self._load(DMS.GalacticCluster, [self._row(DMS.GalacticCluster, {
+            "galactic_cluster_uid_pk": cluster_uid, "univ_uid_fk": univ_uid,
+            "galactic_cluster_name": f"{self._name()} Cluster"})])
+        galaxy_uids = [self._uid("galaxy", ix) for ix in range(self.scale["galaxies"])]
+        self._load(DMS.Galaxy, [self._row(DMS.Galaxy, {
+            "galaxy_uid_pk": uid, "galactic_cluster_uid_fk": cluster_uid,
+            "galaxy_name": f"{self._name()} Galaxy",
+            "halo_radius_pc": rng.uniform(1e4, 1e5),
+            "mass_kg": rng.uniform(1e41, 1e43)}) for uid in galaxy_uids])
+        systems = [(self._uid("star_system", g_ix, s_ix), g_uid)
+                   for g_ix, g_uid in enumerate(galaxy_uids)
+                   for s_ix in range(self.scale["star_systems"])]
+        self._load(DMS.StarSystem, [self._row(DMS.StarSystem, {
+            "star_system_uid_pk": uid, "galaxy_uid_fk": g_uid,
+            "star_system_name": self._name(),
+            "mass_kg": rng.uniform(1e29, 1e32),
+            "aprox_age_gyr": rng.uniform(0.1, 13.0),
+            "center_from_galaxy_center_pc_x": rng.uniform(-3e4, 3e4),
+            "center_from_galaxy_center_pc_y": rng.uniform(-3e4, 3e4),
+            "center_from_galaxy_center_pc_z": rng.uniform(-1e3, 1e3),
+            "inner_habitable_boundary_au": rng.uniform(0.5, 1.0),
+            "outer_habitable_boundary_au": rng.uniform(1.2, 2.5)}) for uid, g_uid in systems])
+        worlds = [(self._uid("world", s_uid, w_ix), s_uid, rng.randint(0, self.scale["moons"]))
+                  for s_uid, _ in systems
+                  for w_ix in range(rng.randint(0, self.scale["worlds"]))]
+        world_rows: list = []
+        for uid, s_uid, moons_cnt in worlds:
+            radius_km = rng.uniform(2e3, 7e4)
+            world_rows.append(self._row(DMS.World, {
+                "world_uid_pk": uid, "star_system_uid_fk": s_uid,
+                "world_name": self._name(), "radius_km": radius_km,
+                "mass_kg": 5.97e24 * (radius_km / 6371.0) ** 3,
+                "distance_from_star_au": rng.uniform(0.2, 40.0),
+                "obliquity_dg": rng.uniform(0.0, 45.0),
+                "orbit_gdy": rng.uniform(50.0, 5e4),
+                "rotation_gdy": rng.uniform(0.3, 3.0),
+                "moons_cnt": moons_cnt}))
+        self._load(DMS.World, world_rows)
+        self._load(DMS.Moon, (self._row(DMS.Moon, {
+            "moon_uid_pk": self._uid("moon", w_uid, m_ix), "world_uid_fk": w_uid,
+            "moon_name": self._name(), "radius_km": rng.uniform(10.0, 2.6e3),
+            "center_from_world_center_km": rng.uniform(1e4, 2e6),
+            "orbit_world_days": rng.uniform(0.3, 200.0)})
+            for w_uid, _, moons_cnt in worlds for m_ix in range(moons_cnt)))
+
+    # Map and grid
+    # ===========================================
+    def gen_map_grid(self):
+        """
+        Generate a political map, a grid over it, every cell of the grid,
+        and town info for randomly chosen cells.
+        """
+        rng = self.rng
+        self.map_uid = self._uid("map_rect")
+        self._load(DMS.MapRect, [self._row(DMS.MapRect, {
+            "map_rect_uid_pk": self.map_uid, "map_shape": "rectangle",
+            "map_type": "political", "map_id": f"gen_{self.seed}_map", "lang_code": "en",
+            "map_name": f"{self._name()} Lands", "map_desc": "Generated map",
+            "north_lat": 40.0, "south_lat": 20.0, "east_lon": -80.0, "west_lon": -110.0})])
+        x_cnt, y_cnt, z_cnt = (self.scale["grid_x"], self.scale["grid_y"],
+                               self.scale["grid_z"])
+        self.grid_uid = self._uid("grid")
+        self._load(DMS.Grid, [self._row(DMS.Grid, {
+            "grid_uid_pk": self.grid_uid, "grid_id": self.grid_id,
+            "x_col_cnt": x_cnt, "y_row_cnt": y_cnt, "z_up_cnt": z_cnt - 1})])
+        self._load(DMS.GridCell, (self._row(DMS.GridCell, {
+            "grid_cell_uid_pk": self._uid("cell", x, y, z), "grid_uid_fk": self.grid_uid,
+            "grid_id": self.grid_id, "lang_code": "en", "grid_cell_name": f"Cell {x}.{y}.{z}",
+            "x_col_ix": x, "y_row_ix": y, "z_up_down_ix": z,
+            "grid_cell_id": f"{x}x_{y}y_{z}z"})
+            for z in range(z_cnt) for y in range(y_cnt) for x in range(x_cnt)))
+        town_cells = rng.sample(range(x_cnt * y_cnt),
+                                min(self.scale["towns"], x_cnt * y_cnt))
+        self._load(DMS.GridInfo, [self._row(DMS.GridInfo, {
+            "grid_info_uid_pk": self._uid("town", cell_ix),
+            "grid_uid_fk": self.grid_uid,
+            "grid_cell_uid_fk": self._uid("cell", cell_ix % x_cnt, cell_ix // x_cnt, 0),
+            "grid_id": self.grid_id, "grid_cell_name": f"Cell {cell_ix % x_cnt}." +
+            f"{cell_ix // x_cnt}.0", "grid_info_id": "town", "lang_code": "en",
+            "grid_info_name": f"{self._name()} Town",
+            "grid_info_int": int(rng.lognormvariate(7.0, 1.2))}) for cell_ix in town_cells])
+
+    # Geographic features
+    # ===========================================
+    def gen_features(self):
+        """
+        Generate lakes, rivers, ocean bodies and land bodies, named from
+        the glossary, and link each one in CROSS_X to the map (it is
+        contained by) and to a random grid cell (it overlaps).
+        """
+        rng = self.rng
+        links: list = []
+
+        def feature(p_tbl_nm: str, p_ix: int) -> dict:
+            uid = self._uid(p_tbl_nm, p_ix)
+            cell = (rng.randrange(self.scale["grid_x"]), rng.randrange(self.scale["grid_y"]), 0)
+            links.append((p_tbl_nm, uid, "MAP_RECT", self.map_uid, "is_contained_by"))
+            links.append((p_tbl_nm, uid, "GRID_CELL", self._uid("cell", *cell), "overlaps"))
+            return {f"{p_tbl_nm.lower()}_uid_pk": uid,
+                    "gloss_common_uid_vfk": rng.choice(self.gloss_uids)}
+
+        self._load(DMS.Lake, [self._row(DMS.Lake, {
+            **feature("LAKE", ix), "lake_name": f"Lake {self._name()}",
+            "lake_surface_m2": rng.lognormvariate(13.0, 2.0),
+            "max_depth_m": rng.uniform(2.0, 600.0), "avg_depth_m": rng.uniform(1.0, 100.0),
+            "lake_altitude_m": rng.uniform(-30.0, 3000.0)})
+            for ix in range(self.scale["lakes"])])
+        self._load(DMS.River, [self._row(DMS.River, {
+            **feature("RIVER", ix), "river_name": f"{self._name()} River",
+            "total_length_km": rng.lognormvariate(4.5, 1.0),
+            "avg_width_m": rng.uniform(2.0, 2000.0), "avg_depth_m": rng.uniform(0.5, 40.0),
+            "avg_velocity_m_per_h": rng.uniform(1e3, 1e4)})
+            for ix in range(self.scale["rivers"])])
+        self._load(DMS.OceanBody, [self._row(DMS.OceanBody, {
+            **feature("OCEAN_BODY", ix), "ocean_body_name": f"{self._name()} Sea",
+            "body_surface_area_m2": rng.lognormvariate(22.0, 2.0),
+            "max_depth_m": rng.uniform(50.0, 11000.0), "tidal_flows_per_day": 2})
+            for ix in range(self.scale["ocean_bodies"])])
+        self._load(DMS.LandBody, [self._row(DMS.LandBody, {
+            **feature("LAND_BODY", ix), "land_body_name": self._name(3, 4),
+            "land_body_surface_area_m2": rng.lognormvariate(24.0, 2.0),
+            "max_altitude_m": rng.uniform(100.0, 8800.0)})
+            for ix in range(self.scale["land_bodies"])])
+        self._load(DMS.CrossAssociation, [self._row(DMS.CrossAssociation, {
+            "cross_x_uid_pk": self._uid("cross_x", uid_1, uid_2),
+            "uid_1_table": tbl_1, "uid_1_vfk": uid_1, "uid_2_table": tbl_2,
+            "uid_2_vfk": uid_2, "touch_type": touch_type})
+            for tbl_1, uid_1, tbl_2, uid_2, touch_type in links])
+
+    # Run it all
+    # ===========================================
+    def generate(self) -> OrderedDict:
+        """
+        Generate and load the whole world.
+        :raises GenerateWorldError: If any table fails to load.
+        :return: OrderedDict of table name: rows loaded.
+        """
+        start = time.perf_counter()
+        self.gen_language()
+        self.gen_astro()
+        self.gen_map_grid()
+        self.gen_features()
+        print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}{sum(self.row_counts.values())} rows " +
+              f"generated in {time.perf_counter() - start:.3f} seconds{Colors.CL_END}")
+        return self.row_counts
+
+
+def _get_arg(p_flag: str, p_default: str) -> str:
+    """Return the value given after a command-line flag, or a default."""
+    if p_flag in sys.argv and sys.argv.index(p_flag) + 1 < len(sys.argv):
+        return sys.argv[sys.argv.index(p_flag) + 1]
+    return p_default
+
+
+if __name__ == "__main__":
+    GenerateWorld(int(_get_arg("--seed", "42")), _get_arg("--size", "small")).generate()
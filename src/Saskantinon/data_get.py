@@ -6,7 +6,10 @@
 Saskan Data Management middleware.
 """
 
+import threading
+
 from method_files import FileMethods
+from collections import OrderedDict
 from data_base import DataBase
 from data_structs import Colors as DSC
 from pprint import pformat as pf  # noqa: F401
@@ -19,6 +22,12 @@ class GetData:
     """
     Provide bespoke methods for reading data from the database.
     Generic DB IO methods are in the data_base module.
+
+    Results of get_by_match are kept in a size-bounded LRU cache keyed by
+    table plus match values. A table's entries are dropped whenever any
+    DataBase object writes to that table. Each write also bumps the
+    table's generation; a result read while the generation changed (a
+    write landed on another thread mid-read) is returned but not cached.
     """
 
     def __init__(self):
@@ -28,6 +37,96 @@ class GetData:
         self.CONTEXT = FM.get_json_file("static/context/context.json")
         self.USERDATA = FM.get_json_file("static/context/userdata.json")
         self.DB = DataBase(self.CONTEXT)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._generations: dict = {}
+        self.cache_size = self.CONTEXT.get("db_cache_size", 256)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        DataBase.add_change_listener(self.invalidate_cache)
+
+    # Read-through cache
+    # ===========================================
+    def _cache_get(self, p_key: tuple):
+        """
+        "PRIVATE" Look up a cached result and mark it most recently used.
+        :param p_key: Cache key
+        :return: Copy of the cached result, or None if not cached.
+        """
+        with self._cache_lock:
+            if p_key not in self._cache:
+                self.cache_misses += 1
+                return None
+            self.cache_hits += 1
+            self._cache.move_to_end(p_key)
+            data = self._cache[p_key]
+        # Hand out copies so callers cannot alter the cached rows.
+        return dict(data) if isinstance(data, dict) else [dict(row) for row in data]
+
+    def _cache_generation(self, p_table_nm: str) -> tuple:
+        """
+        "PRIVATE" Get the write generation of a table.
+        Read it before querying the DB and pass it to _cache_put.
+        :param p_table_nm: Name of the table
+        :return: (generation of all tables, generation of this table)
+        """
+        with self._cache_lock:
+            return (self._generations.get(None, 0),
+                    self._generations.get(p_table_nm.upper(), 0))
+
+    def _cache_put(self, p_key: tuple, p_data, p_generation: tuple):
+        """
+        "PRIVATE" Store a result, evicting the least recently used entries.
+        Nothing is stored if the table was written since p_generation
+        was read, since the result may predate that write.
+        :param p_key: Cache key
+        :param p_data: One row dict or a list of row dicts
+        :param p_generation: _cache_generation() read before the DB query
+        """
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            if p_generation != (self._generations.get(None, 0),
+                                self._generations.get(p_key[0], 0)):
+                return
+            self._cache[p_key] = (
+                dict(p_data) if isinstance(p_data, dict) else [dict(row) for row in p_data]
+            )
+            self._cache.move_to_end(p_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self.cache_evictions += 1
+
+    def invalidate_cache(self, p_table_nm: str = None):
+        """
+        Drop cached results for one table, or for all tables.
+        Registered with DataBase, so it runs after every insert, update,
+        delete or DDL call.
+        :param p_table_nm: Name of the changed table; None to clear everything.
+        """
+        with self._cache_lock:
+            tbl_nm = None if p_table_nm is None else p_table_nm.upper()
+            self._generations[tbl_nm] = self._generations.get(tbl_nm, 0) + 1
+            if p_table_nm is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == p_table_nm.upper()]:
+                    del self._cache[key]
+
+    def cache_stats(self) -> dict:
+        """
+        Report cache counters.
+        :return: Dict of hits, misses, evictions, current size and max size.
+        """
+        with self._cache_lock:
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "evictions": self.cache_evictions,
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+            }
 
     def _get_by_value(
         self, p_table_nm: str, p_match: dict, DB: object, p_first_only: bool = True
@@ -65,32 +164,46 @@ class GetData:
         :param p_first_only: Return only the first row that matches
         :return: List of non-ordered dicts of data from the table, or [], if no match
                  found or p_first_only is False; or one non-ordered dict if p_first_only is True
+        Matching is done in SQL with a parameterized WHERE clause, which
+        uses the table's IX indexes where one covers the matched columns.
+        Results are served from the read-through cache when possible.
         @DEV:
         - This logic will probably work for any number of matching columns, but let's keep
           it contained to 3 for now.
         """
-
-        def _match_values(data_rows, match_cols, match_vals):
-            rows = []
-            for row_num in range(len(data_rows[match_cols[0]])):
-                if all(
-                    data_rows[col][row_num] == val
-                    for col, val in zip(match_cols, match_vals)
-                ):
-                    row = {c_nm: c_val[row_num] for c_nm, c_val in data_rows.items()}
-                    rows.append(row)
-            return rows
-
-        data_rows = self.DB.execute_select_all_clean(p_table_nm)
-        match_cols, match_vals = list(p_match.keys()), list(p_match.values())
-
-        if len(match_cols) not in [1, 2, 3]:
+        if len(p_match) not in [1, 2, 3]:
             print(f"{DSC.CL_YELLOW}WARN{DSC.CL_END}: Can only match on 1, 2 or 3 values.")
             return []
 
-        data = _match_values(data_rows, match_cols, match_vals)
+        try:
+            cache_key = (p_table_nm.upper(), tuple(sorted(p_match.items())), p_first_only)
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+        if cache_key is not None:
+            data = self._cache_get(cache_key)
+            if data is not None:
+                return data[0] if p_first_only and data else data
+
+        generation = self._cache_generation(p_table_nm)
+        data = self.DB.execute_select_by_match(p_table_nm, p_match, p_first_only)
+        if cache_key is not None:
+            self._cache_put(cache_key, data, generation)
         return data[0] if p_first_only and data else data
 
+    def get_by_keys(self, p_table_nm: str, p_match_cols: list, p_keys) -> dict:
+        """
+        Get the rows for many keys at once, with one indexed query per chunk
+        of keys rather than one get_by_match call per key.
+        Results are not cached.
+        :param p_table_nm: Name of the table to query
+        :param p_match_cols: List of column names making up the key
+        :param p_keys: Iterable of key tuples (or plain values for a one-column key)
+        :return: Dict of key tuple: first matching non-deleted row.
+                 Keys with no match are left out.
+        """
+        return self.DB.execute_select_in(p_table_nm, p_match_cols, p_keys)
+
     def get_text(self, p_lang_code: str, p_text_id: str, DB_CFG: dict) -> str:
         """
         Specialized method to get text data from the TEXT_DATA table.
@@ -0,0 +1,356 @@
+"""
+
+:module:    data_migrate.py
+:class:     MigrateDB/0
+:author:    GM (genuinemerit @ pm.me)
+
+Schema migrations for an existing SASKAN database.
+
+The tables wanted by the current data models (the CREATE_* scripts in
+the schema bundle) are diffed with the live schema in sqlite_master.
+Each changed table gets the cheapest migration that will do:
+- create: the table does not exist yet.
+- add_columns: new columns were added to the model and nothing else
+  changed. ALTER TABLE ADD COLUMN only rewrites the schema, not the rows.
+  It always adds at the end, e.g. after delete_dt, so the table's column
+  order may then differ from the model's. Generated SQL names its
+  columns, so only the order of SELECT * results is affected.
+- copy_table: anything else (columns dropped, re-ordered or re-typed,
+  CHECK/FK/PK changes). The table is re-created under a scratch name,
+  shared columns are copied over, and it is renamed into place.
+- indexes: only the IX indexes changed.
+Unchanged tables are not touched, so the time taken depends on what
+changed, not on how much data the DB holds.
+
+All steps run in one transaction. Each applied step is recorded in
+METADATA as a row with col_name "@migration" and a col_def of
+"<schema version> <action>: <detail>". The DB user_version is then set
+to the schema version.
+"""
+
+import re
+import sqlite3 as sq3
+
+from data_base import DataBase
+from data_structs import Colors as DSC
+from method_shell import ShellMethods
+from os import path
+from pprint import pprint as pp  # noqa: F401
+
+import data_model as DM
+
+SM = ShellMethods()
+
+
+class MigrateError(Exception):
+    """Custom error class for MigrateDB errors."""
+    pass
+
+
+class MigrateDB(object):
+    """
+    Plan and apply schema migrations.
+    Usage:
+        MG = MigrateDB(DB)
+        steps = MG.plan()     # see what would change
+        MG.migrate()          # apply it
+    The schema bundle must be current; run DM.create_sql(DB) first
+    if the data models changed.
+    """
+
+    MIGRATION_COL = "@migration"
+    TABLE_CONSTRAINTS = ("CHECK", "CONSTRAINT", "FOREIGN", "PRIMARY", "UNIQUE")
+
+    def __init__(self, DB: DataBase):
+        """
+        :param DB: Instantiated DataBase() Class.
+        """
+        self.DB = DB
+
+    # Parsing
+    # ===========================================
+    def _normalize(self, p_sql: str) -> str:
+        """'PRIVATE'
+        Put a CREATE statement in the form SQLite keeps in sqlite_master:
+        no IF NOT EXISTS, no trailing semicolon. Whitespace is collapsed.
+        """
+        sql = re.sub(r"\s+IF\s+NOT\s+EXISTS\s+", " ", p_sql.strip(), count=1,
+                     flags=re.IGNORECASE)
+        return " ".join(sql.rstrip(";").split())
+
+    def _split_defs(self, p_table_sql: str) -> tuple:
+        """'PRIVATE'
+        Split a CREATE TABLE statement into column and table-constraint
+        definitions. Commas inside quotes or parentheses, and -- comments,
+        are skipped.
+        :param p_table_sql: CREATE TABLE statement
+        :return: (list of (column name, column def), list of constraint defs)
+        """
+        body = p_table_sql[p_table_sql.index("(") + 1:p_table_sql.rindex(")")]
+        items: list = []
+        item, quote, depth, ix = "", "", 0, 0
+        while ix < len(body):
+            char = body[ix]
+            if quote:
+                quote = "" if char == quote else quote
+            elif char in "'\"`":
+                quote = char
+            elif body.startswith("--", ix):
+                ix = body.find("\n", ix)
+                ix = len(body) if ix < 0 else ix
+                continue
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "," and depth == 0:
+                items.append(item)
+                item = ""
+                ix += 1
+                continue
+            item += char
+            ix += 1
+        items.append(item)
+        cols: list = []
+        constraints: list = []
+        for item in (" ".join(i.split()) for i in items):
+            if not item:
+                continue
+            if item.split(" ")[0].upper() in self.TABLE_CONSTRAINTS:
+                constraints.append(item)
+            else:
+                cols.append((item.split(" ")[0].strip("`\"[]"), item))
+        return (cols, constraints)
+
+    # Reading schemas
+    # ===========================================
+    def wanted_schema(self) -> dict:
+        """
+        Read the tables and indexes wanted by the data models.
+        :return: Dict of table name: dict of
+            - name_space, model_name
+            - script: name of the CREATE script
+            - table: CREATE TABLE statement
+            - indexes: dict of index name: CREATE INDEX statement
+        """
+        wanted: dict = {}
+        for name_space, models in DM.get_data_models().items():
+            for model in models:
+                tbl_nm = model._tablename
+                stmts = self.DB.split_sql_statements(
+                    self.DB.get_sql_file(self.DB.DDL, f"CREATE_{tbl_nm}"))
+                wanted[tbl_nm] = {
+                    "name_space": name_space,
+                    "model_name": model.__name__,
+                    "script": f"CREATE_{tbl_nm}",
+                    "table": stmts[0],
+                    "indexes": {self._normalize(stmt).split(" ")[2]: stmt
+                                for stmt in stmts[1:]},
+                }
+        return wanted
+
+    def live_schema(self) -> dict:
+        """
+        Read the tables and indexes in the main DB.
+        Automatic indexes (sqlite_autoindex_*) are left out.
+        :return: Dict of table name: dict of
+            - table: CREATE TABLE statement, as stored by SQLite
+            - indexes: dict of index name: CREATE INDEX statement
+        """
+        if not path.isfile(self.DB.SASKAN_DB):
+            return {}
+        live: dict = {}
+        self.DB.connect_db(self.DB.SASKAN_DB, p_read_only=True)
+        try:
+            self.DB.cur.execute(
+                "SELECT type, name, tbl_name, sql FROM sqlite_master " +
+                "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' " +
+                "ORDER BY type DESC;")
+            for obj_type, name, tbl_nm, sql in self.DB.cur.fetchall():
+                if obj_type == "table":
+                    live[name] = {"table": sql, "indexes": {}}
+                elif obj_type == "index" and tbl_nm in live:
+                    live[tbl_nm]["indexes"][name] = sql
+        finally:
+            self.DB.disconnect_db()
+        return live
+
+    # Planning
+    # ===========================================
+    def _index_sql(self, p_wanted: dict, p_live: dict) -> list:
+        """'PRIVATE'
+        DROP and CREATE INDEX statements that bring a live table's
+        indexes in line with the wanted ones.
+        """
+        wanted = {nm: self._normalize(sql) for nm, sql in p_wanted["indexes"].items()}
+        live = {nm: self._normalize(sql) for nm, sql in p_live["indexes"].items()}
+        sql = [f"DROP INDEX IF EXISTS `{nm}`;" for nm in sorted(live)
+               if wanted.get(nm) != live[nm]]
+        sql += [p_wanted["indexes"][nm] for nm in sorted(wanted)
+                if live.get(nm) != wanted[nm]]
+        return sql
+
+    def _copy_table_sql(self, p_tbl_nm: str, p_wanted: dict, p_shared: list) -> list:
+        """'PRIVATE'
+        Statements that re-create a table with the wanted definition
+        and copy over the data of its shared columns.
+        """
+        tmp_nm = f"{p_tbl_nm}__migrate"
+        create = re.sub(rf"^CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?`?{p_tbl_nm}`?",
+                        f"CREATE TABLE `{tmp_nm}`", p_wanted["table"],
+                        count=1, flags=re.IGNORECASE)
+        cols = ", ".join(f"`{col}`" for col in p_shared)
+        return [create,
+                f"INSERT INTO `{tmp_nm}` ({cols}) SELECT {cols} FROM `{p_tbl_nm}`;",
+                f"DROP TABLE `{p_tbl_nm}`;",
+                f"ALTER TABLE `{tmp_nm}` RENAME TO `{p_tbl_nm}`;",
+                *p_wanted["indexes"].values()]
+
+    def plan(self) -> list:
+        """
+        Diff the wanted schema with the live one.
+        Tables in the DB that no model defines are left alone.
+        :return: List of steps, in model order. Each step is a dict of
+            - table, name_space, model_name
+            - action: create, add_columns, copy_table or indexes
+            - detail: short description of the change
+            - sql: list of statements to run
+        """
+        wanted_all = self.wanted_schema()
+        live_all = self.live_schema()
+        for tbl_nm in sorted(set(live_all) - set(wanted_all)):
+            print(f"{DSC.CL_YELLOW}WARN{DSC.CL_END}: Table {tbl_nm} has no " +
+                  "data model; it is not migrated.")
+        steps: list = []
+        for tbl_nm, wanted in wanted_all.items():
+            step = {"table": tbl_nm, "name_space": wanted["name_space"],
+                    "model_name": wanted["model_name"]}
+            live = live_all.get(tbl_nm)
+            if live is None:
+                steps.append({**step, "action": "create", "detail": "new table",
+                              "sql": self.DB.split_sql_statements(
+                                  self.DB.get_sql_file(self.DB.DDL, wanted["script"]))})
+                continue
+            wanted_cols, wanted_cons = self._split_defs(wanted["table"])
+            live_cols, live_cons = self._split_defs(live["table"])
+            # Columns are compared by name and definition, not position,
+            # since add_columns leaves them in a different order.
+            wanted_defs = dict(wanted_cols)
+            new_cols = [(col, col_def) for col, col_def in wanted_cols
+                        if col not in dict(live_cols)]
+            kept = all(wanted_defs.get(col) == col_def for col, col_def in live_cols)
+            if kept and not new_cols and wanted_cons == live_cons:
+                index_sql = self._index_sql(wanted, live)
+                if index_sql:
+                    steps.append({**step, "action": "indexes",
+                                  "detail": "secondary indexes changed", "sql": index_sql})
+                continue
+            if (kept and wanted_cons == live_cons
+                    and not any(re.search(r"\b(PRIMARY|UNIQUE)\b", col_def, re.IGNORECASE)
+                                for _, col_def in new_cols)):
+                steps.append({
+                    **step, "action": "add_columns",
+                    "detail": "added " + ", ".join(col for col, _ in new_cols),
+                    "sql": [f"ALTER TABLE `{tbl_nm}` ADD COLUMN {col_def};"
+                            for _, col_def in new_cols] + self._index_sql(wanted, live)})
+                continue
+            live_names = {col for col, _ in live_cols}
+            shared = [col for col, _ in wanted_cols if col in live_names]
+            dropped = sorted(live_names - set(shared))
+            detail = "re-created"
+            if dropped:
+                detail += ", dropped " + ", ".join(dropped)
+            steps.append({**step, "action": "copy_table", "detail": detail,
+                          "sql": self._copy_table_sql(tbl_nm, wanted, shared)})
+        return steps
+
+    # Applying
+    # ===========================================
+    def _record(self, p_steps: list):
+        """'PRIVATE'
+        Refresh the field definitions in METADATA and log the steps there.
+        Runs inside the migration transaction.
+        """
+        self.DB.cur.execute(
+            "DELETE FROM `METADATA` WHERE `col_name` <> ?;", (self.MIGRATION_COL,))
+        for stmt in self.DB.split_sql_statements(
+                self.DB.get_sql_file(self.DB.DDL, "INSERT_METADATA")):
+            self.DB.cur.execute(stmt)
+        insert_sql = self.DB.get_sql_file(self.DB.DML, "INSERT_METADATA")
+        version = self.DB.schema_version
+        for step in p_steps:
+            self.DB.cur.execute(insert_sql, (
+                SM.get_uid(), step["name_space"], step["model_name"], step["table"],
+                self.MIGRATION_COL, f"{version} {step['action']}: {step['detail']}", ""))
+
+    def _check_foreign_keys(self, p_tbl_nm: str):
+        """'PRIVATE'
+        Check a re-created table's rows against its foreign keys.
+        An FK that names a missing parent column cannot be checked;
+        that is reported, not treated as a violation.
+        :raises MigrateError: If any row breaks a foreign key.
+        """
+        try:
+            violation = self.DB.cur.execute(
+                f"PRAGMA foreign_key_check(`{p_tbl_nm}`);").fetchone()
+        except sq3.OperationalError as err:
+            print(f"{DSC.CL_YELLOW}WARN{DSC.CL_END}: {p_tbl_nm} foreign keys " +
+                  f"not checked: {err}")
+            return
+        if violation:
+            raise MigrateError(f"Foreign key violations in {p_tbl_nm}")
+
+    def migrate(self, p_steps: list = None) -> list:
+        """
+        Apply migrations in one transaction, with foreign keys off so that
+        dropping a table does not cascade. Each re-created table is checked
+        for foreign key violations before commit. The transaction holds the
+        DB's write lock, so other writers in this process wait for it.
+        :param p_steps: Steps from plan(). Defaults to a fresh plan.
+        :raises MigrateError: If any step fails. Nothing is applied then.
+        :return: List of the steps applied.
+        """
+        steps = self.plan() if p_steps is None else p_steps
+        if not steps:
+            print(f"{DSC.CL_DARKCYAN}Schema is up to date{DSC.CL_END}")
+            return []
+        with self.DB._write_lock():
+            self.DB.connect_db(self.DB.SASKAN_DB, p_foreign_keys_on=False)
+            try:
+                self.DB.cur.execute("BEGIN IMMEDIATE")
+                for step in steps:
+                    for stmt in step["sql"]:
+                        self.DB.cur.execute(stmt)
+                for step in steps:
+                    if step["action"] == "copy_table":
+                        self._check_foreign_keys(step["table"])
+                self._record(steps)
+                self.DB.db_conn.commit()
+            except (sq3.Error, MigrateError) as err:
+                self.DB.db_conn.rollback()
+                raise MigrateError(f"{DSC.CL_RED}Migration rolled back{DSC.CL_END}: {err}") \
+                    from err
+            finally:
+                self.DB.disconnect_db()
+            self.DB.set_user_version()
+        self.DB._notify_change(None)
+        for step in steps:
+            print(f"{DSC.CL_DARKCYAN}{step['table']}: {step['action']}, " +
+                  f"{step['detail']}{DSC.CL_END}")
+        return steps
+
+    def get_migrations(self) -> list:
+        """
+        List the migrations recorded in METADATA.
+        :return: List of dicts of tbl_name, model_name and col_def,
+            in the order they were applied.
+        """
+        self.DB.connect_db(self.DB.SASKAN_DB, p_read_only=True)
+        try:
+            self.DB.cur.execute(
+                "SELECT `tbl_name`, `model_name`, `col_def` FROM `METADATA` " +
+                "WHERE `col_name` = ? ORDER BY rowid;", (self.MIGRATION_COL,))
+            return [dict(zip(("tbl_name", "model_name", "col_def"), row))
+                    for row in self.DB.cur.fetchall()]
+        finally:
+            self.DB.disconnect_db()
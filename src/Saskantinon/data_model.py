@@ -19,6 +19,9 @@ All fields must have a default value.
 A sub-class identifies:
 - SQLITE constraints, e.g. PRIMARY KEY, FOREIGN KEY, CHECKs
 - Sort order for SELECT queries.
+- Secondary indexes (IX) on natural keys, e.g. ["frame_id", "delete_dt"].
+- Natural key (NK) columns that identify one live version of a record,
+  e.g. ["frame_id"]. Used to build the versioned upsert SQL.
 
 This module provides standalone methods for creating SQL files and running
 DDL commands to create the tables in the database.
@@ -62,7 +65,7 @@ which is the default data structure returned by SELECT scripts.
 =======================================================
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from pathlib import Path
 from pprint import pformat as pf  # noqa: F401
 from pprint import pprint as pp  # noqa: F401
@@ -75,79 +78,112 @@ import data_model_story as DMS
 
 FM = FileMethods()
 SM = ShellMethods()
+_MODELS_BY_TABLE: dict = {}
+_SCHEMAS: dict = {}
+_NOT_COLS = {"Constraints", "to_dict", "from_dict"}
 
 
 # =============================================================
 # Utilities for Data Model objects
 # =============================================================
+class ColSchema(object):
+    """
+    Column schema of one data model class, built once and cached.
+    - table_nm: SQL table name
+    - cols: column names, in SQL column order
+    - types: Python type name of each column; JSON columns are "str"
+    - defaults: default value of each column
+    - positions: dict of column name: index into cols
+    - row_type: namedtuple class for rows of the table
+    """
+
+    __slots__ = ("table_nm", "cols", "types", "defaults", "positions", "row_type")
+
+    def __init__(self, p_model: type):
+        """
+        Reflect on the model class once.
+        :param p_model: Data model class
+        """
+        public_vars = [
+            (k, v) for k, v in vars(p_model).items()
+            if not k.startswith("_") and k not in _NOT_COLS
+        ]
+        json_cols = getattr(getattr(p_model, "Constraints", None), "JSON", [])
+        self.table_nm = getattr(p_model, "_tablename", "unknown_table")
+        self.cols = tuple(k for k, _ in public_vars)
+        self.defaults = tuple(v for _, v in public_vars)
+        self.types = tuple(
+            "str" if k in json_cols else type(v).__name__ for k, v in public_vars)
+        self.positions = {col: ix for ix, col in enumerate(self.cols)}
+        self.row_type = namedtuple(f"{p_model.__name__}Row", self.cols)
+
+
+def get_schema(DM: object) -> ColSchema:
+    """
+    Return the cached column schema of a data model.
+    The schema is built on first use, since the model modules import
+    this one and so cannot be reflected on while it loads.
+
+    :param DM: Data model class or instance
+    :return: ColSchema for the model's class
+    """
+    model = DM if isinstance(DM, type) else type(DM)
+    schema = _SCHEMAS.get(model)
+    if schema is None:
+        schema = _SCHEMAS[model] = ColSchema(model)
+    return schema
+
+
 def cols_to_dict(DM: object) -> dict:
     """
     Convert data model object to an OrderedDict.
     Returned attributes match SQL order in the database.
 
-    :param DM: Data model object
+    :param DM: Data model class or instance
     :return: Dictionary with table name as key and public attributes as value
     """
-    # Create an OrderedDict excluding private and specific public methods or attributes
-    public_vars = OrderedDict(
-        (k, v)
-        for k, v in vars(DM).items()
-        if not k.startswith("_") and k not in {"Constraints", "to_dict", "from_dict"}
-    )
-
-    # Return dictionary with the table name from '_tablename' attribute as the key
-    return {getattr(DM, "_tablename", "unknown_table"): public_vars}
+    schema = get_schema(DM)
+    return {schema.table_nm: OrderedDict(zip(schema.cols, schema.defaults))}
 
 
 def rec_to_dict(DM: object, p_dict: dict, p_row: int) -> dict:
     """
     Return a regular dict with populated values for one row of data.
 
-    :param DM: Instantiated data model object
+    :param DM: Data model class or instance
     :param p_dict: Dictionary containing lists of values (e.g., from a SELECT)
     :param p_row: Row number of the lists of values to return
     :return: Dictionary with column names as keys and corresponding row values
     """
-    # Create a dictionary of public attributes using cols_to_dict()
-    table_name = getattr(DM, "_tablename", "unknown_table")
-    rec = cols_to_dict(DM).get(table_name, {})
-
-    # Populate the record with values from p_dict for the specified row
+    schema = get_schema(DM)
+    rec = dict(zip(schema.cols, schema.defaults))
     rec.update((col, v_list[p_row]) for col, v_list in p_dict.items())
-
     return rec
 
 
-class CreateSQLError(Exception):
-    """Custom error class for BootError errors."""
-    pass
-
-
-# =======================================================
-# DB/DM DDL Calls
-# - Create DDL and DML SQL files
-# - Create SQLITE database and tables
-# =======================================================
-def create_sql(DB: object) -> bool:
+def to_rows(DM: object, p_tuples) -> list:
     """
-    Pass data object to create SQL files.
-    Delete all existing SQL before creating new ones.
+    Wrap row tuples, e.g. from a cursor, in the model's row type.
+    Rows are namedtuples: fields are read by name or position,
+    without building a dict per row.
 
-    :param DB: Current instance of the DB object.
-    :return: True if successful, False otherwise
+    :param DM: Data model class or instance
+    :param p_tuples: Iterable of value tuples, in table-column order
+    :return: List of row namedtuples
     """
-    # Combine DDL and DML directories for efficient processing
-    directories = [DB.DDL, DB.DML]
+    make_row = get_schema(DM).row_type._make
+    return [make_row(row) for row in p_tuples]
 
-    # Delete all *.sql files in specified directories
-    for directory in directories:
-        for sql_file in FM.scan_dir(directory, "*.sql"):
-            print(f"{Colors.CL_YELLOW}Deleting {sql_file}{Colors.CL_END}")
-            FM.delete_file(sql_file)
 
-    # Define data models for processing with their respective categories
+def get_data_models() -> dict:
+    """
+    Return the data model classes, grouped by name space.
+    Built on each call so the DMA/DMS modules are fully imported first.
+
+    :return: Dict of name space: list of data model classes
+    """
     # Metadata table must be the first table in the list
-    data_models = {
+    return {
         "app": [
             DMA.Metadata,
             DMA.Backup,
@@ -198,18 +234,85 @@ def create_sql(DB: object) -> bool:
             DMS.DayTime,
         ],
     }
-    # Generate SQL for each model category
-    for category, models in data_models.items():
-        for model in models:
-            success = DB.generate_sql(model, category)
-            if not success:
-                fail = (f"{Colors.CL_RED}Error generating SQL for model {model}" +
-                        f" in category {category}{Colors.CL_END}")
-                raise CreateSQLError(fail)
-            else:
-                print(f"{Colors.CL_DARKCYAN}{model._tablename} SQL generated ")
-
-    print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}SQL files generated.\n{Colors.CL_END}")
+
+
+def get_log_models() -> dict:
+    """
+    Return the data model classes of tables that live in their own DB
+    files rather than in the main DB, grouped by name space. Their SQL is
+    in the schema bundle, but create_db, migrations and METADATA leave
+    them out. LOGS is created in each log partition by wiretap.LogStore.
+
+    :return: Dict of name space: list of data model classes
+    """
+    return {"app": [DMA.Logs]}
+
+
+def get_model(p_table_nm: str) -> object:
+    """
+    Look up a data model class by its SQL table name.
+
+    :param p_table_nm: Name of the SQL table, any case
+    :return: Data model class, or None if no model has that table name
+    """
+    if not _MODELS_BY_TABLE:
+        for models in [*get_data_models().values(), *get_log_models().values()]:
+            _MODELS_BY_TABLE.update((m._tablename.upper(), m) for m in models)
+            for model in models:
+                get_schema(model)
+    return _MODELS_BY_TABLE.get(p_table_nm.upper())
+
+
+def get_col_types(p_table_nm: str) -> OrderedDict:
+    """
+    Return the Python type name of each column of a table.
+    Types are taken from the model's default values, the same way
+    DataBase.set_sql_data_type derives the SQL column types.
+    JSON columns are reported as "str".
+
+    :param p_table_nm: Name of the SQL table, any case
+    :return: OrderedDict of column name: type name, in SQL column order,
+             or an empty OrderedDict if the table has no model
+    """
+    model = get_model(p_table_nm)
+    if model is None:
+        return OrderedDict()
+    schema = get_schema(model)
+    return OrderedDict(zip(schema.cols, schema.types))
+
+
+class CreateSQLError(Exception):
+    """Custom error class for BootError errors."""
+    pass
+
+
+# =======================================================
+# DB/DM DDL Calls
+# - Create DDL and DML SQL, saved as one schema bundle
+# - Create SQLITE database and tables
+# =======================================================
+def create_sql(DB: object) -> bool:
+    """
+    Generate SQL for all data models, and for the log models, in memory,
+    and save it as the schema bundle. Delete all existing SQL files first; they are
+    written again only if the legacy per-file layout is on.
+
+    :param DB: Current instance of the DB object.
+    :return: True if successful, False otherwise
+    """
+    # Delete all *.sql files in the DDL and DML directories
+    for directory in [DB.DDL, DB.DML]:
+        for sql_file in FM.scan_dir(directory, "*.sql"):
+            print(f"{Colors.CL_YELLOW}Deleting {sql_file}{Colors.CL_END}")
+            FM.delete_file(sql_file)
+
+    try:
+        version = DB.generate_sql_bundle(get_data_models(), get_log_models())
+    except ValueError as err:
+        raise CreateSQLError(f"{Colors.CL_RED}{err}{Colors.CL_END}")
+
+    print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}SQL generated. " +
+          f"Schema version {version}\n{Colors.CL_END}")
     return True
 
 
@@ -237,13 +340,20 @@ def create_db(DB: object, p_backup: bool = True) -> bool:
             DB.backup_db(db_path, DB.SASKAN_BAK)
             print(f"{Colors.CL_DARKCYAN}Main DB was backed up{Colors.CL_END}")
 
-    FM.delete_file(DB.SASKAN_DB)
+    # Pooled handles must not outlive the file they point to
+    DB.close_pool()
+    Path(DB.SASKAN_DB).unlink(missing_ok=True)
+    DB.remove_wal_files()
     print(f"{Colors.CL_DARKCYAN}Database deleted{Colors.CL_END}")
 
     # Execute CREATE statements with foreign key constraints
-    create_sql_list = [str(sql.name) for sql in FM.scan_dir(DB.DDL, "CREATE*")]
+    log_tables = [f"CREATE_{model._tablename}"
+                  for models in get_log_models().values() for model in models]
+    create_sql_list = [sql_nm for sql_nm in DB.get_sql_names(DB.DDL, "CREATE_")
+                       if sql_nm not in log_tables]
     ok = DB.execute_ddl(create_sql_list, p_foreign_keys_on=True)
     if ok:
+        DB.set_user_version()
         print(f"{Colors.CL_DARKCYAN}{Colors.CL_BOLD}Database and " +
               f"Tables created\n{Colors.CL_END}")
     return ok
@@ -122,6 +122,45 @@ class Backup():
         CK: dict = {"bkup_type": EntityType.BACKUP_TYPE}
 
 
+class Logs():
+    """Store log records written by the wiretap logger.
+    The table is only created in the log partition files, not in the
+    main DB; see data_model.get_log_models.
+    $$
+    - log_uid_pk: Primary key
+    - log_dttm: Date and time the record was logged
+    - log_level: Level name, e.g., DEBUG, INFO, ERROR
+    - logger_name: Name of the logger that wrote the record
+    - log_msg: Formatted log message
+    - exception_info: Formatted exception and traceback, if any
+    - delete_dt: Date and time the record was deleted
+    $$
+    """
+
+    _tablename: str = "LOGS"
+    log_uid_pk: str = ""  # Primary key
+    log_dttm: str = ""
+    log_level: str = ""
+    logger_name: str = ""
+    log_msg: str = ""
+    exception_info: str = ""
+    delete_dt: str = ""
+
+    def to_dict(self) -> dict:
+        """Convert attributes to OrderedDict."""
+        return DM.cols_to_dict(Logs)
+
+    def from_dict(self, p_dict: dict, p_row: int) -> dict:
+        """Load DB SELECT results into memory."""
+        return DM.rec_to_dict(self, p_dict, p_row)
+
+    class Constraints():
+        PK: str = "log_uid_pk"
+        ORDER: list = ["log_dttm DESC"]
+        CK: dict = {"log_level": EntityType.LOG_LEVEL}
+        IX: list = [["log_dttm"], ["log_level", "log_dttm"]]
+
+
 class Texts():
     """Define static text strings used in the app GUI.
     - Language code of the text, eg, 'en', 'de', 'fr'
@@ -156,6 +195,8 @@ class Texts():
         PK: str = "text_uid_pk"
         CK: dict = {"lang_code": EntityType.LANG_CODE}
         ORDER: list = ["text_id ASC", "lang_code ASC"]
+        IX: list = [["lang_code", "text_id", "delete_dt"]]
+        NK: list = ["lang_code", "text_id"]
 
 
 # If it turns out the be useful, may want to add an "APP" structure
@@ -209,6 +250,8 @@ class Frames():
         PK: str = "frame_uid_pk"
         CK: dict = {"lang_code": EntityType.LANG_CODE}
         ORDER: list = ["frame_id ASC"]
+        IX: list = [["frame_id", "delete_dt"]]
+        NK: list = ["frame_id"]
 
 
 class MenuBars():
@@ -253,6 +296,8 @@ class MenuBars():
         PK: str = "menu_bar_uid_pk"
         FK: dict = {"frame_uid_fk": ("FRAMES", "frame_uid_pk")}
         ORDER: list = ["frame_id ASC"]
+        IX: list = [["frame_id", "delete_dt"]]
+        NK: list = ["frame_id"]
 
 
 class Menus():
@@ -292,6 +337,8 @@ class Menus():
         FK: dict = {"menu_bar_uid_fk": ("MENU_BARS", "menu_bar_uid_pk")}
         CK: dict = {"lang_code": EntityType.LANG_CODE}
         ORDER: list = ["menu_id ASC", "lang_code ASC", "menu_name ASC"]
+        IX: list = [["frame_id", "menu_id", "delete_dt"]]
+        NK: list = ["frame_id", "menu_id"]
 
 
 class MenuItems():
@@ -339,6 +386,8 @@ class MenuItems():
         FK: dict = {"menu_uid_fk": ("MENUS", "menu_uid_pk")}
         CK: dict = {"lang_code": EntityType.LANG_CODE}
         ORDER: list = ["item_id ASC", "lang_code ASC", "item_name ASC"]
+        IX: list = [["menu_uid_fk", "item_id", "delete_dt"]]
+        NK: list = ["menu_uid_fk", "item_id"]
 
 
 class Windows():
@@ -380,6 +429,8 @@ class Windows():
         FK: dict = {"frame_uid_fk": ("FRAMES", "frame_uid_pk")}
         CK: dict = {"lang_code": EntityType.LANG_CODE}
         ORDER: list = ["win_id ASC", "lang_code ASC"]
+        IX: list = [["frame_uid_fk", "win_id", "delete_dt"]]
+        NK: list = ["frame_uid_fk", "win_id"]
 
 
 class Links():
@@ -430,6 +481,8 @@ class Links():
             "mime_type": EntityType.MIME_TYPE,
         }
         ORDER: list = ["frame_id ASC", "link_id ASC", "lang_code ASC"]
+        IX: list = [["frame_id", "link_id", "delete_dt"]]
+        NK: list = ["frame_id", "link_id"]
 
 
 class ButtonSingle():
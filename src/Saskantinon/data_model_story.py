@@ -116,6 +116,11 @@ class MapRect():
         PK: str = "map_rect_uid_pk"
         CK: dict = {"map_shape": EntityType.MAP_SHAPE, "map_type": EntityType.MAP_TYPE}
         ORDER: list = ["map_name ASC"]
+        IX: list = [
+            ["map_id", "lang_code", "delete_dt"],
+            ["map_name", "delete_dt"],
+        ]
+        NK: list = ["map_id", "lang_code"]
 
 
 class MapBox(MapRect):
@@ -174,6 +179,11 @@ class MapBox(MapRect):
         PK: str = "map_box_uid_pk"
         CK: dict = {"map_shape": EntityType.MAP_SHAPE, "map_type": EntityType.MAP_TYPE}
         ORDER: list = ["map_name ASC"]
+        IX: list = [
+            ["map_id", "lang_code", "delete_dt"],
+            ["map_name", "delete_dt"],
+        ]
+        NK: list = ["map_id", "lang_code"]
 
 
 class MapSphere(MapRect):
@@ -243,6 +253,11 @@ class MapSphere(MapRect):
             "unit_of_measure": EntityType.MEASURE_TYPE,
         }
         ORDER: list = ["map_name ASC"]
+        IX: list = [
+            ["map_id", "lang_code", "delete_dt"],
+            ["map_name", "delete_dt"],
+        ]
+        NK: list = ["map_id", "lang_code"]
 
 
 class Grid():
@@ -301,6 +316,8 @@ class Grid():
     class Constraints():
         PK: str = "grid_uid_pk"
         ORDER: list = ["grid_id ASC"]
+        IX: list = [["grid_id", "delete_dt"]]
+        NK: list = ["grid_id"]
 
 
 class GridCell():
@@ -357,6 +374,11 @@ class GridCell():
         PK: str = "grid_cell_uid_pk"
         FK: dict = {"grid_uid_fk": ("GRID", "grid_uid_pk")}
         ORDER: list = ["grid_cell_name ASC"]
+        IX: list = [
+            ["grid_id", "grid_cell_id", "delete_dt"],
+            ["grid_cell_name", "delete_dt"],
+        ]
+        NK: list = ["grid_id", "grid_cell_id"]
 
 
 class GridInfo():
@@ -422,6 +444,8 @@ class GridInfo():
             "grid_uid_fk": ("GRID", "grid_uid_pk"),
         }
         ORDER: list = ["grid_info_name ASC"]
+        IX: list = [["grid_id", "grid_cell_name", "delete_dt"]]
+        NK: list = ["grid_id", "grid_cell_name"]
 
 
 class CrossAssociation():
@@ -476,6 +500,8 @@ class CrossAssociation():
     class Constraints():
         PK: str = "cross_x_uid_pk"
         CK: dict = {"touch_type": EntityType.TOUCH_TYPE}
+        IX: list = [["uid_1_vfk", "uid_2_vfk", "delete_dt"]]
+        NK: list = ["uid_1_vfk", "uid_2_vfk"]
 
 
 class MapXMap():
@@ -643,6 +669,8 @@ class CharSet():
         PK: str = "char_set_uid_pk"
         CK: dict = {"char_set_type": EntityType.CHAR_SET_TYPE}
         ORDER: list = ["font_name ASC"]
+        IX: list = [["font_name", "delete_dt"]]
+        NK: list = ["font_name"]
 
 
 class CharMember():
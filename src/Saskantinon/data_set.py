@@ -79,36 +79,43 @@ class SetData():
         tbl_cols = OrderedDict(data_model.to_dict()[tbl_nm])
         return (tbl_nm, tbl_data, tbl_cols)
 
-    def _virtual_delete(self, p_table_nm: str, p_rec: dict) -> bool:
-        """
-        Mark a record as deleted by setting the delete_dt column to the current time.
-        :param p_table_nm: Name of the table to update.
-        :param p_rec: Dict of current record values.
-        :return: True if the operation is successful, False otherwise.
-        """
-        rec = p_rec.copy()
-        rec["delete_dt"] = SM.get_iso_time_stamp()
-        uid_key = f"{p_table_nm}_uid_pk".lower()
-        uid = rec[uid_key]
-        del rec[uid_key]
-        return self.DB.execute_update(p_table_nm, uid, tuple(rec.values()))
-
-    def _set_insert(self, p_table_name: str, p_del_match: dict, t_cols) -> bool:
-        """Code shared by the various set_* data methods.
+    def _get_links(self, p_table_name: str, p_match_cols: list, p_keys) -> dict:
+        """Resolve all links from a load batch to one parent table at once.
+        :param p_table_name: str - Name of the linked (parent) table.
+        :param p_match_cols: list - Columns of the natural key or UID to match on.
+        :param p_keys: Iterable of key tuples (or plain values for a one-column key).
+        :returns: Dict of key tuple: linked row.
+        :raises SetDataError: Listing every key with no linked row.
+        """
+        keys = [key if isinstance(key, tuple) else (key,) for key in p_keys]
+        links = GD.get_by_keys(p_table_name, p_match_cols, keys)
+        missing = [key for key in dict.fromkeys(keys) if key not in links]
+        if missing:
+            raise SetDataError(f"{Colors.CL_RED}Link to {p_table_name} not found" +
+                               f"{Colors.CL_END} for {p_match_cols}: {missing}")
+        return links
+
+    def _set_insert(self, p_table_name: str, t_cols) -> bool:
+        """Code shared by the various set_* data methods for a single record.
         :param p_table_name: str - Name of the table to update.
-        :param p_del_match: dict - Dictionary of values to match on for virtual delete/update.
-        :param t_cols: dict - Dictionary of column values for the map.
+        :param t_cols: dict - Dictionary of column values for the record.
+        """
+        return self._set_insert_many(p_table_name, [t_cols])
 
-        Note that get_by_match() accepts up to a max of 3 matching column values.
-        If matching only on UID, then use a DB query using a SELECT_BY_PK_ sql file.
+    def _set_insert_many(self, p_table_name: str, p_rows: list) -> bool:
+        """Code shared by the various set_* data methods for a batch of records.
+        Each record is written with a versioned upsert: the live version with
+        the same natural key (the model's Constraints.NK) is virtually deleted
+        and the new version inserted, all in a single transaction.
+        :param p_table_name: str - Name of the table to update.
+        :param p_rows: list - Dicts of column values, one per record.
         """
-        existing_data = GD.get_by_match(p_table_name, p_del_match)
-        if existing_data and not self._virtual_delete(p_table_name, existing_data):
-            raise SetDataError(f"{Colors.CL_RED}Error applying virtual delete " +
-                               f"on {p_table_name}{Colors.CL_END}.")
-        if not self.DB.execute_insert(p_table_name, (SM.get_uid(), tuple(t_cols.values()))):
+        upsert_rows = [(SM.get_uid(), tuple(t_cols.values())) for t_cols in p_rows]
+        chunk_errors = self.DB.execute_upsert_many(p_table_name, upsert_rows)
+        if chunk_errors:
             raise SetDataError(f"{Colors.CL_RED}Error inserting data " +
-                               f"into {p_table_name}{Colors.CL_END}.")
+                               f"into {p_table_name}{Colors.CL_END}: " +
+                               "; ".join(err["error"] for err in chunk_errors))
         return True
 
     def set_texts(self) -> bool:
@@ -118,6 +125,7 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.Texts())
+        rows: list = []
         language_code = self.CONTEXT["lang"]
         for text_id, text_value in table_data.items():
             t_cols = table_cols.copy()
@@ -130,9 +138,8 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"lang_code": language_code, "text_id": text_id}
-            self._set_insert(table_name, del_match, t_cols)
-        return True
+            rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_frames(self) -> bool:
         """
@@ -142,6 +149,7 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.Frames())
+        rows: list = []
         for frame_id, frame_config in table_data.items():
             t_cols = table_cols.copy()
             t_cols.pop("frame_uid_pk")
@@ -161,9 +169,8 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"frame_id": frame_id}
-            self._set_insert(table_name, del_match, t_cols)
-        return True
+            rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_menu_bars(self) -> bool:
         """
@@ -172,10 +179,10 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.MenuBars())
+        links = self._get_links("FRAMES", ["frame_id"], table_data.keys())
+        rows: list = []
         for frame_id, mb_config in table_data.items():
-            linked_data = GD.get_by_match("FRAMES", {"frame_id": frame_id})
-            if not linked_data:
-                raise SetDataError(f"{Colors.CL_RED}Link to FRAMES not found.{Colors.CL_END}")
+            linked_data = links[(frame_id,)]
             t_cols = table_cols.copy()
             t_cols.pop("menu_bar_uid_pk")
             t_cols.update(
@@ -189,9 +196,8 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"frame_id": frame_id}
-            self._set_insert(table_name, del_match, t_cols)
-        return True
+            rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_menus(self) -> bool:
         """
@@ -201,10 +207,10 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.Menus())
+        links = self._get_links("MENU_BARS", ["frame_id"], table_data.keys())
+        rows: list = []
         for frame_id, menu_config in table_data.items():
-            linked_data = GD.get_by_match("MENU_BARS", {"frame_id": frame_id})
-            if not linked_data:
-                raise SetDataError(f"{Colors.CL_RED}Link to MENU_BARS not found.{Colors.CL_END}")
+            linked_data = links[(frame_id,)]
             for menu_id, vals in menu_config.items():
                 t_cols = table_cols.copy()
                 t_cols.pop("menu_uid_pk")
@@ -218,9 +224,8 @@ class SetData():
                         "delete_dt": "",
                     }
                 )
-                del_match = {"frame_id": frame_id, "menu_id": menu_id}
-                self._set_insert(table_name, del_match, t_cols)
-        return True
+                rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_menu_items(self) -> bool:
         """
@@ -229,11 +234,14 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.MenuItems())
+        links = self._get_links(
+            "MENUS", ["frame_id", "menu_id"],
+            [(frame_id, menu_id) for frame_id, mi_config in table_data.items()
+             for menu_id in mi_config])
+        rows: list = []
         for frame_id, mi_config in table_data.items():
             for menu_id, mi_vals in mi_config.items():
-                linked_data = GD.get_by_match("MENUS", {"frame_id": frame_id, "menu_id": menu_id})
-                if not linked_data:
-                    raise SetDataError(f"{Colors.CL_RED}Link to MENUS not found.{Colors.CL_END}")
+                linked_data = links[(frame_id, menu_id)]
                 lang_code = (linked_data["lang_code"] if "lang_code" in linked_data else "en")
                 item_order = 0
                 for item_id, item_vals in mi_vals.items():
@@ -256,10 +264,9 @@ class SetData():
                             "delete_dt": "",
                         }
                     )
-                    del_match = {"menu_uid_fk": linked_data["menu_uid_pk"], "item_id": item_id}
-                    self._set_insert(table_name, del_match, t_cols)
+                    rows.append(t_cols)
                     item_order += 1
-        return True
+        return self._set_insert_many(table_name, rows)
 
     def set_windows(self) -> bool:
         """
@@ -268,10 +275,10 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.Windows())
+        links = self._get_links("FRAMES", ["frame_id"], table_data.keys())
+        rows: list = []
         for frame_id, win_config in table_data.items():
-            linked_data = GD.get_by_match("FRAMES", {"frame_id": frame_id})
-            if not linked_data:
-                raise SetDataError(f"{Colors.CL_RED}Link to FRAMES not found.{Colors.CL_END}")
+            linked_data = links[(frame_id,)]
             for win_id, win_vals in win_config.items():
                 t_cols = table_cols.copy()
                 t_cols.pop("win_uid_pk")
@@ -286,9 +293,8 @@ class SetData():
                         "delete_dt": "",
                     }
                 )
-                del_match = {"frame_uid_fk": linked_data["frame_uid_pk"], "win_id": win_id}
-                self._set_insert(table_name, del_match, t_cols)
-        return True
+                rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_links(self) -> bool:
         """
@@ -299,10 +305,9 @@ class SetData():
         - Load icon images into DB as a BLOB
         """
         table_name, table_data, table_cols = self._prep_data_set(DMA.Links())
+        self._get_links("FRAMES", ["frame_id"], table_data.keys())
+        rows: list = []
         for frame_id, link_config in table_data.items():
-            linked_data = GD.get_by_match("FRAMES", {"frame_id": frame_id})
-            if not linked_data:
-                raise SetDataError(f"{Colors.CL_RED}Link to FRAMES not found.{Colors.CL_END}")
             for link_id, link_vals in link_config.items():
                 t_cols = table_cols.copy()
                 t_cols.pop("link_uid_pk")
@@ -324,9 +329,8 @@ class SetData():
                         "delete_dt": "",
                     }
                 )
-                del_match = {"frame_id": frame_id, "link_id": link_id}
-                self._set_insert(table_name, del_match, t_cols)
-        return True
+                rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     # Story-related Tables
     # ====================
@@ -358,8 +362,7 @@ class SetData():
                 "delete_dt": "",
             }
         )
-        del_match = {"map_id": map_id, "lang_code": "en"}
-        return self._set_insert(table_name, del_match, t_cols)
+        return self._set_insert(table_name, t_cols)
 
     def set_box_maps(self) -> bool:
         """Define a box (3D-ish, layered) maps for game use.
@@ -389,8 +392,7 @@ class SetData():
                 "delete_dt": "",
             }
         )
-        del_match = {"map_id": map_id, "lang_code": "en"}
-        return self._set_insert(table_name, del_match, t_cols)
+        return self._set_insert(table_name, t_cols)
 
     def set_sphere_maps(self) -> bool:
         """Define spherical maps for game use.
@@ -419,8 +421,7 @@ class SetData():
                 "delete_dt": "",
             }
         )
-        del_match = {"map_id": map_id, "lang_code": "en"}
-        return self._set_insert(table_name, del_match, t_cols)
+        return self._set_insert(table_name, t_cols)
 
     def set_grids(self) -> bool:
         """Define Grids structures for game use.
@@ -441,8 +442,7 @@ class SetData():
                 "delete_dt": "",
             }
         )
-        del_match = {"grid_id": grid_id}
-        return self._set_insert(table_name, del_match, table_cols)
+        return self._set_insert(table_name, table_cols)
         return True
 
     def set_grid_cells(self) -> bool:
@@ -454,15 +454,14 @@ class SetData():
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, _, table_cols = self._prep_data_set(DMS.GridCell(), False)
+        rows: list = []
         grid_id = "30x_40y_30zu_30zd"
         grid_data = [
             {"grid_cell_name": "Selaron Town", "x_col_ix": 25, "y_row_ix": 12, "z_up_down_ix": 0},
             {"grid_cell_name": "Morilly Town", "x_col_ix": 15, "y_row_ix": 23, "z_up_down_ix": 0},
             {"grid_cell_name": "Wildwind Town", "x_col_ix": 12, "y_row_ix": 27, "z_up_down_ix": 0},
         ]
-        linked_data = GD.get_by_match("GRID", {"grid_id": grid_id})
-        if not linked_data:
-            raise SetDataError(f"{Colors.CL_RED}Link to GRID not found.{Colors.CL_END}")
+        linked_data = self._get_links("GRID", ["grid_id"], [grid_id])[(grid_id,)]
         for cells in grid_data:
             cell_cols = table_cols.copy()
             grid_cell_id = (
@@ -484,9 +483,8 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"grid_id": grid_id, "grid_cell_id": grid_cell_id}
-            self._set_insert(table_name, del_match, cell_cols)
-        return True
+            rows.append(cell_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_grid_infos(self) -> bool:
         """Define a set of Grid Info records for game use.
@@ -496,10 +494,9 @@ class SetData():
         - If an image path is provided, then load the image into the DB as a BLOB.
         """
         table_name, _, table_cols = self._prep_data_set(DMS.GridInfo(), False)
+        rows: list = []
         grid_id = "30x_40y_30zu_30zd"
-        linked_grid_data = GD.get_by_match("GRID", {"grid_id": grid_id})
-        if not linked_grid_data:
-            raise SetDataError(f"{Colors.CL_RED}Link to GRID not found.{Colors.CL_END}")
+        linked_grid_data = self._get_links("GRID", ["grid_id"], [grid_id])[(grid_id,)]
 
         info_data = [
             {'grid_info_id': "town", 'grid_info_name': "Seaport Town",
@@ -509,10 +506,10 @@ class SetData():
             {'grid_info_id': "town", 'grid_info_name': "Walled Town",
              'grid_info_img_path': "static/images/walledtown_icon.jpg"},
         ]
-        for info_ix, grid_cell_name in enumerate(["Selaron Town", "Morilly Town", "Wildwind Town"]):
-            linked_cell_data = GD.get_by_match("GRID_CELL", {"grid_cell_name": grid_cell_name})
-            if not linked_cell_data:
-                raise SetDataError(f"{Colors.CL_RED}Link to GRID_CELL not found.{Colors.CL_END}")
+        cell_names = ["Selaron Town", "Morilly Town", "Wildwind Town"]
+        cell_links = self._get_links("GRID_CELL", ["grid_cell_name"], cell_names)
+        for info_ix, grid_cell_name in enumerate(cell_names):
+            linked_cell_data = cell_links[(grid_cell_name,)]
 
             info_cols = table_cols.copy()
             info_cols.pop("grid_info_uid_pk")
@@ -541,58 +538,74 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"grid_id": grid_id, "grid_cell_name": grid_cell_name}
-            self._set_insert(table_name, del_match, info_cols)
-        return True
+            rows.append(info_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_cross_x(self, p_x_values: dict) -> bool:
         """
         Generic method for setting values in an association table.
         Define assoociation for an _X_ (association) table record using UIDs.
         Fail if either associated UID is not found.
-        :param p_model: object - Data model object for an association table.
         :param p_x_values: dict - Dictionary of values, in this format:
                     {<uid_col_nm_1>: <uid_1_value>,
                      <uid_col_nm_2>: <uid_2_value>,
                      "touch_type": <touch_type_value> (optional)}
         :return: True if all operations succeed; Raises error otherwise.
         """
+        return self.set_cross_x_many([p_x_values])
+
+    def set_cross_x_many(self, p_x_values_list: list) -> bool:
+        """
+        Set a batch of association table records, as for set_cross_x.
+        All linked UIDs are validated up front, with one query per linked
+        table, and every missing link is reported at once. Records are
+        written in order, so a later record for the same pair of UIDs
+        supersedes an earlier one.
+        :param p_x_values_list: list - Dicts of values, as for set_cross_x.
+        :return: True if all operations succeed; Raises error otherwise.
+        """
         table_name, _, table_cols = self._prep_data_set(DMS.CrossAssociation(), False)
         # Derive linked table names from linked PK column names
-        link_uids = list(p_x_values.keys())[:2]
-        link_tables = [k.split("_uid")[0].upper() for k in link_uids]
-        # Validate FK links
-        for k_ix, uid in enumerate(link_uids):
-            if not GD.get_by_match(link_tables[k_ix], {uid: p_x_values[uid]}):
-                raise SetDataError(
-                    f"{Colors.CL_RED}ERROR{Colors.CL_END}: Link to {link_tables[k_ix]} not found."
-                )
-
-        t_cols = table_cols.copy()
-        t_cols.pop(f"{table_name}_uid_pk".lower())
-        touch_type = p_x_values["touch_type"] if "touch_type" in p_x_values else ""
-        t_cols.update(
-            {
-                "uid_1_table": link_tables[0],
-                "uid_1_vfk": p_x_values[link_uids[0]],
-                "uid_2_table": link_tables[1],
-                "uid_2_vfk": p_x_values[link_uids[1]],
-                "touch_type": touch_type,
-                "delete_dt": "",
-            }
-        )
-        del_match = {
-            "uid_1_vfk": p_x_values[link_uids[0]],
-            "uid_2_vfk": p_x_values[link_uids[1]],
-        }
-        self._set_insert(table_name, del_match, t_cols)
-        return True
+        uids_by_col: dict = {}
+        for x_values in p_x_values_list:
+            for uid in list(x_values.keys())[:2]:
+                uids_by_col.setdefault(uid, []).append(x_values[uid])
+        # Validate FK links, reporting the missing ones for all tables together
+        errors: list = []
+        for uid, uid_values in uids_by_col.items():
+            try:
+                self._get_links(uid.split("_uid")[0].upper(), [uid], uid_values)
+            except SetDataError as err:
+                errors.append(str(err))
+        if errors:
+            raise SetDataError("\n".join(errors))
+
+        rows: list = []
+        for x_values in p_x_values_list:
+            link_uids = list(x_values.keys())[:2]
+            link_tables = [k.split("_uid")[0].upper() for k in link_uids]
+            t_cols = table_cols.copy()
+            t_cols.pop(f"{table_name}_uid_pk".lower())
+            touch_type = x_values["touch_type"] if "touch_type" in x_values else ""
+            t_cols.update(
+                {
+                    "uid_1_table": link_tables[0],
+                    "uid_1_vfk": x_values[link_uids[0]],
+                    "uid_2_table": link_tables[1],
+                    "uid_2_vfk": x_values[link_uids[1]],
+                    "touch_type": touch_type,
+                    "delete_dt": "",
+                }
+            )
+            rows.append(t_cols)
+        return self._set_insert_many(table_name, rows)
 
     def set_char_sets(self) -> bool:
         """Define sets of Character records for game use.
         :return: True if all operations succeed; Raises error otherwise.
         """
         table_name, _, table_cols = self._prep_data_set(DMS.CharSet(), False)
+        rows: list = []
         charsets: list = [
             {
                 "type": "abugida",
@@ -652,7 +665,6 @@ class SetData():
                     "delete_dt": "",
                 }
             )
-            del_match = {"font_name": cs["font_name"]}
-            self._set_insert(table_name, del_match, cs_cols)
+            rows.append(cs_cols)
 
-        return True
+        return self._set_insert_many(table_name, rows)
@@ -536,7 +536,7 @@ class EntityType(object):
     ASTRO_DIRECTION = ["prograde", "retrograde"]
     ASTRO_LOCATION = ["inner", "outer", "multiple"]
     ASTRO_SHAPE = ["ellipsoid", "spherical"]
-    BACKUP_TYPE = ["archive", "backup", "compressed", "export", "encrypted"]
+    BACKUP_TYPE = ["archive", "backup", "compressed", "export", "encrypted", "restore"]
     BUTTON_TYPE = ["toggle", "check", "radio", "event"]
     CHAR_SET_TYPE = ["alphabet", "abjad", "abugida", "syllabary", "ideogram"]
     CLUSTER_SHAPE = ["ellipsoid", "spherical"]
@@ -607,6 +607,7 @@ class EntityType(object):
         "add_special_month",
     ]
     LINK_PROTOCOL = ["https", "http", "ftp", "sftp", "ssh", "wc"]
+    LOG_LEVEL = ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
     LUMINOSITY_CLASS = ["I", "II", "III", "IV", "V"]
     MAP_SHAPE = ["rectangle", "box", "sphere"]
     MAP_TYPE = [
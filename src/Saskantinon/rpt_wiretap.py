@@ -1,17 +1,26 @@
 #!python
 """Wire Tap Logging and Monitoring utilities and services.
 :module:    io_wiretap.py
-:class:     WireTap/0
+:class:     SegmentLog/0, WireTap/0
 :author:    GM <genuinemerit @ pm.me>
+
+Log records go to an append-only segment log (see SegmentLog),
+not to one file per record.
 """
 
+import fcntl
 import hashlib
 import json
+import mmap
+import os
 import secrets
+import struct
+import time
 import uuid
 import zlib
 from datetime import datetime, timedelta, timezone
 from os import path
+from pathlib import Path
 from pprint import pprint as pp  # noqa: F401
 
 from Saskantinon.method_files import FileMethods  # type: ignore
@@ -19,6 +28,311 @@ from Saskantinon.method_files import FileMethods  # type: ignore
 FM = FileMethods()
 
 
+class LogRecordView(object):
+    """Zero-copy view of one record in a mapped segment.
+
+    Header fields are unpacked with struct straight from the segment's
+    memoryview. The key is decoded, and the body decompressed and decoded,
+    only when asked for. A view points into the mapped segment, so it is
+    valid only inside the iteration that yielded it; keep payload(), not
+    the view, to use a record later. Values it returns are copies, so they
+    never pin the mapping.
+    """
+
+    __slots__ = ("_view", "_offset")
+
+    def __init__(self, p_view: memoryview, p_offset: int):
+        """Point at the record starting at p_offset in p_view."""
+        self._view = p_view
+        self._offset = p_offset
+
+    @property
+    def header(self) -> tuple:
+        """(payload length, time usecs, level, flags, logger id, key length)"""
+        return SegmentLog.REC.unpack_from(self._view, self._offset)
+
+    @property
+    def ts(self) -> int:
+        """Record time in usecs since the epoch."""
+        return self.header[1]
+
+    @property
+    def level(self) -> int:
+        """Level number, e.g. 40 for ERROR."""
+        return self.header[2]
+
+    @property
+    def logger_id(self) -> int:
+        """CRC-32 of the logger name. See SegmentLog.logger_id."""
+        return self.header[4]
+
+    @property
+    def key(self) -> str:
+        """Record key."""
+        key_start = self._offset + SegmentLog.REC.size
+        return str(self._view[key_start:key_start + self.header[5]], "utf-8")
+
+    def _body_view(self) -> memoryview:
+        """Slice of the segment holding the body. Release it after use."""
+        payload_len, _, _, _, _, key_len = self.header
+        body_start = self._offset + SegmentLog.REC.size + key_len
+        return self._view[body_start:body_start + payload_len - key_len]
+
+    @property
+    def body(self) -> bytes:
+        """Copy of the body bytes as stored, maybe compressed."""
+        with self._body_view() as body:
+            return bytes(body)
+
+    def payload(self) -> dict:
+        """Decompress (if need be) and decode the body, straight from
+        the mapped segment.
+        """
+        with self._body_view() as body:
+            return SegmentLog.decode_body(self.header[3], body)
+
+
+class SegmentLog(object):
+    """Append-only, segmented record store for one name space directory.
+
+    Each segment is a pair of files, named for the time it was started:
+    - seg_<start usecs>.log: a file header (SEG_MAGIC, SEG_VERSION), then
+      records. Each record is a fixed binary header
+      (payload length, time in usecs as int64, level byte, flags byte,
+      logger id, key length), then the key, then the body. The body is
+      compact JSON, zlib-compressed when it is large enough to gain.
+    - seg_<start usecs>.idx: sidecar index, one fixed-size entry per
+      record: time in usecs, level number, record offset and length.
+
+    Records are appended under an exclusive flock, so several writers
+    can share a segment. A new segment is started when the active one
+    passes p_max_bytes. Segments whose newest record is older than
+    p_keep_days expire: both files are deleted. Readers mmap the files
+    and filter on the index, then on the record headers, so finding keys
+    never reads a body, and bodies are only decompressed when read.
+    Segments without the current file header, e.g. those written before
+    it was added, are never appended to and are skipped by readers; they
+    are deleted when they expire.
+    """
+
+    SEG_HEADER = struct.Struct("<4sB")
+    SEG_MAGIC: bytes = b"SKSG"
+    SEG_VERSION: int = 1
+    REC = struct.Struct("<IqBBIH")
+    IDX = struct.Struct("<qBII")
+    COMPRESSED: int = 1
+    COMPRESS_MIN: int = 256
+
+    def __init__(self, p_ns: str, p_max_bytes: int = 4 * 2**20, p_keep_days: int = 60):
+        """Initialize a segment log on a name space directory.
+
+        :Args:
+        - p_ns (str) name space directory, created on first append
+        - p_max_bytes (int) size at which a segment is rolled over
+        - p_keep_days (int) days after its newest record that a segment expires
+        """
+        self.ns_dir = Path(p_ns)
+        self.max_bytes = p_max_bytes
+        self.keep_usecs = p_keep_days * 86400 * 10**6
+
+    # Record encoding
+    # =========================================================================
+    @classmethod
+    def encode_body(cls, p_body: dict) -> tuple:
+        """Encode a body as compact JSON, compressed if it is large
+        enough and compression saves space.
+
+        :Returns:
+        - (flags, body bytes)
+        """
+        body = json.dumps(p_body, separators=(",", ":")).encode("utf-8")
+        if len(body) >= cls.COMPRESS_MIN:
+            packed = zlib.compress(body, 1)
+            if len(packed) < len(body):
+                return cls.COMPRESSED, packed
+        return 0, body
+
+    @classmethod
+    def decode_body(cls, p_flags: int, p_body) -> dict:
+        """Decode a body written by encode_body. p_body may be a memoryview."""
+        if p_flags & cls.COMPRESSED:
+            p_body = zlib.decompress(p_body)
+        return json.loads(str(p_body, "utf-8"))
+
+    @classmethod
+    def logger_id(cls, p_logger: str) -> int:
+        """Return the id stored in record headers for a logger name."""
+        return zlib.crc32(p_logger.encode("utf-8"))
+
+    # Segments
+    # =========================================================================
+    def segments(self) -> list:
+        """Return paths of segment .log files, oldest first."""
+        if not self.ns_dir.is_dir():
+            return []
+        return sorted(self.ns_dir.glob("seg_*.log"))
+
+    @classmethod
+    def _is_current(cls, p_head) -> bool:
+        """Return True if p_head starts with the current segment file header."""
+        return (len(p_head) >= cls.SEG_HEADER.size and cls.SEG_HEADER.unpack_from(p_head)
+                == (cls.SEG_MAGIC, cls.SEG_VERSION))
+
+    def _active_segment(self, p_ts: int) -> Path:
+        """Return the segment to append to, rolling over to a new one
+        (and expiring old ones) if the newest is full, is of an older
+        layout, or there is none.
+        """
+        segs = self.segments()
+        if segs and segs[-1].stat().st_size < self.max_bytes:
+            with open(segs[-1], "rb") as f:
+                head = f.read(self.SEG_HEADER.size)
+            # An empty file is a segment another writer has just created
+            if not head or self._is_current(head):
+                return segs[-1]
+        self.ns_dir.mkdir(parents=True, exist_ok=True)
+        if segs:
+            self.expire(p_ts)
+        return self.ns_dir / f"seg_{p_ts:020d}.log"
+
+    def expire(self, p_now: int = 0) -> list:
+        """Delete segments whose newest record is older than the keep time.
+        The newest segment is never expired.
+
+        :Args:
+        - p_now (int) current time in usecs; defaults to now
+        :Returns:
+        - (list) paths of the .log files deleted
+        """
+        cutoff = (p_now or time.time_ns() // 1000) - self.keep_usecs
+        expired = list()
+        for seg in self.segments()[:-1]:
+            last_ts = max((entry[0] for entry in self._read_index(seg)), default=0)
+            if last_ts < cutoff:
+                seg.with_suffix(".idx").unlink(missing_ok=True)
+                seg.unlink(missing_ok=True)
+                expired.append(seg)
+        return expired
+
+    # Writing
+    # =========================================================================
+    def append(self, p_key: str, p_msg: str, p_level: int, p_ts: int,
+               p_logger: str = ""):
+        """Append one record and its index entry.
+
+        :Args:
+        - p_key (str) record key
+        - p_msg (str) record message
+        - p_level (int) level number, e.g. 40 for ERROR
+        - p_ts (int) record time in usecs since the epoch
+        - p_logger (str) name of the logger or module writing the record
+        """
+        key = p_key.encode("utf-8")
+        flags, body = self.encode_body({"msg": p_msg, "logger": p_logger})
+        record = self.REC.pack(len(key) + len(body), p_ts, p_level, flags,
+                               self.logger_id(p_logger), len(key)) + key + body
+        seg = self._active_segment(p_ts)
+        fd = os.open(seg, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            offset = os.fstat(fd).st_size
+            if offset == 0:
+                offset = os.write(fd, self.SEG_HEADER.pack(self.SEG_MAGIC, self.SEG_VERSION))
+            os.write(fd, record)
+            with open(seg.with_suffix(".idx"), "ab") as idx:
+                idx.write(self.IDX.pack(p_ts, p_level, offset, len(record)))
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    # Reading
+    # =========================================================================
+    @classmethod
+    def _mmap(cls, p_path: Path):
+        """Return a read-only mmap of a file, or None if it is empty or gone."""
+        try:
+            with open(p_path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _read_index(self, p_seg: Path) -> list:
+        """Return the index entries of a segment as (time, level, offset,
+        length) tuples. A partly written last entry is ignored.
+        """
+        idx = self._mmap(p_seg.with_suffix(".idx"))
+        if idx is None:
+            return []
+        with idx:
+            full = len(idx) - len(idx) % self.IDX.size
+            return list(self.IDX.iter_unpack(idx[:full]))
+
+    def iter_views(self, p_key_pattern: str = "", p_levels: list = None,
+                   p_since: int = 0, p_until: int = 0, p_logger: str = None):
+        """Yield LogRecordViews oldest first, filtered on the index, then
+        on the record header, then on the key. No body is read.
+
+        :Args:
+        - p_key_pattern (str) substring the key must contain
+        - p_levels (list) level numbers to include; None for all
+        - p_since (int) earliest record time in usecs; 0 for no limit
+        - p_until (int) record time in usecs to stop before; 0 for no limit
+        - p_logger (str) logger name to match; None for all
+        :Yields:
+        - LogRecordView objects, valid until the next one is yielded
+        """
+        pattern = p_key_pattern.encode("utf-8")
+        logger_id = None if p_logger is None else self.logger_id(p_logger)
+        for seg in self.segments():
+            start_ts = int(seg.stem.split("_")[1])
+            if p_until and start_ts >= p_until:
+                break
+            entries = [e for e in self._read_index(seg)
+                       if (p_levels is None or e[1] in p_levels)
+                       and (not p_since or e[0] >= p_since)
+                       and (not p_until or e[0] < p_until)]
+            if not entries:
+                continue
+            data = self._mmap(seg)
+            if data is None:
+                continue
+            if not self._is_current(data):
+                data.close()
+                continue
+            with data:
+                view = memoryview(data)
+                try:
+                    for _, _, offset, length in entries:
+                        if offset + length > len(data):
+                            continue
+                        rec = LogRecordView(view, offset)
+                        _, _, _, _, rec_logger_id, key_len = rec.header
+                        if logger_id is not None and rec_logger_id != logger_id:
+                            continue
+                        key_start = offset + self.REC.size
+                        if pattern and pattern not in bytes(view[key_start:key_start + key_len]):
+                            continue
+                        try:
+                            yield rec
+                        finally:
+                            rec._view = None
+                finally:
+                    view.release()
+
+    def iter_records(self, p_key_pattern: str = "", p_levels: list = None,
+                     p_since: int = 0, p_until: int = 0, p_with_msg: bool = True):
+        """Yield (key, message) records oldest first. See iter_views.
+
+        :Args:
+        - p_with_msg (bool) if False, yield None instead of the message,
+          and leave the body unread
+        :Yields:
+        - (key, message) tuples
+        """
+        for rec in self.iter_views(p_key_pattern, p_levels, p_since, p_until):
+            yield rec.key, (rec.payload()["msg"] if p_with_msg else None)
+
+
 class WireTap(object):
     """Interface for writing to Log and Monitor name spaces.
 
@@ -40,6 +354,9 @@ class WireTap(object):
     - Break out generic services to saskan_methods
     """
 
+    LEVELS: dict = {"FATAL": 50, "ERROR": 40, "WARNING": 30, "INFO": 20, "DEBUG": 10}
+    LEVEL_NAMES: dict = {lvl: nm for nm, lvl in LEVELS.items()}
+
     def __init__(self):
         """Initialize WireTap object.
 
@@ -88,6 +405,7 @@ class WireTap(object):
         self.log_level = self.llvl["DEBUG"]
         # self.log_level = self.llvl["NOTSET"]
         self.mon_dir_nm = "/dev/shm/saskan/cache/mon"  # not used yet
+        self.log_seg = SegmentLog(self.log_dir_nm)
 
     # Helper functions
     # =========================================================================
@@ -109,15 +427,16 @@ class WireTap(object):
 
     @classmethod
     def convert_dict_to_bytes(self, p_msg: dict) -> object:
-        """Convert Python dict to compressed JSON bytes."""
-        msg_json: str = json.dumps(p_msg)
-        return zlib.compress(bytes(msg_json, "utf-8"))
+        """Convert Python dict to compact JSON bytes, led by a flags byte.
+        Only compressed if it is large enough to gain from it.
+        """
+        flags, body = SegmentLog.encode_body(p_msg)
+        return bytes([flags]) + body
 
     @classmethod
     def convert_bytes_to_dict(self, p_msg: bytes) -> dict:
-        """Convert compressed JSON bytes to Python dict."""
-        msg_dict = zlib.decompress(p_msg)
-        return json.loads(msg_dict)
+        """Convert bytes from convert_dict_to_bytes to Python dict."""
+        return SegmentLog.decode_body(p_msg[0], memoryview(p_msg)[1:])
 
     @classmethod
     def get_hash(cls, p_data_in: str) -> str:
@@ -226,21 +545,18 @@ class WireTap(object):
 
         def write_log(p_lvl, p_msg):
             """
-            Since the log message is just a string, there does not
-            appear to be any advantage in pickling the message file.
-            No commpression savings, likely takes more time to pickle
-            and unpickle than to write the string to a file.
-            If I want to save space, then I should compress the log
-            files. No point to it though, when writing to memory.
-            Compress when archiving to disk.
+            Append the message to the log name space's segment log.
+            The record key keeps the old file name format, so keys
+            can still be searched by level, date or UUID. The level is
+            in the record header, so it is not repeated in the message.
             """
-            log_dt = WireTap.get_iso_timestamp(datetime.utcnow())
+            log_time = datetime.utcnow()
+            log_dt = WireTap.get_iso_timestamp(log_time)
             expire_dt = WireTap.set_expire_dt()
             uuid = WireTap.get_token(16)
             rec_nm = f"log~{p_lvl}~{log_dt}~{expire_dt}~{uuid}"
-            msg = p_lvl + "~" + p_msg
-            FM.write_file(path.join(self.log_dir_nm, rec_nm), msg)
-            # FM.pickle_object(path.join(self.log_dir_nm, rec_nm), msg)
+            log_ts = int(log_time.replace(tzinfo=timezone.utc).timestamp() * 10**6)
+            self.log_seg.append(rec_nm, p_msg, self.llvl[p_lvl], log_ts, p_name or "")
 
         # log() MAIN
         # ==========================================================
@@ -275,18 +591,31 @@ class WireTap(object):
 
     # Generic DDL functions
     # =========================================================================
+    @classmethod
+    def key_levels(cls, p_key_pattern: str) -> list:
+        """Return the level numbers a key pattern can match, or None if any.
+        Keys start with log~<LEVEL>~, so a pattern starting with log~
+        limits the levels and lets the index skip other records.
+        """
+        if not p_key_pattern.startswith("log~"):
+            return None
+        parts = p_key_pattern.split("~")
+        if len(parts) > 2:
+            return [lvl for nm, lvl in WireTap.LEVELS.items() if nm == parts[1]]
+        return [lvl for nm, lvl in WireTap.LEVELS.items() if nm.startswith(parts[1])]
+
     @classmethod
     def find_keys(cls, p_ns: str, p_key_pattern: str):
         """Return keys of records that match search pattern."""
-        keys = FM.get_dir(p_ns)
-        keys = [f for f in keys if p_key_pattern in str(f)]
+        keys = [path.join(p_ns, key) for key, _ in SegmentLog(p_ns).iter_records(
+            p_key_pattern, WireTap.key_levels(p_key_pattern), p_with_msg=False)]
         return sorted(keys)
 
     @classmethod
     def count_keys(cls, p_ns: str, p_key_pattern: str):
         """Return number of keys that match search pattern."""
-        keys = WireTap.find_keys(p_ns, p_key_pattern)
-        return len(keys)
+        return sum(1 for _ in SegmentLog(p_ns).iter_records(
+            p_key_pattern, WireTap.key_levels(p_key_pattern), p_with_msg=False))
 
     @classmethod
     def get_records(cls, p_ns: str, p_key_pattern: str):
@@ -298,13 +627,11 @@ class WireTap(object):
         :Returns:
         - recs (list) - list of (record data dicts)
         """
-        recs = list()
-        keys = WireTap.find_keys(p_ns, p_key_pattern)
-        for key in keys:
-            # _, _, rec = FM.unpickle_object(key)
-            rec = FM.get_file(key)
-            recs.append((key, rec))
-        return recs
+        recs = [(path.join(p_ns, rec.key),
+                 f"{WireTap.LEVEL_NAMES[rec.level]}~{rec.payload()['msg']}")
+                for rec in SegmentLog(p_ns).iter_views(
+                    p_key_pattern, WireTap.key_levels(p_key_pattern))]
+        return sorted(recs)
 
     # Reporting functions
     # =========================================================================
@@ -312,9 +639,9 @@ class WireTap(object):
         """Dump all log records to console.
         Move this to a reporting module.
         """
-        log_recs = WireTap.get_records(self.log_dir_nm, "log~")
-        for rec in log_recs:
-            print(rec)
+        for rec in self.log_seg.iter_views("log~"):
+            print((path.join(self.log_dir_nm, rec.key),
+                   f"{WireTap.LEVEL_NAMES[rec.level]}~{rec.payload()['msg']}"))
 
 
 if __name__ == "__main__":
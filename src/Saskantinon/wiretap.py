@@ -12,9 +12,17 @@
 
 ### Detailed Explanation
 
-- **SQLiteHandler:** A custom logging handler that logs to an SQLite database.
+- **SQLiteHandler:** A queue-backed logging handler that logs to an SQLite database.
 
-  - **emit():** Overrides the `emit` method of `Handler` to log records to the database.
+  - **prepare():** Formats the record on the calling thread and attaches its LOGS row.
+
+  - **enqueue():** Puts the record on a bounded queue, applying the overflow policy.
+
+- **BatchQueueListener:** Drains the queue on its own thread, in batches.
+
+- **LogWriter:** Writes each batch to the LOGS table, one executemany per batch.
+
+- **LogStore:** Keeps LOGS in daily or size-limited partition files, with retention.
 
 - **DatabaseLogger**: Manages logging operations using standard Python logging modules,
   with output directed to an SQLite database.
@@ -28,9 +36,13 @@
     - Logging methods (`debug`, `info`, `warning`, `error`, `critical`)
         are provided to log messages at various severities.
 
-    - `query_logs()`: Retrieves log records from the database.
+    - `query_logs()`: Retrieves a page of log records, filtered by level,
+        time range, logger name and message text.
 
-    - `clear_logs()`: Deletes all existing logs.
+    - `count_logs()`, `top_errors()`: Counts per level per minute (or other
+        bucket), and the most frequent error signatures.
+
+    - `clear_logs()`: Deletes all logs, or those older than n days.
 
 - **Logging Format and Handling Exceptions:** The `DatabaseLogger` facilitates
    a flexible format string, efficiently converts log levels and timestamps,
@@ -41,60 +53,667 @@ This design assumes a robust `DataBase` class that handles all database operatio
   and transactions.
 """
 import logging
+import queue
+import re
+import threading
+import time
+from contextlib import suppress
+from copy import copy
+from datetime import datetime, timezone
 from logging import Handler, LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 from data_base import DataBase
+from data_structs import EntityType
 from method_files import FileMethods
 from method_shell import ShellMethods
 
+import data_model as DM
+
 FM = FileMethods()
 SM = ShellMethods()
 
 
-class SQLiteHandler(Handler):
+class LogStore(object):
     """
-    SQLite logging handler for inserting logging records into an SQLite database table.
-    @DEV:
-    - May  want to move this to the set_data module, but since it is so closely
-      tied to logging might be OK to leave it here.
+    Partitioned storage for log records, kept out of the main DB so that
+    neither it nor its backups grow with every session.
+
+    Each partition is its own SQLite file, LOGS_<yyyymmdd>_<nn>.db, in the
+    log_db_dir directory, holding a LOGS table indexed on time and level.
+    A new partition starts each day (UTC), or sooner when the active one
+    passes log_partition_mb. When a partition is rotated out, it is
+    vacuumed and the retention policy runs: partitions older than
+    log_keep_days are deleted, then the oldest ones until all of them
+    fit in log_keep_mb. The active partition is never deleted by retention.
+
+    Use get_store() rather than LogStore() so that every handler writing
+    to the same directory shares one store, and one active partition.
+
+    Queries (query, count_by_level, top_errors) read the partitions
+    newest first, skipping any outside the time range, and use the time
+    and level indexes. If log_fts is on, each new partition also gets a
+    LOGS_FTS trigram full-text table, so message substring searches are
+    indexed too.
+    """
+
+    FTS_SQL: str = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS LOGS_FTS
+            USING fts5(log_uid_pk UNINDEXED, log_msg, tokenize='trigram');
+        CREATE TRIGGER IF NOT EXISTS LOGS_FTS_INSERT AFTER INSERT ON LOGS BEGIN
+            INSERT INTO LOGS_FTS (log_uid_pk, log_msg) VALUES (new.log_uid_pk, new.log_msg);
+        END;
+        CREATE TRIGGER IF NOT EXISTS LOGS_FTS_DELETE AFTER DELETE ON LOGS BEGIN
+            DELETE FROM LOGS_FTS WHERE log_uid_pk = old.log_uid_pk;
+        END;"""
+    BUCKETS: dict = {"day": 10, "hour": 13, "minute": 16, "second": 19}
+
+    _stores: dict = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, p_context: dict):
+        """
+        Initialize the store. No file is created until the first write.
+
+        :param p_context: Context dict.
+        """
+        self.CONTEXT = p_context
+        self.LOG_DIR = Path(p_context.get("log_db_dir", "db/logs"))
+        self.PARTITION_BYTES = int(float(p_context.get("log_partition_mb", 64)) * 2**20)
+        self.KEEP_DAYS = int(p_context.get("log_keep_days", 14))
+        self.KEEP_BYTES = int(float(p_context.get("log_keep_mb", 512)) * 2**20)
+        self.FTS = p_context.get("log_fts", True)
+        self.FETCH_SIZE = p_context.get("db_fetch_size", 1000)
+        self.active_path = None
+        self.DB = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_store(cls, p_context: dict) -> "LogStore":
+        """
+        Return the shared store for the context's log_db_dir, creating it
+        on first use.
+
+        :param p_context: Context dict.
+        :return: LogStore object.
+        """
+        log_dir = str(Path(p_context.get("log_db_dir", "db/logs")).resolve())
+        with cls._stores_lock:
+            if log_dir not in cls._stores:
+                cls._stores[log_dir] = cls(p_context)
+            return cls._stores[log_dir]
+
+    # Partitions
+    # ===========================================
+    def partitions(self) -> list:
+        """
+        :return: Paths of all partition files, oldest first.
+        """
+        return sorted(self.LOG_DIR.glob("LOGS_*.db"))
+
+    def partition_size(self, p_path: Path) -> int:
+        """
+        :param p_path: Path of a partition file.
+        :return: Bytes used by the partition, counting its write-ahead log.
+        """
+        wal_path = Path(f"{p_path}-wal")
+        return sum(p.stat().st_size for p in (p_path, wal_path) if p.exists())
+
+    def get_partition_db(self, p_path: Path) -> DataBase:
+        """
+        :param p_path: Path of a partition file.
+        :return: DataBase object whose main DB is the partition.
+        """
+        return DataBase(dict(self.CONTEXT, saskan_db=str(p_path)))
+
+    def _open_partition(self, p_day: str):
+        """'PRIVATE'
+        Make the newest partition for a day the active one, unless it is
+        full, in which case start the next one. Creates the file, its
+        LOGS table and indexes if needed.
+        :param p_day: Day of the partition, as yyyymmdd.
+        """
+        day_parts = sorted(self.LOG_DIR.glob(f"LOGS_{p_day}_*.db"))
+        if day_parts and self.partition_size(day_parts[-1]) < self.PARTITION_BYTES:
+            path = day_parts[-1]
+        else:
+            seq = int(day_parts[-1].stem.split("_")[-1]) + 1 if day_parts else 0
+            path = self.LOG_DIR / f"LOGS_{p_day}_{seq:02d}.db"
+        self.LOG_DIR.mkdir(parents=True, exist_ok=True)
+        is_new = not path.exists()
+        self.active_path, self.DB = path, self.get_partition_db(path)
+        if is_new:
+            self.DB.execute_ddl(["CREATE_LOGS"], False)
+            if self.FTS:
+                pool = self.DB.get_pool(str(path))
+                conn = pool.acquire()
+                try:
+                    conn.executescript(self.FTS_SQL)
+                finally:
+                    pool.release(conn)
+
+    def get_db(self) -> DataBase:
+        """
+        Return the DataBase for the active partition, rotating first if
+        the day has changed or the active partition is full. Rotation
+        compacts the partition it closes and applies retention.
+
+        :return: DataBase object for the active partition.
+        """
+        day = datetime.now(timezone.utc).strftime("%Y%m%d")
+        with self._lock:
+            if self.active_path is None or not self.active_path.exists():
+                self._open_partition(day)
+                self.apply_retention()
+            elif (not self.active_path.name.startswith(f"LOGS_{day}_")
+                    or self.partition_size(self.active_path) >= self.PARTITION_BYTES):
+                closed_path, closed_db = self.active_path, self.DB
+                self._open_partition(day)
+                closed_db.vacuum_db(str(closed_path))
+                closed_db.drop_pool(str(closed_path))
+                self.apply_retention()
+            return self.DB
+
+    def _drop_partition(self, p_path: Path):
+        """'PRIVATE'
+        Close connections to a partition and delete its files.
+        """
+        DB = self.get_partition_db(p_path)
+        DB.drop_pool(str(p_path))
+        DB.remove_wal_files(str(p_path))
+        p_path.unlink(missing_ok=True)
+        if p_path == self.active_path:
+            self.active_path, self.DB = None, None
+
+    # Retention
+    # ===========================================
+    def apply_retention(self) -> list:
+        """
+        Delete partitions older than log_keep_days, then the oldest
+        partitions until the rest fit in log_keep_mb.
+
+        :return: Paths of the partitions deleted.
+        """
+        cutoff = datetime.fromtimestamp(
+            time.time() - self.KEEP_DAYS * 86400, timezone.utc).strftime("%Y%m%d")
+        dropped: list = []
+        with self._lock:
+            parts = [p for p in self.partitions() if p != self.active_path]
+            for path in [p for p in parts if p.stem.split("_")[1] < cutoff]:
+                self._drop_partition(path)
+                dropped.append(path)
+                parts.remove(path)
+            total = sum(self.partition_size(p) for p in parts)
+            if self.active_path is not None:
+                total += self.partition_size(self.active_path)
+            while parts and total > self.KEEP_BYTES:
+                path = parts.pop(0)
+                total -= self.partition_size(path)
+                self._drop_partition(path)
+                dropped.append(path)
+        return dropped
+
+    def clear(self, p_older_than_days: int = 0) -> list:
+        """
+        Delete log partitions, whatever the retention settings.
+
+        :param p_older_than_days: Delete only partitions more than this
+            many days old. 0 deletes all of them, including the active one.
+        :return: Paths of the partitions deleted.
+        """
+        cutoff = datetime.fromtimestamp(
+            time.time() - p_older_than_days * 86400, timezone.utc).strftime("%Y%m%d")
+        dropped: list = []
+        with self._lock:
+            for path in self.partitions():
+                if p_older_than_days == 0 or path.stem.split("_")[1] < cutoff:
+                    self._drop_partition(path)
+                    dropped.append(path)
+        return dropped
+
+    # Queries
+    # ===========================================
+    @classmethod
+    def to_utc_iso(cls, p_time) -> str:
+        """
+        :param p_time: A datetime (naive means local time), or an ISO
+            string, which is returned as is.
+        :return: The time as a UTC ISO string, comparable to log_dttm.
+        """
+        if isinstance(p_time, datetime):
+            return p_time.astimezone(timezone.utc).isoformat(timespec="microseconds")
+        return p_time
+
+    @classmethod
+    def get_levels(cls, p_levels) -> list:
+        """
+        :param p_levels: A list of level names, or one level name meaning
+            that level and every level above it, e.g. "WARNING".
+        :return: List of level names.
+        """
+        if isinstance(p_levels, str):
+            min_level = logging.getLevelName(p_levels.upper())
+            if not isinstance(min_level, int):
+                raise ValueError(f"Unknown log level: {p_levels}")
+            return [lvl for lvl in EntityType.LOG_LEVEL
+                    if logging.getLevelName(lvl) >= min_level]
+        return [lvl.upper() for lvl in p_levels]
+
+    @classmethod
+    def get_signature(cls, p_msg: str, p_exception_info: str) -> str:
+        """
+        Reduce a log record to an error signature: the last line of its
+        traceback if it has one, else its message, with numbers replaced
+        by # so that records differing only in ids, counts or times match.
+        """
+        text = p_msg
+        if p_exception_info and p_exception_info != "None":
+            text = p_exception_info.strip().splitlines()[-1]
+        return re.sub(r"\b0x[0-9a-fA-F]+\b|[0-9a-f]{32}|\d+", "#", text)
+
+    def _has_fts(self, p_conn) -> bool:
+        """'PRIVATE'
+        Tell whether the partition open on p_conn has a LOGS_FTS table.
+        """
+        return p_conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'LOGS_FTS'"
+                              ).fetchone() is not None
+
+    def _where(self, p_conn, p_levels=None, p_since="", p_until="", p_logger: str = "",
+               p_text: str = "", p_cursor: str = "") -> tuple:
+        """'PRIVATE'
+        Build the WHERE clause and parameters for the query filters.
+        See query() for the filters.
+        :return: (SQL WHERE clause, list of parameters)
+        """
+        where: list = []
+        params: list = []
+        if p_levels:
+            levels = self.get_levels(p_levels)
+            where.append(f"log_level IN ({', '.join('?' * len(levels))})")
+            params += levels
+        if p_since:
+            where.append("log_dttm >= ?")
+            params.append(self.to_utc_iso(p_since))
+        if p_until:
+            where.append("log_dttm < ?")
+            params.append(self.to_utc_iso(p_until))
+        if p_logger:
+            where.append("(logger_name = ? OR logger_name LIKE ? ESCAPE '\\')")
+            params += [p_logger, re.sub(r"([%_\\])", r"\\\1", p_logger) + ".%"]
+        if p_text:
+            if (len(p_text) >= 3 and not re.search(r"[%_]", p_text)
+                    and self._has_fts(p_conn)):
+                where.append("log_uid_pk IN (SELECT log_uid_pk FROM LOGS_FTS " +
+                             "WHERE log_msg LIKE ?)")
+                params.append(f"%{p_text}%")
+            else:
+                where.append("log_msg LIKE ? ESCAPE '\\'")
+                params.append("%" + re.sub(r"([%_\\])", r"\\\1", p_text) + "%")
+        if p_cursor:
+            cursor_dttm, cursor_uid = p_cursor.split("|")
+            where.append("(log_dttm < ? OR (log_dttm = ? AND log_uid_pk < ?))")
+            params += [cursor_dttm, cursor_dttm, cursor_uid]
+        return (" WHERE " + " AND ".join(where) if where else ""), params
+
+    def _read_partitions(self, p_sql: str, p_filters: dict, p_suffix: str = "",
+                         p_suffix_params: list = None):
+        """'PRIVATE'
+        Run a query on each partition in the filters' time range, newest
+        first, on pooled read-only connections.
+        :param p_sql: SELECT ... FROM LOGS, without a WHERE clause.
+        :param p_filters: Filters, as for query().
+        :param p_suffix: SQL to put after the WHERE clause, e.g. GROUP BY.
+        :param p_suffix_params: Parameters for p_suffix.
+        :yields: Lists of row tuples, one list per fetchmany.
+        """
+        since_day = self.to_utc_iso(p_filters.get("p_since") or "")[:10].replace("-", "")
+        until_day = self.to_utc_iso(p_filters.get("p_until") or "")[:10].replace("-", "")
+        for path in reversed(self.partitions()):
+            day = path.stem.split("_")[1]
+            if until_day and day > until_day:
+                continue
+            if since_day and day < since_day:
+                break
+            pool = self.get_partition_db(path).get_pool(str(path), p_read_only=True)
+            conn = pool.acquire()
+            cursor = conn.cursor()
+            try:
+                where, params = self._where(conn, **p_filters)
+                cursor.execute(p_sql + where + p_suffix, params + (p_suffix_params or []))
+                while batch := cursor.fetchmany(self.FETCH_SIZE):
+                    yield batch
+            finally:
+                cursor.close()
+                pool.release(conn)
+
+    def query(self, p_levels=None, p_since="", p_until="", p_logger: str = "",
+              p_text: str = "", p_cursor: str = "", p_limit: int = 100) -> tuple:
+        """
+        Return one page of log records, newest first.
+        Usage:
+            rows, cursor = store.query(p_levels="WARNING", p_text="timeout")
+            while cursor:
+                rows, cursor = store.query(p_levels="WARNING", p_text="timeout",
+                                           p_cursor=cursor)
+
+        :param p_levels: List of level names, or one name for that level and up.
+        :param p_since: Earliest log time, a datetime or UTC ISO string.
+        :param p_until: Log time to stop before, a datetime or UTC ISO string.
+        :param p_logger: Logger name. Its child loggers match too.
+        :param p_text: Substring of the message, not case-sensitive.
+        :param p_cursor: Cursor returned with the previous page.
+        :param p_limit: Most records to return.
+        :return: (list of LOGS namedtuple rows, cursor for the next page,
+            or "" if this is the last page)
+        """
+        filters = {"p_levels": p_levels, "p_since": p_since, "p_until": p_until,
+                   "p_logger": p_logger, "p_text": p_text, "p_cursor": p_cursor}
+        make_row = DM.get_schema(DM.get_model("LOGS")).row_type._make
+        rows: list = []
+        batches = self._read_partitions(
+            "SELECT * FROM LOGS", filters,
+            " ORDER BY log_dttm DESC, log_uid_pk DESC LIMIT ?", [p_limit])
+        for batch in batches:
+            rows.extend(map(make_row, batch[:p_limit - len(rows)]))
+            if len(rows) >= p_limit:
+                batches.close()
+                break
+        cursor = f"{rows[-1].log_dttm}|{rows[-1].log_uid_pk}" if len(rows) >= p_limit else ""
+        return rows, cursor
+
+    def count_by_level(self, p_bucket: str = "minute", **p_filters) -> list:
+        """
+        Count log records per time bucket and level.
+
+        :param p_bucket: day, hour, minute or second.
+        :param p_filters: Filters, as for query(), except p_cursor.
+        :return: List of (bucket start as UTC ISO prefix, level, count),
+            oldest first.
+        """
+        width = self.BUCKETS[p_bucket]
+        counts: dict = {}
+        for batch in self._read_partitions(
+                f"SELECT substr(log_dttm, 1, {width}), log_level, COUNT(*) FROM LOGS",
+                p_filters, " GROUP BY 1, 2"):
+            for bucket, level, cnt in batch:
+                counts[(bucket, level)] = counts.get((bucket, level), 0) + cnt
+        return [(bucket, level, cnt) for (bucket, level), cnt in sorted(counts.items())]
+
+    def top_errors(self, p_limit: int = 10, p_levels="ERROR", **p_filters) -> list:
+        """
+        Find the most frequent error signatures (see get_signature).
+
+        :param p_limit: Most signatures to return.
+        :param p_levels: Levels to include. Defaults to ERROR and up.
+        :param p_filters: Other filters, as for query(), except p_cursor.
+        :return: List of (signature, count, last seen log_dttm, example
+            log_msg), most frequent first.
+        """
+        found: dict = {}
+        for batch in self._read_partitions(
+                "SELECT log_msg, exception_info, log_dttm FROM LOGS",
+                dict(p_filters, p_levels=p_levels)):
+            for msg, exception_info, log_dttm in batch:
+                sig = self.get_signature(msg, exception_info)
+                cnt, last_seen, example = found.get(sig, (0, "", msg))
+                if log_dttm > last_seen:
+                    last_seen, example = log_dttm, msg
+                found[sig] = (cnt + 1, last_seen, example)
+        top = sorted(found.items(), key=lambda item: -item[1][0])[:p_limit]
+        return [(sig, cnt, last_seen, example) for sig, (cnt, last_seen, example) in top]
+
+
+class LogWriter(Handler):
+    """
+    Write batches of prepared log records to the active LogStore partition.
+    Runs on the BatchQueueListener thread, never on the thread that logs,
+    so partition rotation, compaction and retention run there too.
     """
 
-    def __init__(self):
+    def __init__(self, p_context: dict):
         """
-        Initialize the IO handler.
+        Initialize the writer.
 
-        :param db: An instance of the DataBase class to handle database operations.
+        :param p_context: Context dict, naming where to store logs.
         """
         super().__init__()
-        self.CONTEXT = FM.get_json_file("static/context/context.json")
-        self.USERDATA = FM.get_json_file("static/context/userdata.json")
-        self.DB = DataBase(self.CONTEXT)
+        self.store = LogStore.get_store(p_context)
 
     def emit(self, record: LogRecord):
         """
-        Emit a record.
+        Write a single prepared record.
 
-        Insert the log record into the LOGS table within the database.
+        :param record: A LogRecord prepared by SQLiteHandler.prepare().
+        """
+        self.emit_batch([record])
 
-        :param record: A LogRecord object containing all the pertinent information.
+    def emit_batch(self, p_records: list):
+        """
+        Insert prepared records with one executemany, in one transaction.
+
+        :param p_records: List of LogRecords prepared by SQLiteHandler.prepare().
         """
         try:
-            # Format record
-            log_time = self.formatTime(record, SM.get_iso_time_stamp())
-            log_level = record.levelname
-            message = self.formatMessage(record)
-            exception_info = (
-                self.formatException(record.exc_info) if record.exc_info else "None"
-            )
-
-            # Can we use traceback here to capture the stack trace if there was an exception?
-
-            # Insert into database
-            self.DB.execute_insert(
-                "LOGS", (SM.get_uid(), log_time, log_level, message, exception_info)
-            )
+            with self.store._lock:
+                chunk_errors = self.store.get_db().execute_insert_many(
+                    "LOGS", [record.log_row for record in p_records], len(p_records))
+            if chunk_errors:
+                raise RuntimeError(chunk_errors[0]["error"])
         except Exception as e:
             print(e)
-            self.handleError(record)
+            self.handleError(p_records[0])
+
+
+class BatchQueueListener(QueueListener):
+    """
+    A QueueListener that drains its queue in batches.
+    A batch is written when it holds p_batch_size records, or when
+    p_flush_secs have passed since its first record, whichever comes first.
+    """
+
+    def __init__(self, p_queue: queue.Queue, p_writer: LogWriter,
+                 p_handler: "SQLiteHandler", p_batch_size: int, p_flush_secs: float):
+        """
+        Initialize the listener.
+
+        :param p_queue: The queue that SQLiteHandler puts records on.
+        :param p_writer: LogWriter to write each batch with.
+        :param p_handler: The SQLiteHandler, to collect its count of dropped records.
+        :param p_batch_size: Most records to write in one batch.
+        :param p_flush_secs: Longest time a record waits in a partial batch.
+        """
+        super().__init__(p_queue, p_writer)
+        self.writer = p_writer
+        self.handler = p_handler
+        self.batch_size = max(1, p_batch_size)
+        self.flush_secs = max(0.0, p_flush_secs)
+
+    def enqueue_sentinel(self):
+        """
+        Put the stop marker on the queue, waiting for room if it is full.
+        """
+        self.queue.put(self._sentinel)
+
+    def _monitor(self):
+        """'PRIVATE'
+        Listener thread loop. Collect records into a batch until it is
+        full or its time is up, then write it. Stop at the sentinel,
+        after writing whatever was queued ahead of it.
+        """
+        stopping = False
+        while not stopping:
+            batch: list = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    record = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    self.queue.task_done()
+                    stopping = True
+                    break
+                batch.append(record)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_secs
+            dropped = self.handler.take_dropped()
+            if dropped:
+                batch.append(self.handler.prepare(logging.makeLogRecord({
+                    "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                    "msg": f"{dropped} log records dropped: queue full"})))
+            if batch:
+                self.writer.emit_batch(batch)
+                for _ in range(len(batch) - (1 if dropped else 0)):
+                    self.queue.task_done()
+
+
+class SQLiteHandler(QueueHandler):
+    """
+    Queue-backed logging handler that writes records to the LOGS table.
+
+    The thread that logs only formats the record and puts it on a bounded
+    queue. A BatchQueueListener thread writes the queue to the database
+    in batches, with one executemany and one commit per batch.
+
+    When the queue is full, the log_overflow context setting decides
+    what happens to a new DEBUG or INFO record:
+    - drop_oldest: discard the oldest queued DEBUG/INFO record to make
+      room; if there is none, discard the new record
+    - drop_newest: discard the new record
+    - block: wait up to log_flush_secs for room, then discard the new record
+    WARNING and above are never discarded, whatever the setting. A full
+    queue makes room for them by discarding its oldest DEBUG/INFO record;
+    if it holds none, the logging thread blocks until there is room. So
+    the listener thread itself must not log through this handler.
+    Discarded records are counted, and the count is logged as a WARNING
+    with the next batch.
+    """
+
+    OVERFLOW: list = ["block", "drop_newest", "drop_oldest"]
+
+    def __init__(self, p_context: dict = None):
+        """
+        Initialize the handler and start its listener thread.
+
+        :param p_context: Context dict. Defaults to static/context/context.json.
+        """
+        self.CONTEXT = p_context or FM.get_json_file("static/context/context.json")
+        super().__init__(queue.Queue(int(self.CONTEXT.get("log_queue_size", 10000))))
+        self.overflow = self.CONTEXT.get("log_overflow", "drop_oldest")
+        if self.overflow not in self.OVERFLOW:
+            raise ValueError(f"log_overflow must be one of {self.OVERFLOW}, not {self.overflow}")
+        self.flush_secs = float(self.CONTEXT.get("log_flush_secs", 1.0))
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+        self.writer = LogWriter(self.CONTEXT)
+        self.store = self.writer.store
+        self.listener = BatchQueueListener(
+            self.queue, self.writer, self,
+            int(self.CONTEXT.get("log_batch_size", 200)), self.flush_secs)
+        self.listener.start()
+        self._running = True
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """
+        Format the record on the calling thread, while its args and
+        exception are current, and attach its LOGS row as record.log_row.
+        Level names that are not in EntityType.LOG_LEVEL, like custom
+        levels, are logged as the standard level just below them.
+
+        :param record: A LogRecord object containing all the pertinent information.
+        :return: A copy of the record, holding only formatted text.
+        """
+        formatter = self.formatter or logging.Formatter()
+        record.message = record.getMessage()
+        if formatter.usesTime():
+            record.asctime = formatter.formatTime(record, formatter.datefmt)
+        message = formatter.formatMessage(record)
+        exception_info = (
+            formatter.formatException(record.exc_info) if record.exc_info else "None"
+        )
+        log_level = record.levelname
+        if log_level not in EntityType.LOG_LEVEL:
+            log_level = logging.getLevelName(min(50, record.levelno // 10 * 10))
+        log_time = datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+            timespec="microseconds")
+        record = copy(record)
+        record.msg, record.args = message, None
+        record.exc_info, record.exc_text, record.stack_info = None, None, None
+        record.log_row = (SM.get_uid(), log_time, log_level, record.name,
+                          message, exception_info, "")
+        return record
+
+    def _drop_oldest_low(self) -> bool:
+        """'PRIVATE'
+        Discard the oldest queued record below WARNING, and count it.
+        :return: True if a record was discarded.
+        """
+        with self.queue.mutex:
+            for ix, queued in enumerate(self.queue.queue):
+                if queued is not self.listener._sentinel and queued.levelno < logging.WARNING:
+                    del self.queue.queue[ix]
+                    self.queue.not_full.notify()
+                    break
+            else:
+                return False
+        self.queue.task_done()
+        with self._drop_lock:
+            self.dropped += 1
+        return True
+
+    def enqueue(self, record: LogRecord):
+        """
+        Put a prepared record on the queue, applying the overflow policy
+        if the queue is full. See the class docstring.
+
+        :param record: A LogRecord prepared by prepare().
+        """
+        if record.levelno >= logging.WARNING:
+            while True:
+                with suppress(queue.Full):
+                    self.queue.put_nowait(record)
+                    return
+                if not self._drop_oldest_low():
+                    with suppress(queue.Full):
+                        self.queue.put(record, timeout=self.flush_secs)
+                        return
+        try:
+            if self.overflow == "block":
+                self.queue.put(record, timeout=self.flush_secs)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == "drop_oldest" and self._drop_oldest_low():
+                with suppress(queue.Full):
+                    self.queue.put_nowait(record)
+                    return
+            with self._drop_lock:
+                self.dropped += 1
+
+    def take_dropped(self) -> int:
+        """
+        Return the count of records dropped since the last call, and reset it.
+        """
+        with self._drop_lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+    def flush(self):
+        """
+        Block until every queued record has been written.
+        """
+        if self._running:
+            self.queue.join()
+
+    def close(self):
+        """
+        Write whatever is queued, stop the listener thread and close.
+        """
+        if self._running:
+            self._running = False
+            self.listener.stop()
+        super().close()
 
 
 class Logger:
@@ -121,13 +740,15 @@ class Logger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)  # Default level is DEBUG
-        self.handler = SQLiteHandler()
+        handlers = [h for h in self.logger.handlers if isinstance(h, SQLiteHandler)]
+        self.handler = handlers[0] if handlers else SQLiteHandler()
         self.formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s "
-            + "- %(classname)s - %(funcName)s - %(lineno)d"
+            + "- %(module)s - %(funcName)s - %(lineno)d"
         )
         self.handler.setFormatter(self.formatter)
-        self.logger.addHandler(self.handler)
+        if not handlers:
+            self.logger.addHandler(self.handler)
 
     def set_log_level(self, level: int):
         """
@@ -190,24 +811,57 @@ class Logger:
         """
         self.logger.critical(message, *args, **kwargs)
 
-    def query_logs(self):
+    def flush(self):
+        """
+        Block until every record logged so far has been written.
+        """
+        self.handler.flush()
+
+    def query_logs(self, p_cursor: str = "", p_limit: int = 100, **p_filters) -> tuple:
         """
-        Query and return the logs from the LOGS table.
+        Query one page of logs, newest first. Records still queued are
+        written first. See LogStore.query for the filters.
 
-        :return: Query result as a list of log entries.
+        :param p_cursor: Cursor returned with the previous page.
+        :param p_limit: Most records to return.
+        :param p_filters: p_levels, p_since, p_until, p_logger, p_text.
+        :return: (list of LOGS rows, cursor for the next page or "")
         """
-        # Assuming that database class provides a way to execute a select
-        # query and return results.
-        # @DEV: Implement this method using appropriate DB call.
-        return self.db.execute_select("SELECT * FROM LOGS")
+        self.flush()
+        return self.handler.store.query(p_cursor=p_cursor, p_limit=p_limit, **p_filters)
 
-    def clear_logs(self):
+    def count_logs(self, p_bucket: str = "minute", **p_filters) -> list:
         """
-        Clear all logs from the LOGS table.
+        Count logs per level per time bucket. See LogStore.count_by_level.
+
+        :param p_bucket: day, hour, minute or second.
+        :param p_filters: p_levels, p_since, p_until, p_logger, p_text.
+        :return: List of (bucket, level, count), oldest first.
+        """
+        self.flush()
+        return self.handler.store.count_by_level(p_bucket, **p_filters)
+
+    def top_errors(self, p_limit: int = 10, **p_filters) -> list:
+        """
+        Find the most frequent error signatures. See LogStore.top_errors.
+
+        :param p_limit: Most signatures to return.
+        :param p_filters: p_levels (default ERROR and up), p_since,
+            p_until, p_logger, p_text.
+        :return: List of (signature, count, last seen, example message).
+        """
+        self.flush()
+        return self.handler.store.top_errors(p_limit, **p_filters)
+
+    def clear_logs(self, p_older_than_days: int = 0) -> list:
+        """
+        Clear logs by deleting LOGS partitions.
         @DEV:
-        - This should have an option to select logs older than x days.
         - May also want an "are you sure?" prompt.
+
+        :param p_older_than_days: Delete only partitions more than this
+            many days old. 0 deletes all logs.
+        :return: Paths of the partitions deleted.
         """
-        # Using a simple execute statement to clear existing logs.
-        # @DEV: Implement this method using appropriate DB call(s).
-        self.db.execute_delete("DELETE FROM LOGS")
+        self.flush()
+        return self.handler.store.clear(p_older_than_days)
@@ -0,0 +1,51 @@
+"""
+
+:module:    conftest.py
+:author:    GM (genuinemerit @ pm.me)
+
+Shared pytest fixtures for the data-layer tests.
+
+Modules in src/Saskantinon import each other by bare name, so that
+directory is put on sys.path, as is src for those that import from the
+Saskantinon package. Tests run from the project root, so the
+context and the committed schema bundle (boot/saskan_sql.json) are found,
+but every DB, backup and log file lives under pytest's tmp_path.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "src" / "Saskantinon"))
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch) -> dict:
+    """Context dict pointing every DB and log path into tmp_path."""
+    monkeypatch.chdir(ROOT)
+    with open(ROOT / "static" / "context" / "context.json") as f:
+        ctx = json.load(f)
+    ctx.update({
+        "db": str(tmp_path),
+        "saskan_db": str(tmp_path / "SASKAN.db"),
+        "saskan_bak": str(tmp_path / "SASKAN.bak"),
+        "saskan_snapshot": str(tmp_path / "saskan_snapshot.db"),
+        "log_db_dir": str(tmp_path / "logs"),
+    })
+    return ctx
+
+
+@pytest.fixture
+def db(context):
+    """DataBase object on a freshly created, empty scratch DB."""
+    import data_model as DM
+    from data_base import DataBase
+
+    DB = DataBase(context)
+    assert DM.create_db(DB, p_backup=False)
+    yield DB
+    DB.close_pool()
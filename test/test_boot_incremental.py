@@ -0,0 +1,92 @@
+"""
+
+:module:    test_boot_incremental.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for BootSaskan.boot_incremental: SQL errors and version stamping,
+and for when a boot has to be a full one.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def boot(db, context, tmp_path):
+    """BootSaskan wired to the scratch DB, without rewriting context.json."""
+    import boot as B
+
+    BS = B.BootSaskan.__new__(B.BootSaskan)
+    BS.CONTEXT = dict(context, boot_manifest=str(tmp_path / "boot_manifest.json"))
+    BS.DB = db
+    return BS
+
+
+def stamp(p_db, p_version: int):
+    p_db.connect_db(p_db.SASKAN_DB)
+    try:
+        p_db.cur.execute(f"PRAGMA user_version = {p_version};")
+    finally:
+        p_db.disconnect_db()
+
+
+def test_sql_error_raises(boot, monkeypatch):
+    import boot as B
+
+    monkeypatch.setattr(B.DM, "create_sql", lambda DB: False)
+    with pytest.raises(B.BootError):
+        boot.boot_incremental({"METADATA"})
+
+
+def test_rebuild_stamps_user_version(boot, db, monkeypatch):
+    import boot as B
+
+    monkeypatch.setattr(B.DM, "create_sql", lambda DB: True)
+    stamp(db, 0)
+    timings = boot.boot_incremental({"METADATA"})
+    assert "METADATA" in timings
+    assert db.get_user_version() == db.schema_user_version
+    assert db.execute_select_all("METADATA")["meta_uid_pk"]
+
+
+def save_manifest(p_boot):
+    Path(p_boot.CONTEXT["boot_manifest"]).write_text(json.dumps(p_boot.boot_manifest()))
+
+
+def test_unchanged_inputs_need_no_rebuild(boot):
+    save_manifest(boot)
+    assert boot.changed_tables(boot.boot_manifest()) == set()
+
+
+def test_unstamped_db_needs_full_boot(boot, db):
+    save_manifest(boot)
+    stamp(db, 0)
+    assert boot.changed_tables(boot.boot_manifest()) is None
+
+
+def test_failed_full_boot_forces_next_full_boot(boot, db, monkeypatch):
+    import boot as B
+    from collections import OrderedDict
+
+    def fail_texts() -> bool:
+        return False
+
+    monkeypatch.setattr(B.DM, "create_sql", lambda DB: True)
+    monkeypatch.setattr(boot, "boot_stages", lambda: OrderedDict(
+        [("METADATA", boot.boot_metadata), ("TEXTS", fail_texts)]))
+    # As if the last boot succeeded with the very same inputs
+    save_manifest(boot)
+    with pytest.raises(B.BootError):
+        boot.boot_saskan(p_full=True)
+    assert not Path(boot.CONTEXT["boot_manifest"]).exists()
+    assert boot.changed_tables(boot.boot_manifest()) is None
+
+
+def test_command_line_does_not_force_full_boot(boot, monkeypatch):
+    import boot as B
+
+    save_manifest(boot)
+    monkeypatch.setattr(B.sys, "argv", ["host.py", "--full"])
+    assert boot.changed_tables(boot.boot_manifest()) == set()
@@ -0,0 +1,71 @@
+"""
+
+:module:    test_boot_snapshot.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for the schema bundle version, user_version stamping and snapshots.
+"""
+
+import sqlite3 as sq3
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def boot(db, context):
+    """BootSaskan wired to the scratch DB, without rewriting context.json."""
+    import boot as B
+
+    BS = B.BootSaskan.__new__(B.BootSaskan)
+    BS.CONTEXT = context
+    BS.DB = db
+    return BS
+
+
+def stamp(p_db, p_version: int):
+    p_db.connect_db(p_db.SASKAN_DB)
+    try:
+        p_db.cur.execute(f"PRAGMA user_version = {p_version};")
+    finally:
+        p_db.disconnect_db()
+
+
+def test_bundle_version_is_stamped_on_new_db(db):
+    assert len(db.schema_version) >= 7
+    assert db.schema_user_version == int(db.schema_version[:7], 16)
+    assert db.get_user_version() == db.schema_user_version
+
+
+def test_make_snapshot_always_runs_full_boot(boot, db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(boot, "boot_saskan", lambda p_full=False: calls.append(p_full))
+    assert boot.make_snapshot()
+    assert calls == [True]
+    assert db.get_user_version(db.SASKAN_SNAPSHOT) == db.schema_user_version
+    conn = sq3.connect(db.SASKAN_SNAPSHOT)
+    try:
+        assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "delete"
+    finally:
+        conn.close()
+
+
+def test_make_snapshot_refuses_stale_schema(boot, db, monkeypatch):
+    import boot as B
+
+    monkeypatch.setattr(boot, "boot_saskan", lambda p_full=False: None)
+    stamp(db, 1)
+    with pytest.raises(B.BootError):
+        boot.make_snapshot()
+    assert not Path(db.SASKAN_SNAPSHOT).exists()
+
+
+def test_load_snapshot_checks_version(db):
+    assert db.save_snapshot()
+    assert db.load_snapshot()
+    conn = sq3.connect(db.SASKAN_SNAPSHOT)
+    try:
+        conn.execute("PRAGMA user_version = 1;")
+    finally:
+        conn.close()
+    assert not db.load_snapshot()
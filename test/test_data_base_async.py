@@ -0,0 +1,126 @@
+"""
+
+:module:    test_data_base_async.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for the AsyncDataBase worker-thread facade.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def adb(db, context):
+    from data_base_async import AsyncDataBase
+
+    ADB = AsyncDataBase(context, p_queue_size=4)
+    yield ADB
+    ADB.close()
+
+
+def test_submit_runs_on_worker(adb):
+    rows = [("t1", "en", "hello", "Hello", "")]
+    assert adb.submit("execute_insert_many", "TEXTS", rows).result(5) == []
+    found = adb.submit("execute_select_by_match", "TEXTS", {"text_id": "hello"}).result(5)
+    assert found[0]["text_value"] == "Hello"
+
+
+def test_awaitable_methods(adb):
+    async def run():
+        await adb.execute_insert_many("TEXTS", [("t1", "en", "hello", "Hello", "")])
+        return await adb.execute_select_all("TEXTS")
+    assert asyncio.run(run())["text_id"] == ["hello"]
+
+
+def test_submit_after_close_raises(adb):
+    adb.close()
+    with pytest.raises(RuntimeError):
+        adb.submit("execute_select_all", "TEXTS")
+
+
+def test_every_accepted_job_resolves_when_closing_concurrently(adb):
+    futures: list = []
+    start = threading.Barrier(5)
+
+    def submitter():
+        start.wait()
+        for _ in range(50):
+            try:
+                futures.append(adb.submit("execute_select_all", "TEXTS"))
+            except RuntimeError:
+                return
+
+    threads = [threading.Thread(target=submitter) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    adb.close()
+    for thread in threads:
+        thread.join()
+    for future in futures:
+        assert future.done() and future.exception(timeout=0) is None
+
+
+def test_private_methods_are_refused(adb):
+    with pytest.raises(AttributeError):
+        adb.submit("_flatten_values", ())
+
+
+def test_non_blocking_submit_is_not_held_up_by_a_blocked_one(db, context):
+    from data_base_async import AsyncDataBase
+    from queue import Full
+
+    ADB = AsyncDataBase(context, p_queue_size=1)
+    gate = threading.Event()
+    ADB.DB.gate = gate.wait
+    try:
+        slow = ADB.submit("gate", 5)  # the worker blocks on this one
+        ADB.submit("execute_select_all", "TEXTS")  # fills the queue
+        blocked = threading.Thread(
+            target=ADB.submit, args=("execute_select_all", "TEXTS"), daemon=True)
+        blocked.start()
+        blocked.join(0.1)
+        assert blocked.is_alive()
+        start = time.monotonic()
+        with pytest.raises(Full):
+            ADB.submit("execute_select_all", "TEXTS", p_block=False)
+        assert time.monotonic() - start < 0.05
+        gate.set()
+        blocked.join(5)
+        assert not blocked.is_alive()
+        assert slow.result(5) is True
+    finally:
+        gate.set()
+        ADB.close()
+
+
+def test_close_is_not_held_up_by_a_blocked_submit(db, context):
+    from data_base_async import AsyncDataBase
+
+    ADB = AsyncDataBase(context, p_queue_size=1)
+    gate = threading.Event()
+    ADB.DB.gate = gate.wait
+    ADB.submit("gate", 5)
+    ADB.submit("execute_select_all", "TEXTS")
+    errors: list = []
+
+    def blocked_submit():
+        try:
+            ADB.submit("execute_select_all", "TEXTS")
+        except RuntimeError as err:
+            errors.append(err)
+
+    blocked = threading.Thread(target=blocked_submit, daemon=True)
+    blocked.start()
+    blocked.join(0.1)
+    closer = threading.Thread(target=ADB.close, daemon=True)
+    closer.start()
+    blocked.join(1)
+    assert not blocked.is_alive() and errors
+    gate.set()
+    closer.join(5)
+    assert not closer.is_alive()
@@ -0,0 +1,79 @@
+"""
+
+:module:    test_data_base_backup.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for backup, archive, restore and snapshot loading of the main DB.
+"""
+
+import sqlite3 as sq3
+from pathlib import Path
+
+import pytest
+
+
+def text_rows(p_cnt: int, p_prefix: str = "t"):
+    return [(f"{p_prefix}{ix}", "en", f"id_{p_prefix}{ix}", f"value {ix}", "")
+            for ix in range(p_cnt)]
+
+
+def text_ids(p_db) -> set:
+    return set(p_db.execute_select_all("TEXTS")["text_uid_pk"])
+
+
+def test_backup_restore_round_trip(db):
+    assert db.execute_insert_many("TEXTS", text_rows(50)) == []
+    db.backup_db(db.SASKAN_DB, db.SASKAN_BAK)
+    assert db.execute_insert_many("TEXTS", text_rows(20, "x")) == []
+    assert len(text_ids(db)) == 70
+
+    db.restore_db(db.SASKAN_BAK)
+    assert text_ids(db) == {f"t{ix}" for ix in range(50)}
+    assert "restore" in db.execute_select_all("BACKUP")["bkup_type"]
+    assert not Path(f"{db.SASKAN_DB}.new").exists()
+
+
+def test_archive_restore_round_trip(db):
+    assert db.execute_insert_many("TEXTS", text_rows(30)) == []
+    archive = db.archive_db(db.SASKAN_DB)
+    db.execute_insert_many("TEXTS", text_rows(5, "x"))
+    db.restore_db(archive)
+    assert text_ids(db) == {f"t{ix}" for ix in range(30)}
+
+
+def test_bad_source_leaves_main_db_alone(db, tmp_path):
+    assert db.execute_insert_many("TEXTS", text_rows(10)) == []
+    junk = tmp_path / "junk.db"
+    junk.write_bytes(b"not a database" * 100)
+    with pytest.raises(sq3.DatabaseError):
+        db.restore_db(str(junk))
+    assert len(text_ids(db)) == 10
+    assert not Path(f"{db.SASKAN_DB}.new").exists()
+
+
+def test_corrupt_source_leaves_main_db_alone(db):
+    assert db.execute_insert_many("TEXTS", text_rows(500)) == []
+    db.backup_db(db.SASKAN_DB, db.SASKAN_BAK)
+    db.execute_insert_many("TEXTS", text_rows(5, "x"))
+    bak = Path(db.SASKAN_BAK)
+    data = bytearray(bak.read_bytes())
+    page_size = int.from_bytes(data[16:18], "big")
+    # Scribble over the last page, which holds TEXTS rows or their index
+    data[-page_size + 8:] = b"\xff" * (page_size - 8)
+    bak.write_bytes(bytes(data))
+    with pytest.raises(sq3.DatabaseError):
+        db.restore_db(db.SASKAN_BAK)
+    assert len(text_ids(db)) == 505
+    assert not Path(f"{db.SASKAN_DB}.new").exists()
+
+
+def test_load_snapshot_backs_up_current_db(db):
+    assert db.save_snapshot()
+    assert db.execute_insert_many("TEXTS", text_rows(8)) == []
+    assert db.load_snapshot()
+    assert text_ids(db) == set()
+    conn = sq3.connect(db.SASKAN_BAK)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM TEXTS").fetchone()[0] == 8
+    finally:
+        conn.close()
@@ -0,0 +1,42 @@
+"""
+
+:module:    test_data_base_bulk.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for chunked bulk writes: execute_insert_many and its SAVEPOINTs.
+"""
+
+
+def text_rows(p_cnt: int, p_prefix: str = "t"):
+    return ((f"{p_prefix}{ix}", "en", f"id_{p_prefix}{ix}", f"value {ix}", "")
+            for ix in range(p_cnt))
+
+
+def count(p_db, p_tbl_nm: str) -> int:
+    p_db.connect_db(p_db.SASKAN_DB, p_read_only=True)
+    try:
+        return p_db.cur.execute(f"SELECT COUNT(*) FROM {p_tbl_nm}").fetchone()[0]
+    finally:
+        p_db.disconnect_db()
+
+
+def test_insert_many_from_generator(db):
+    assert db.execute_insert_many("TEXTS", text_rows(1234), 100) == []
+    assert count(db, "TEXTS") == 1234
+
+
+def test_failed_chunk_rolls_back_only_itself(db):
+    rows = list(text_rows(10))
+    rows[4] = rows[0]  # duplicate PK in the second chunk (rows 3-5)
+    errors = db.execute_insert_many("TEXTS", rows, 3)
+    assert len(errors) == 1
+    assert (errors[0]["chunk"], errors[0]["first_row"], errors[0]["row_cnt"]) == (1, 3, 3)
+    assert "UNIQUE" in errors[0]["error"]
+    # Chunks 0, 2 and 3 (3 + 3 + 1 rows) were committed
+    assert count(db, "TEXTS") == 7
+
+
+def test_check_constraint_error_is_reported(db):
+    errors = db.execute_insert_many("TEXTS", [("x1", "zz", "id_x", "bad lang", "")])
+    assert len(errors) == 1 and "CHECK" in errors[0]["error"]
+    assert count(db, "TEXTS") == 0
@@ -0,0 +1,59 @@
+"""
+
+:module:    test_data_base_pool.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for pooled connections and sessions in DataBase.
+"""
+
+import pytest
+
+
+def test_connection_is_reused(db):
+    db.connect_db(db.SASKAN_DB)
+    first = db.db_conn
+    db.disconnect_db()
+    db.connect_db(db.SASKAN_DB)
+    assert db.db_conn is first
+    db.disconnect_db()
+
+
+def test_close_pool_drops_idle_connections(db):
+    db.connect_db(db.SASKAN_DB)
+    first = db.db_conn
+    db.disconnect_db()
+    db.close_pool()
+    db.connect_db(db.SASKAN_DB)
+    assert db.db_conn is not first
+    db.disconnect_db()
+
+
+def test_close_pool_closes_checked_out_connection_on_release(db):
+    db.connect_db(db.SASKAN_DB)
+    held = db.db_conn
+    db.close_pool()
+    db.disconnect_db()
+    db.connect_db(db.SASKAN_DB)
+    assert db.db_conn is not held
+    db.disconnect_db()
+
+
+def test_session_reuses_one_connection(db):
+    with db.session():
+        db.connect_db(db.SASKAN_DB)
+        held = db.db_conn
+        db.disconnect_db()
+        assert db.db_conn is held
+    assert db.db_conn is None
+
+
+def test_session_refuses_other_db(db, tmp_path):
+    with db.session():
+        held = db.db_conn
+        with pytest.raises(RuntimeError):
+            db.connect_db(str(tmp_path / "OTHER.db"))
+        assert db.db_conn is held
+    # The session's connection went back to the pool, not leaked
+    db.connect_db(db.SASKAN_DB)
+    assert db.db_conn is held
+    db.disconnect_db()
@@ -0,0 +1,43 @@
+"""
+
+:module:    test_data_base_select_in.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for execute_select_in: chunked IN lookups on one or two columns.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def texts(db):
+    rows = [(f"t{ix}", "en", f"id{ix}", f"value {ix}", "") for ix in range(2500)]
+    assert db.execute_insert_many("TEXTS", rows) == []
+    return db
+
+
+def test_one_column_key_beyond_999_params(texts):
+    keys = [f"id{ix}" for ix in range(0, 2500, 2)] + ["missing"]
+    rows = texts.execute_select_in("TEXTS", ["text_id"], keys, 5000)
+    assert len(rows) == 1250
+    assert rows[("id1234",)]["text_value"] == "value 1234"
+    assert ("missing",) not in rows
+
+
+def test_composite_key_beyond_999_params(texts):
+    keys = [("en", f"id{ix}") for ix in range(2500)]
+    rows = texts.execute_select_in("TEXTS", ["lang_code", "text_id"], keys)
+    assert len(rows) == 2500
+    assert rows[("en", "id2499")]["text_uid_pk"] == "t2499"
+
+
+def test_duplicate_keys_and_deleted_rows(texts):
+    assert texts.execute_upsert("TEXTS", ("new0", "en", "id0", "newer", ""))
+    rows = texts.execute_select_in("TEXTS", ["text_id"], ["id0", "id0", ("id0",)], 1)
+    assert list(rows) == [("id0",)]
+    assert rows[("id0",)]["text_value"] == "newer"
+
+
+def test_bad_column_raises(texts):
+    with pytest.raises(ValueError):
+        texts.execute_select_in("TEXTS", ["no_such_col"], ["x"])
@@ -0,0 +1,64 @@
+"""
+
+:module:    test_data_base_upsert.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for the versioned upsert: VDELETE by natural key, then INSERT.
+"""
+
+import pytest
+
+
+def text_rows(p_db) -> list:
+    p_db.connect_db(p_db.SASKAN_DB, p_read_only=True)
+    try:
+        return p_db.cur.execute(
+            "SELECT text_uid_pk, text_id, text_value, delete_dt FROM TEXTS " +
+            "ORDER BY text_uid_pk").fetchall()
+    finally:
+        p_db.disconnect_db()
+
+
+def test_first_upsert_inserts_live_row(db):
+    assert db.execute_upsert("TEXTS", ("t1", "en", "hello", "Hello", ""))
+    assert text_rows(db) == [("t1", "hello", "Hello", "")]
+
+
+def test_upsert_supersedes_live_row_by_natural_key(db):
+    db.execute_upsert("TEXTS", ("t1", "en", "hello", "Hello", ""))
+    db.execute_upsert("TEXTS", ("t2", "en", "hello", "Howdy", ""))
+    old, new = text_rows(db)
+    assert old[:3] == ("t1", "hello", "Hello") and old[3] != ""
+    assert new == ("t2", "hello", "Howdy", "")
+    live = db.execute_select_all_clean("TEXTS")
+    assert live["text_value"] == ["Howdy"]
+
+
+def test_upsert_leaves_other_keys_alone(db):
+    db.execute_upsert_many("TEXTS", [("t1", "en", "hello", "Hello", ""),
+                                     ("t2", "en", "bye", "Bye", "")])
+    db.execute_upsert("TEXTS", ("t3", "en", "hello", "Howdy", ""))
+    live = {row[1]: row[2] for row in text_rows(db) if row[3] == ""}
+    assert live == {"hello": "Howdy", "bye": "Bye"}
+
+
+def test_later_row_in_batch_wins(db):
+    errors = db.execute_upsert_many("TEXTS", [("t1", "en", "hello", "One", ""),
+                                              ("t2", "en", "hello", "Two", ""),
+                                              ("t3", "en", "hello", "Three", "")])
+    assert errors == []
+    assert [row[2] for row in text_rows(db) if row[3] == ""] == ["Three"]
+    assert len(text_rows(db)) == 3
+
+
+def test_deleted_history_is_not_superseded_again(db):
+    db.execute_upsert("TEXTS", ("t1", "en", "hello", "One", ""))
+    db.execute_upsert("TEXTS", ("t2", "en", "hello", "Two", ""))
+    first_delete_dt = text_rows(db)[0][3]
+    db.execute_upsert("TEXTS", ("t3", "en", "hello", "Three", ""))
+    assert text_rows(db)[0][3] == first_delete_dt
+
+
+def test_upsert_needs_natural_key(db):
+    with pytest.raises(ValueError):
+        db.execute_upsert_many("BACKUP", [("b1", "id", "dttm", "backup", "a", "b", "")])
@@ -0,0 +1,43 @@
+"""
+
+:module:    test_data_base_write_lock.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests that concurrent writers, e.g. parallel boot stages, take turns on
+the DB's write lock instead of failing with "database is locked".
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import data_model as DM
+import pytest
+from data_base import DataBase
+
+
+@pytest.fixture
+def impatient_db(context):
+    """DataBase that gives up at once if another connection holds the write lock."""
+    context["db_pragmas"] = dict(context["db_pragmas"], busy_timeout=0)
+    DB = DataBase(context)
+    assert DM.create_db(DB, p_backup=False)
+    yield DB
+    DB.close_pool()
+
+
+def slow_rows(p_prefix: str, p_cnt: int):
+    for ix in range(p_cnt):
+        if ix % 10 == 0:
+            time.sleep(0.001)
+        yield (f"{p_prefix}{ix}", "en", f"id_{p_prefix}{ix}", f"value {ix}", "")
+
+
+def test_parallel_writers_do_not_collide(context, impatient_db):
+    def load(p_prefix: str) -> list:
+        return DataBase(context).execute_insert_many(
+            "TEXTS", slow_rows(p_prefix, 200), 20)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(load, "abcdef"))
+    assert results == [[]] * 6
+    assert len(impatient_db.execute_select_all("TEXTS")["text_uid_pk"]) == 1200
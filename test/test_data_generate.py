@@ -0,0 +1,67 @@
+"""
+
+:module:    test_data_generate.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for the seeded world generator, on a small 10x10 grid.
+"""
+
+import data_model as DM
+from data_base import DataBase
+from data_generate import GenerateWorld
+
+TINY = {"p_star_systems": 3, "p_worlds": 2, "p_moons": 2, "p_grid_x": 10,
+        "p_grid_y": 10, "p_grid_z": 1, "p_towns": 5, "p_lakes": 3, "p_rivers": 3,
+        "p_ocean_bodies": 2, "p_land_bodies": 2, "p_dialects": 2, "p_glosses": 10}
+
+
+def generate(p_context: dict, p_seed: int = 7) -> GenerateWorld:
+    GW = GenerateWorld(p_seed=p_seed, p_context=p_context, **TINY)
+    GW.generate()
+    return GW
+
+
+def select(p_db, p_sql: str) -> list:
+    p_db.connect_db(p_db.SASKAN_DB, p_read_only=True)
+    try:
+        return p_db.cur.execute(p_sql).fetchall()
+    finally:
+        p_db.disconnect_db()
+
+
+def test_row_counts(db, context):
+    GW = generate(context)
+    assert GW.row_counts["GRID_CELL"] == 100
+    assert GW.row_counts["GRID_INFO"] == 5
+    # Each feature is linked to the map and to a grid cell
+    assert GW.row_counts["CROSS_X"] == 2 * (3 + 3 + 2 + 2)
+    for tbl_nm, cnt in GW.row_counts.items():
+        assert select(db, f"SELECT COUNT(*) FROM {tbl_nm}") == [(cnt,)], tbl_nm
+
+
+def test_grid_cell_columns(db, context):
+    generate(context)
+    rows = select(db, "SELECT grid_id, x_col_ix, y_row_ix, z_up_down_ix, grid_cell_id, " +
+                      "grid_cell_name FROM GRID_CELL WHERE x_col_ix = 3 AND y_row_ix = 4")
+    assert rows == [("gen_7_10x_10y_1z", 3, 4, 0, "3x_4y_0z", "Cell 3.4.0")]
+
+
+def test_same_seed_gives_same_uids(db, context, tmp_path):
+    GW = generate(context)
+    other = dict(context, saskan_db=str(tmp_path / "OTHER.db"),
+                 saskan_bak=str(tmp_path / "OTHER.bak"))
+    other_db = DataBase(other)
+    assert DM.create_db(other_db, p_backup=False)
+    try:
+        generate(other)
+        for tbl_nm in GW.row_counts:
+            sql = f"SELECT * FROM {tbl_nm} ORDER BY 1"
+            assert select(db, sql) == select(other_db, sql), tbl_nm
+    finally:
+        other_db.close_pool()
+
+
+def test_generated_tables_pass_foreign_key_check(db, context):
+    GW = generate(context)
+    for tbl_nm in GW.row_counts:
+        assert select(db, f"PRAGMA foreign_key_check({tbl_nm})") == [], tbl_nm
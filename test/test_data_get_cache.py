@@ -0,0 +1,57 @@
+"""
+
+:module:    test_data_get_cache.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for the GetData read-through cache and its invalidation on write.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def gd(db):
+    from data_get import GetData
+
+    GD = GetData()
+    GD.DB = db
+    GD.invalidate_cache()
+    # The change listener is a weak reference, dropped along with GD.
+    return GD
+
+
+def add_text(p_db, p_uid: str, p_text_id: str, p_value: str):
+    assert p_db.execute_insert_many("TEXTS", [(p_uid, "en", p_text_id, p_value, "")]) == []
+
+
+def test_hit_after_miss(gd, db):
+    add_text(db, "t1", "hello", "Hello")
+    assert gd.get_by_match("TEXTS", {"lang_code": "en", "text_id": "hello"})["text_value"] == "Hello"
+    assert gd.get_by_match("TEXTS", {"lang_code": "en", "text_id": "hello"})["text_value"] == "Hello"
+    stats = gd.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_write_invalidates_table(gd, db):
+    add_text(db, "t1", "hello", "Hello")
+    gd.get_by_match("TEXTS", {"lang_code": "en", "text_id": "hello"})
+    db.execute_update("TEXTS", "t1", ("en", "hello", "Howdy", ""))
+    assert gd.cache_stats()["size"] == 0
+    assert gd.get_by_match("TEXTS", {"lang_code": "en", "text_id": "hello"})["text_value"] == "Howdy"
+
+
+def test_write_during_read_is_not_cached(gd, db, monkeypatch):
+    add_text(db, "t1", "hello", "Hello")
+    read = db.execute_select_by_match
+
+    def read_then_write(*args):
+        # The read finishes, then another writer commits before the cache put.
+        data = read(*args)
+        add_text(db, "t2", "bye", "Bye")
+        return data
+
+    monkeypatch.setattr(db, "execute_select_by_match", read_then_write)
+    gd.get_by_match("TEXTS", {"text_id": "bye"}, p_first_only=False)
+    assert gd.cache_stats()["size"] == 0
+    monkeypatch.setattr(db, "execute_select_by_match", read)
+    assert len(gd.get_by_match("TEXTS", {"text_id": "bye"}, p_first_only=False)) == 1
@@ -0,0 +1,95 @@
+"""
+
+:module:    test_data_migrate.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for MigrateDB: planning, ALTER TABLE ADD COLUMN and table copies.
+The live TEXTS table is rebuilt as an older or newer version of itself,
+then migrated back to the current model.
+"""
+
+import sqlite3 as sq3
+import threading
+
+import pytest
+from data_migrate import MigrateDB
+
+
+@pytest.fixture
+def mg(db):
+    return MigrateDB(db)
+
+
+def rebuild_texts(p_db, p_mg, p_drop: str = "", p_extra: str = "", p_rows: list = ()):
+    """Re-create TEXTS with one column dropped and/or one added at the end."""
+    # Pooled handles would keep the old schema cached; edit behind them
+    p_db.close_pool()
+    conn = sq3.connect(p_db.SASKAN_DB)
+    try:
+        create = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'TEXTS'").fetchone()[0]
+        cols, cons = p_mg._split_defs(create)
+        defs = [col_def for col, col_def in cols if col != p_drop]
+        defs += [p_extra] if p_extra else []
+        conn.execute("DROP TABLE TEXTS;")
+        conn.execute(f"CREATE TABLE TEXTS ({', '.join(defs + cons)});")
+        names = [col for col, _ in cols if col != p_drop]
+        names += [p_extra.split()[0]] if p_extra else []
+        conn.executemany(
+            f"INSERT INTO TEXTS ({', '.join(names)}) VALUES " +
+            f"({', '.join('?' for _ in names)});", p_rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def live_texts(p_db) -> list:
+    conn = sq3.connect(p_db.SASKAN_DB)
+    try:
+        return conn.execute(
+            "SELECT text_uid_pk, text_id, text_value FROM TEXTS ORDER BY 1").fetchall()
+    finally:
+        conn.close()
+
+
+def test_new_db_needs_no_migration(mg):
+    assert mg.plan() == []
+
+
+def test_added_column_uses_alter_table(db, mg):
+    rebuild_texts(db, mg, p_drop="text_value",
+                  p_rows=[("t1", "en", "one", ""), ("t2", "en", "two", "")])
+    steps = mg.plan()
+    assert [(s["table"], s["action"]) for s in steps] == [("TEXTS", "add_columns")]
+    assert steps[0]["detail"] == "added text_value"
+    mg.migrate(steps)
+    assert [row[:2] for row in live_texts(db)] == [("t1", "one"), ("t2", "two")]
+    # text_value now sits after delete_dt; that is not a change to migrate
+    assert mg.plan() == []
+    assert db.get_user_version() == db.schema_user_version
+
+
+def test_dropped_column_copies_table_and_keeps_rows(db, mg):
+    rows = [(f"t{ix}", "en", f"id{ix}", f"value {ix}", "", f"note {ix}")
+            for ix in range(25)]
+    rebuild_texts(db, mg, p_extra="legacy_note TEXT", p_rows=rows)
+    steps = mg.plan()
+    assert [(s["table"], s["action"]) for s in steps] == [("TEXTS", "copy_table")]
+    assert "dropped legacy_note" in steps[0]["detail"]
+    mg.migrate(steps)
+    assert live_texts(db) == sorted((row[0], row[2], row[3]) for row in rows)
+    assert mg.plan() == []
+    assert [m["col_def"].split(" ", 1)[1] for m in mg.get_migrations()] == \
+        ["copy_table: re-created, dropped legacy_note"]
+
+
+def test_migration_waits_for_the_write_lock(db, mg):
+    rebuild_texts(db, mg, p_drop="text_value", p_rows=[("t1", "en", "one", "")])
+    done = threading.Event()
+    with db._write_lock():
+        worker = threading.Thread(target=lambda: (mg.migrate(), done.set()))
+        worker.start()
+        assert not done.wait(0.2)
+    worker.join(5)
+    assert done.is_set()
+    assert mg.plan() == []
@@ -0,0 +1,105 @@
+"""
+
+:module:    test_rpt_wiretap.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for SegmentLog: record round trips, views, rollover and expiry.
+"""
+
+import struct
+
+import pytest
+from rpt_wiretap import SegmentLog
+
+DAY = 86400 * 10**6
+T0 = 1_700_000_000 * 10**6
+
+
+@pytest.fixture
+def seg_log(tmp_path):
+    return SegmentLog(str(tmp_path / "log"), p_max_bytes=2048, p_keep_days=1)
+
+
+def fill(p_log: SegmentLog, p_cnt: int, p_ts: int = T0):
+    for ix in range(p_cnt):
+        p_log.append(f"log~{ix:04d}", f"message {ix}", (ix % 5 + 1) * 10,
+                     p_ts + ix, f"logger{ix % 2}")
+
+
+def test_round_trip_across_segments(seg_log):
+    fill(seg_log, 100)
+    assert len(seg_log.segments()) > 1
+    records = list(seg_log.iter_records())
+    assert records == [(f"log~{ix:04d}", f"message {ix}") for ix in range(100)]
+
+
+def test_view_fields_and_filters(seg_log):
+    fill(seg_log, 20)
+    views = [(v.key, v.ts, v.level, v.logger_id) for v in seg_log.iter_views(
+        p_levels=[40, 50], p_since=T0 + 5, p_until=T0 + 15, p_logger="logger1")]
+    assert views == [(f"log~{ix:04d}", T0 + ix, (ix % 5 + 1) * 10,
+                      SegmentLog.logger_id("logger1"))
+                     for ix in range(5, 15) if ix % 5 >= 3 and ix % 2]
+    assert [key for key, _ in seg_log.iter_records("~001", p_with_msg=False)] == \
+        [f"log~{ix:04d}" for ix in range(10, 20)]
+
+
+def test_large_body_is_compressed(seg_log):
+    msg = "all work and no play " * 100
+    seg_log.append("log~big", msg, 20, T0, "big")
+    views = seg_log.iter_views()
+    view = next(views)
+    assert view.header[3] & SegmentLog.COMPRESSED
+    assert len(view.body) < len(msg)
+    assert view.payload() == {"msg": msg, "logger": "big"}
+
+
+def test_body_outlives_its_iteration(seg_log):
+    fill(seg_log, 3)
+    views = seg_log.iter_views()
+    view = next(views)
+    body = view.body
+    views.close()
+    assert isinstance(body, bytes)
+    assert SegmentLog.decode_body(0, body)["msg"] == "message 0"
+
+
+def test_expiry_keeps_newest_segment(seg_log):
+    fill(seg_log, 60, T0)
+    old_segs = seg_log.segments()
+    assert len(old_segs) > 1
+    fill(seg_log, 60, T0 + 3 * DAY)
+    # Rolling over expired all but the segment that was still active
+    assert old_segs[0] not in seg_log.segments()
+    assert old_segs[-1] in seg_log.segments()
+    seg_log.expire(T0 + 30 * DAY)
+    assert len(seg_log.segments()) == 1
+    assert all(view.ts >= T0 + 3 * DAY for view in seg_log.iter_views())
+    assert len(list(seg_log.ns_dir.glob("*.idx"))) == 1
+
+
+def test_old_layout_segment_is_skipped(seg_log):
+    """A segment in the header-less <IH record layout is neither read nor appended to."""
+    seg_log.ns_dir.mkdir(parents=True)
+    old = seg_log.ns_dir / f"seg_{T0:020d}.log"
+    key, body = b"log~old", b'{"msg":"old","logger":""}'
+    record = struct.pack("<IH", len(key) + len(body), len(key)) + key + body
+    old.write_bytes(record)
+    old.with_suffix(".idx").write_bytes(SegmentLog.IDX.pack(T0, 20, 0, len(record)))
+    assert list(seg_log.iter_records()) == []
+    seg_log.append("log~new", "new", 20, T0 + 1)
+    assert len(seg_log.segments()) == 2
+    assert old.read_bytes() == record
+    assert list(seg_log.iter_records()) == [("log~new", "new")]
+
+
+def test_wiretap_reads_records_by_key(tmp_path):
+    from rpt_wiretap import WireTap
+
+    ns = str(tmp_path / "wt")
+    seg_log = SegmentLog(ns)
+    seg_log.append("log~ERROR~a", "bad", 40, T0)
+    seg_log.append("log~INFO~b", "fine", 20, T0 + 1)
+    assert WireTap.count_keys(ns, "log~ERROR") == 1
+    assert WireTap.find_keys(ns, "log~") == [f"{ns}/log~ERROR~a", f"{ns}/log~INFO~b"]
+    assert WireTap.get_records(ns, "log~INFO") == [(f"{ns}/log~INFO~b", "INFO~fine")]
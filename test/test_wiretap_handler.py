@@ -0,0 +1,109 @@
+"""
+
+:module:    test_wiretap_handler.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for SQLiteHandler's overflow policy when its queue is full.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+from wiretap import SQLiteHandler
+
+
+@pytest.fixture
+def stalled(context):
+    """
+    Handler with a 3-record queue whose listener is held inside its
+    first write until the test sets the gate.
+    """
+    context.update({"log_queue_size": 3, "log_batch_size": 1,
+                    "log_flush_secs": 0.05, "log_overflow": "drop_oldest"})
+    handler = SQLiteHandler(context)
+    gate = threading.Event()
+    written: list = []
+    emit_batch = handler.writer.emit_batch
+
+    def gated_emit_batch(p_records: list):
+        gate.wait()
+        written.extend(record.getMessage() for record in p_records)
+        emit_batch(p_records)
+
+    handler.writer.emit_batch = gated_emit_batch
+    handler.enqueue(record(handler, logging.INFO, "first"))
+    while handler.queue.qsize():
+        time.sleep(0.005)
+    yield handler, gate, written
+    gate.set()
+    handler.close()
+
+
+def record(p_handler, p_level: int, p_msg: str) -> logging.LogRecord:
+    return p_handler.prepare(logging.makeLogRecord({
+        "name": "test", "levelno": p_level, "levelname": logging.getLevelName(p_level),
+        "msg": p_msg}))
+
+
+def queued(p_handler) -> list:
+    return [rec.getMessage() for rec in list(p_handler.queue.queue)]
+
+
+def test_warnings_evict_oldest_info(stalled):
+    handler, gate, written = stalled
+    for level, msg in [(logging.INFO, "info1"), (logging.INFO, "info2"),
+                       (logging.WARNING, "warn1")]:
+        handler.enqueue(record(handler, level, msg))
+    handler.enqueue(record(handler, logging.ERROR, "error1"))
+    assert queued(handler) == ["info2", "warn1", "error1"]
+    handler.enqueue(record(handler, logging.INFO, "info3"))
+    assert queued(handler) == ["warn1", "error1", "info3"]
+    handler.enqueue(record(handler, logging.CRITICAL, "crit1"))
+    assert queued(handler) == ["warn1", "error1", "crit1"]
+    # Nothing below WARNING left to evict: the new INFO record goes
+    handler.enqueue(record(handler, logging.INFO, "info4"))
+    assert queued(handler) == ["warn1", "error1", "crit1"]
+    assert handler.dropped == 4
+
+
+def test_warning_blocks_until_room(stalled):
+    handler, gate, written = stalled
+    for msg in ("warn1", "warn2", "warn3"):
+        handler.enqueue(record(handler, logging.WARNING, msg))
+    late = threading.Thread(
+        target=handler.enqueue, args=(record(handler, logging.WARNING, "warn4"),))
+    late.start()
+    late.join(0.2)
+    assert late.is_alive()
+    gate.set()
+    late.join(5)
+    assert not late.is_alive()
+    handler.flush()
+    assert written[:5] == ["first", "warn1", "warn2", "warn3", "warn4"]
+    assert handler.dropped == 0
+
+
+@pytest.mark.parametrize("policy", ["drop_newest", "block"])
+def test_other_policies_drop_new_info_only(context, policy):
+    context.update({"log_queue_size": 2, "log_batch_size": 1,
+                    "log_flush_secs": 0.01, "log_overflow": policy})
+    handler = SQLiteHandler(context)
+    gate = threading.Event()
+    emit_batch = handler.writer.emit_batch
+    handler.writer.emit_batch = lambda p_records: (gate.wait(), emit_batch(p_records))
+    try:
+        handler.enqueue(record(handler, logging.INFO, "first"))
+        while handler.queue.qsize():
+            time.sleep(0.005)
+        handler.enqueue(record(handler, logging.INFO, "info1"))
+        handler.enqueue(record(handler, logging.INFO, "info2"))
+        handler.enqueue(record(handler, logging.INFO, "info3"))
+        assert queued(handler) == ["info1", "info2"]
+        handler.enqueue(record(handler, logging.WARNING, "warn1"))
+        assert queued(handler) == ["info2", "warn1"]
+        assert handler.dropped == 2
+    finally:
+        gate.set()
+        handler.close()
@@ -0,0 +1,76 @@
+"""
+
+:module:    test_wiretap_query.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for LogStore queries: cursor paging across partitions and filters.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from wiretap import LogStore
+
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+@pytest.fixture
+def store(context):
+    """Store holding 300 records in two partitions; every 3 share a log_dttm."""
+    context["log_fts"] = True
+    STORE = LogStore(context)
+    start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    rows = [(f"u{ix:04d}", (start + timedelta(seconds=ix // 3)).isoformat(
+                timespec="microseconds"), LEVELS[ix % 5], f"app.part{ix % 2}",
+             f"message {ix} " + ("timeout" if ix % 10 == 0 else "ok"), "None", "")
+            for ix in range(300)]
+    assert STORE.get_db().execute_insert_many("LOGS", rows[:150]) == []
+    STORE.PARTITION_BYTES = 1
+    assert STORE.get_db().execute_insert_many("LOGS", rows[150:]) == []
+    assert len(STORE.partitions()) == 2
+    STORE.rows = rows
+    yield STORE
+    STORE.clear()
+
+
+def all_pages(p_store, p_limit: int, **p_filters) -> list:
+    found, cursor = [], ""
+    while True:
+        rows, cursor = p_store.query(p_cursor=cursor, p_limit=p_limit, **p_filters)
+        found.extend(row.log_uid_pk for row in rows)
+        if not cursor:
+            return found
+
+
+def newest_first(p_rows: list) -> list:
+    return [row[0] for row in sorted(p_rows, key=lambda r: (r[1], r[0]), reverse=True)]
+
+
+@pytest.mark.parametrize("limit", [1, 7, 40, 300, 1000])
+def test_cursor_pages_cover_every_row_once(store, limit):
+    assert all_pages(store, limit) == newest_first(store.rows)
+
+
+def test_filters_page_too(store):
+    want = [row for row in store.rows
+            if row[2] in ("ERROR", "CRITICAL") and row[3] == "app.part1"]
+    assert all_pages(store, 9, p_levels="ERROR", p_logger="app") == \
+        newest_first([row for row in store.rows if row[2] in ("ERROR", "CRITICAL")])
+    assert all_pages(store, 9, p_levels=["ERROR", "CRITICAL"], p_logger="app.part1") == \
+        newest_first(want)
+    assert all_pages(store, 4, p_text="TIMEOUT") == \
+        newest_first([row for row in store.rows if "timeout" in row[4]])
+
+
+def test_time_range(store):
+    since, until = store.rows[30][1], store.rows[60][1]
+    assert all_pages(store, 8, p_since=since, p_until=until) == \
+        newest_first([row for row in store.rows if since <= row[1] < until])
+
+
+def test_counts_and_top_errors(store):
+    counts = store.count_by_level("day")
+    assert sorted((level, cnt) for _, level, cnt in counts) == \
+        sorted((level, 60) for level in LEVELS)
+    top = store.top_errors(p_limit=1)
+    assert top[0][1] == 120
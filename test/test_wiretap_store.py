@@ -0,0 +1,90 @@
+"""
+
+:module:    test_wiretap_store.py
+:author:    GM (genuinemerit @ pm.me)
+
+Tests for LogStore: partition rotation, retention and its pool entries.
+"""
+
+import shutil
+import sqlite3 as sq3
+from datetime import datetime, timezone
+from os import path
+
+import pytest
+from data_base import DataBase
+from wiretap import LogStore
+
+
+def log_rows(p_cnt: int, p_prefix: str = "r", p_level: str = "INFO"):
+    now = datetime.now(timezone.utc)
+    return [(f"{p_prefix}{ix:05d}", now.isoformat(timespec="microseconds"), p_level,
+             "test", f"message {p_prefix}{ix} " + "x" * 200, "None", "")
+            for ix in range(p_cnt)]
+
+
+def pool_paths() -> set:
+    return {db_nm for db_nm, _ in DataBase._pools}
+
+
+@pytest.fixture
+def store(context):
+    context.update({"log_partition_mb": 0.05, "log_keep_days": 14, "log_keep_mb": 512})
+    STORE = LogStore(context)
+    yield STORE
+    STORE.clear()
+
+
+def test_main_db_has_no_logs_table(db):
+    conn = sq3.connect(db.SASKAN_DB)
+    try:
+        assert conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'LOGS'").fetchall() == []
+    finally:
+        conn.close()
+
+
+def test_full_partition_rotates(store):
+    first = store.get_db()
+    assert first.execute_insert_many("LOGS", log_rows(400)) == []
+    first_path = store.active_path
+    second = store.get_db()
+    assert store.active_path != first_path
+    assert store.active_path.name.endswith("_01.db")
+    assert second.execute_insert_many("LOGS", log_rows(3, "s")) == []
+    assert len(store.partitions()) == 2
+    # The closed partition's pools were dropped, not just closed
+    assert path.abspath(first_path) not in pool_paths()
+
+
+def test_retention_drops_old_partitions_and_their_pools(store):
+    store.get_db().execute_insert_many("LOGS", log_rows(10))
+    old_parts = [store.LOG_DIR / f"LOGS_2000010{day}_00.db" for day in (1, 2)]
+    for old in old_parts:
+        shutil.copy(store.active_path, old)
+        store.get_partition_db(old).get_pool(str(old))
+    assert set(old_parts) <= set(store.partitions())
+    assert store.apply_retention() == old_parts
+    assert store.partitions() == [store.active_path]
+    assert not pool_paths() & {path.abspath(old) for old in old_parts}
+
+
+def test_size_retention_keeps_active_partition(store):
+    store.KEEP_BYTES = 1
+    store.get_db().execute_insert_many("LOGS", log_rows(10))
+    yesterday = datetime.fromtimestamp(
+        datetime.now(timezone.utc).timestamp() - 86400, timezone.utc).strftime("%Y%m%d")
+    recent = store.LOG_DIR / f"LOGS_{yesterday}_00.db"
+    shutil.copy(store.active_path, recent)
+    assert store.apply_retention() == [recent]
+    assert store.partitions() == [store.active_path]
+
+
+def test_clear_drops_everything(store):
+    store.get_db().execute_insert_many("LOGS", log_rows(5))
+    active = store.active_path
+    assert store.clear() == [active]
+    assert store.partitions() == []
+    assert path.abspath(active) not in pool_paths()
+    # The next write opens a fresh partition
+    assert store.get_db().execute_insert_many("LOGS", log_rows(1)) == []